@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: trend queries over a year of archived job sightings.
+
+Each simulated day re-sights the postings still open and adds new ones, as
+daily runs would; every day is one compacted Parquet file.
+
+Run with: python benchmarks/bench_archive.py [days] [new_per_day]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive import JobArchive
+from corpus import make_jobs
+
+DAY = 86400
+START = 1727740800.0  # 2024-10-01 00:00 UTC
+
+
+def fill(archive: JobArchive, days: int, new_per_day: int, seed: int = 17) -> int:
+    rng = random.Random(seed)
+    pool = make_jobs(days * new_per_day, seed=seed)
+    open_jobs = []
+    rows = 0
+    for day in range(days):
+        open_jobs = [j for j in open_jobs if rng.random() > 0.1]  # ~10 days up
+        open_jobs += pool[day * new_per_day : (day + 1) * new_per_day]
+        archive.append(open_jobs, seen_at=START + day * DAY + 9 * 3600)
+        archive.flush()
+        rows += len(open_jobs)
+    return rows
+
+
+def timed(label, fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<22}: {best * 1000:8.1f}ms")
+    return out
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    new_per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with tempfile.TemporaryDirectory() as d:
+        archive = JobArchive(d)
+        start = time.perf_counter()
+        rows = fill(archive, days, new_per_day)
+        t_fill = time.perf_counter() - start
+        size = sum(p.stat().st_size for p in Path(d).rglob("*.parquet"))
+        print(
+            f"archive: {days} days, {rows} sightings of {days * new_per_day} postings"
+            f"  | {size / 1e6:.1f} MB  | written in {t_fill:.1f}s"
+        )
+
+        timed("postings per week", archive.postings_per_week)
+        timed(
+            "salary distribution",
+            lambda: archive.salary_distribution(title_any=["engineer", "developer"]),
+        )
+        timed("time to fill", archive.time_to_fill)
+        timed("read 1 column", lambda: archive.read(["company"]))
+
+
+if __name__ == "__main__":
+    main()
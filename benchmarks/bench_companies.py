@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: company canonicalization and blacklist checks over tens of
+thousands of distinct company strings, vs the per-name linear substring scan
+the blacklist used to do.
+
+Run with: python benchmarks/bench_companies.py [distinct_names] [postings] [terms]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from companies import Blacklist, CompanyIndex
+
+SUFFIXES = ["", " Inc", ", Inc.", " LLC", " L.L.C.", " Corp", " Corporation", " Ltd"]
+
+
+def make_names(n: int, seed: int = 5):
+    """n distinct strings: a base name in several spellings and suffixes."""
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        kind = "Labs" if rng.random() < 0.05 else "Systems"  # Labs: some aliases
+        base = f"Acme {rng.randrange(n // 4)} {kind}"
+        spelling = rng.choice([str, str.lower, str.upper])
+        names.add(spelling(base) + rng.choice(SUFFIXES))
+    return sorted(names)
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}: {elapsed * 1000:8.1f}ms")
+    return out, elapsed
+
+
+def main():
+    distinct = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    postings = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    n_terms = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    rng = random.Random(11)
+    names = make_names(distinct)
+    rng.shuffle(names)
+    # Postings repeat some names often and most rarely, as scrapes do
+    stream = [
+        names[min(int(rng.expovariate(8 / distinct)), distinct - 1)]
+        for _ in range(postings)
+    ]
+    terms = {f"acme {rng.randrange(distinct // 4)} systems" for _ in range(n_terms)}
+    aliases = {
+        f"Acme {i} Systems": [f"Acme {i} Labs"] for i in range(0, distinct // 4, 7)
+    }
+    print(f"corpus: {distinct} distinct names, {postings} postings, {len(terms)} terms")
+
+    def linear():
+        return [any(t in name.lower() for t in terms) for name in stream]
+
+    index = CompanyIndex(aliases)
+    blacklist = Blacklist(terms, index)
+    expected, t_linear = timed("linear substring scan", linear)
+    _, t_cold = timed("keys, cold", lambda: [index.key(n) for n in names])
+    _, t_warm = timed("keys, memoized", lambda: [index.key(n) for n in stream])
+    verdicts, t_index = timed(
+        "blacklist (indexed)", lambda: [blacklist.blocked(n) for n in stream]
+    )
+    # The index only adds matches (suffix variants, aliases) to the scan's
+    assert all(v for v, e in zip(verdicts, expected) if e)
+    print(f"extra names blocked by key   : {sum(verdicts) - sum(expected)}")
+
+    rows = [{"rank": i + 1, "company": n} for i, n in enumerate(names[:500])]
+    ranks, _ = timed("leaderboard ranks", lambda: index.ranks(rows))
+    _, t_join = timed(
+        "join postings to ranks", lambda: [ranks.get(index.key(n)) for n in stream]
+    )
+    print(
+        f"speedup vs linear scan       : {t_linear / t_index:6.1f}x"
+        f"  | {t_warm / postings * 1e9:.0f}ns/memoized key"
+        f"  | {t_cold / distinct * 1e6:.1f}us/new name"
+        f"  | join {t_join / postings * 1e9:.0f}ns/posting"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DedupeIndex lookup cost as the index grows, against a linear
+Hamming scan, plus SimHash throughput.
+
+Run with: python benchmarks/bench_dedupe.py [max_size]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dedupe import DedupeIndex, _h64, simhash
+from models import Job
+
+WORDS = (
+    "team build services customers data scale reliable ownership design review "
+    "deploy testing collaborate product users systems performance growth remote "
+    "engineering experience years degree benefits equal opportunity employer "
+    "python java aws kubernetes backend frontend distributed platform"
+).split()
+PROBES = 2_000
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(11)
+
+    texts = [" ".join(rng.choices(WORDS, k=rng.randint(300, 700))) for _ in range(500)]
+    probes = [
+        Job(
+            title=f"Probe {i}",
+            company=f"Company {i % 500}",
+            location="Austin, TX",
+            url=f"https://example.com/probe/{i}",
+            source="indeed",
+            description=texts[i % len(texts)] + f" req {i}",
+        )
+        for i in range(PROBES)
+    ]
+    # Warm up (numpy import, token hash cache), then time what check() spends
+    # fingerprinting each probe, so the lookup times below are the index's own
+    probe_fps = [simhash(j.description) for j in probes]
+    start = time.perf_counter()
+    for job in probes:
+        simhash(job.description)
+    per = (time.perf_counter() - start) / PROBES
+    print(f"simhash: {per * 1e6:.0f} us/description")
+
+    index = DedupeIndex()
+    # check() minus hashing: each probe's URL/key/company hashes and fingerprint
+    signatures = []
+    for job, fp in zip(probes, probe_fps):
+        key = index._key(job)
+        signatures.append((*index._signature(job.url, key), _h64(key[0]), fp))
+    fingerprints = []
+    size = 0
+    print(f"{'indexed':>9} {'index lookup':>14} {'linear scan':>13}")
+    for target in (10_000, 50_000, 100_000, max_size):
+        if target > max_size:
+            continue
+        while size < target:
+            fp = rng.getrandbits(64)
+            index.add(
+                f"https://example.com/job/{size}",
+                f"Company {size % 500}",
+                fp,
+            )
+            fingerprints.append(fp)
+            size += 1
+
+        start = time.perf_counter()
+        for signature in signatures:
+            index._check(*signature)
+        lookup = (time.perf_counter() - start) / PROBES
+
+        start = time.perf_counter()
+        for fp in probe_fps[:20]:
+            any((fp ^ other).bit_count() <= 3 for other in fingerprints)
+        scan = (time.perf_counter() - start) / 20
+        print(f"{size:>9,} {lookup * 1e6:>11.1f} us {scan * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: column-wise _df_to_jobs vs the row-wise (iterrows) reference,
+then post-filtering vs predicate pushdown (time and peak memory).
+
+Run with: python benchmarks/bench_df_to_jobs.py [n_rows]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pyarrow as pa
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from corpus import make_frame
+from matching import Prefilter, compile_rules
+from providers.jobspy_search import (
+    _df_to_jobs,
+    _df_to_jobs_rowwise,
+    _str_column,
+)
+from targets import filter_job_companies, filter_jobs
+
+ROOT = Path(__file__).parent.parent
+
+
+def best_of(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return out, best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    df = make_frame(n)
+    rowwise, t_rowwise = best_of(_df_to_jobs_rowwise, df, "indeed")
+    columnar, t_columnar = best_of(_df_to_jobs, df, "indeed")
+    assert rowwise == columnar, "column-wise conversion disagrees with row-wise"
+
+    print(f"rows: {n}")
+    print(f"row-wise (iterrows): {t_rowwise * 1000:8.1f}ms")
+    print(f"column-wise        : {t_columnar * 1000:8.1f}ms")
+    print(f"speedup            : {t_rowwise / t_columnar:6.1f}x")
+
+    rules = compile_rules(yaml.safe_load((ROOT / "config/rules.yaml").read_text()))
+    blacklist = {"company 1"}
+
+    def post_filter():
+        return filter_jobs(
+            filter_job_companies(_df_to_jobs(df, "indeed"), blacklist), rules
+        )
+
+    def pushdown():
+        return filter_jobs(
+            _df_to_jobs(df, "indeed", Prefilter(rules, blacklist)), rules
+        )
+
+    print()
+    post, t_post = best_of(post_filter)
+    pushed, t_pushed = best_of(pushdown)
+    assert post == pushed, "pushdown changed the filtered result"
+    _, peak_post = peak_memory(post_filter)
+    _, peak_pushed = peak_memory(pushdown)
+    print(
+        f"convert + filter   : {t_post * 1000:8.1f}ms  peak {peak_post / 2**20:6.1f} MiB"
+    )
+    print(
+        f"pushdown + filter  : {t_pushed * 1000:8.1f}ms  peak {peak_pushed / 2**20:6.1f} MiB"
+    )
+    print(f"matched            : {len(pushed)} of {n} rows")
+
+    # The predicates alone: once per row in Python vs on whole Arrow columns
+    prefilter = Prefilter(rules, blacklist)
+    columns = [_str_column(df, name) for name in ("title", "company", "location")]
+
+    def per_row():
+        return [prefilter.keep(*row) for row in zip(*columns)]
+
+    def per_column():
+        arrays = [pa.array(col, pa.string()) for col in columns]
+        mask = prefilter.keep_column(*arrays)
+        return mask.to_numpy(zero_copy_only=False).tolist()
+
+    print()
+    row_mask, t_row = best_of(per_row)
+    column_mask, t_column = best_of(per_column)
+    assert row_mask == column_mask, "vectorized prefilter disagrees with keep()"
+    print(f"prefilter per row  : {t_row * 1000:8.1f}ms")
+    print(f"prefilter columns  : {t_column * 1000:8.1f}ms")
+    print(f"speedup            : {t_row / t_column:6.1f}x")
+    assert t_column < t_row, "vectorized prefilter is slower than the per-row path"
+
+
+def peak_memory(fn, *args):
+    tracemalloc.start()
+    try:
+        out = fn(*args)
+        return out, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
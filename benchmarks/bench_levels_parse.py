@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parse time per leaderboard page for each parser backend.
+
+Run with: python benchmarks/bench_levels_parse.py [rows_per_page]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from corpus import make_leaderboard_html
+from providers.levels_html import parse_leaderboard_table
+
+
+def per_page(html: str, repeat: int, **kwargs) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_leaderboard_table(html, **kwargs)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    html = make_leaderboard_html(n_rows)
+    print(f"page: {len(html) / 1024:.0f} KiB, {n_rows} rows")
+
+    expected = parse_leaderboard_table(html)
+    backends = [
+        ("html5lib", dict(parser="html5lib"), 3),
+        ("lxml", dict(parser="lxml"), 20),
+        ("lxml targeted", dict(parser="lxml", targeted=True), 50),
+    ]
+    baseline = None
+    for label, kwargs, repeat in backends:
+        assert parse_leaderboard_table(html, **kwargs) == expected, label
+        t = per_page(html, repeat, **kwargs)
+        baseline = baseline or t
+        print(f"{label:<14}: {t * 1000:8.2f} ms/page  ({baseline / t:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled rules (filter_jobs) vs the per-keyword helpers it replaced.
+
+Run with: python benchmarks/bench_matching.py [n_jobs]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from corpus import make_jobs
+from targets import (
+    matches_role_title,
+    matches_job_description,
+    matches_location,
+    filter_jobs,
+)
+
+ROOT = Path(__file__).parent.parent
+
+
+def legacy_filter_jobs(jobs, rules):
+    """filter_jobs as it was before rule compilation."""
+    t = rules.get("role_titles", {})
+    d = rules.get("job_descriptions", {})
+    loc = rules.get("locations", {})
+    return [
+        job
+        for job in jobs
+        if matches_role_title(job, t.get("include_any", []), t.get("exclude_any", []))
+        and matches_job_description(
+            job, d.get("include_any", []), d.get("exclude_any", [])
+        )
+        and matches_location(
+            job, loc.get("include_any", []), loc.get("exclude_any", [])
+        )
+    ]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rules = yaml.safe_load((ROOT / "config/rules.yaml").read_text())
+    # Compare like for like: the legacy helpers have no word-boundary mode
+    rules["locations"].pop("word_boundary", None)
+
+    jobs = make_jobs(n)
+    print(f"corpus: {len(jobs)} jobs")
+    run("config/rules.yaml", jobs, rules)
+
+    # Larger rule sets are where per-keyword scans fall over
+    big = yaml.safe_load(yaml.safe_dump(rules))
+    big["job_descriptions"]["exclude_any"] += [f"legacy-stack-{i}" for i in range(150)]
+    big["role_titles"]["exclude_any"] += [f"Level {i} Engineer" for i in range(50)]
+    run("rules.yaml + 200 exclude terms", jobs, big)
+
+
+def run(label, jobs, rules):
+    legacy, t_legacy = timed(legacy_filter_jobs, jobs, rules)
+    compiled, t_compiled = timed(filter_jobs, jobs, rules)
+    assert legacy == compiled, "compiled rules disagree with legacy helpers"
+
+    print(f"\n[{label}]")
+    print(f"legacy   : {t_legacy:7.3f}s  ({len(legacy)} matched)")
+    print(f"compiled : {t_compiled:7.3f}s  ({len(compiled)} matched)")
+    print(f"speedup  : {t_legacy / t_compiled:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory held by N Job objects, compact models vs the previous
+plain frozen dataclasses (per-instance __dict__, inline descriptions).
+
+Run with: python benchmarks/bench_models_memory.py [n_jobs]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import models
+from models import Job, SalaryRange
+
+WORDS = (
+    "team build services customers data scale reliable ownership design review "
+    "deploy testing collaborate product users systems performance growth remote "
+    "engineering experience years degree benefits equal opportunity employer "
+    "python java aws kubernetes backend frontend distributed platform"
+).split()
+COMPANIES = [f"Company {i}" for i in range(500)]
+LOCATIONS = ["Austin, TX", "Remote", "Round Rock, TX", "Dallas, TX", "Texas"]
+
+
+@dataclass(frozen=True)
+class LegacySalaryRange:
+    min: Optional[int] = None
+    max: Optional[int] = None
+    currency: str = "USD"
+    periodicity: str = "year"
+
+
+@dataclass(frozen=True)
+class LegacyJob:
+    title: str
+    company: str
+    location: str
+    url: str
+    source: str
+    listed_at: Optional[str] = None
+    salary: LegacySalaryRange = LegacySalaryRange()
+    description: Optional[str] = None
+    req_id: Optional[str] = None
+
+
+def make_records(n: int, seed: int = 7):
+    """Raw field values; every string is a fresh object, as after parsing JSON."""
+    rng = random.Random(seed)
+    paragraphs = [
+        " ".join(rng.choices(WORDS, k=rng.randint(300, 700))) for _ in range(200)
+    ]
+    return [
+        (
+            "Software Engineer",
+            "".join(rng.choice(COMPANIES)),
+            "".join(rng.choice(LOCATIONS)),
+            f"https://example.com/job/{i}",
+            "".join("indeed"),
+            "2025-10-01",
+            (120000 + i % 50 * 1000, 180000, "".join("USD"), "".join("year")),
+            # Copy so descriptions don't share storage between jobs
+            paragraphs[i % len(paragraphs)][:-1] + str(i % 10),
+        )
+        for i in range(n)
+    ]
+
+
+def build(records, job_cls, salary_cls):
+    return [
+        job_cls(
+            title=title,
+            company=company,
+            location=location,
+            url=url,
+            source=source,
+            listed_at=listed_at,
+            salary=salary_cls(*salary),
+            description=description,
+        )
+        for title, company, location, url, source, listed_at, salary, description in records
+    ]
+
+
+def measure(n, job_cls, salary_cls):
+    """Memory still held once the raw records are dropped."""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    records = make_records(n)
+    jobs = build(records, job_cls, salary_cls)
+    del records
+    held = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return jobs, held
+
+
+def build_time(n, job_cls, salary_cls):
+    """Construction time, measured untraced (tracemalloc inflates it)."""
+    records = make_records(n)
+    start = time.perf_counter()
+    build(records, job_cls, salary_cls)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Building {n:,} jobs")
+    legacy_jobs, legacy_bytes = measure(n, LegacyJob, LegacySalaryRange)
+    del legacy_jobs
+    jobs, compact_bytes = measure(n, Job, SalaryRange)
+    legacy_s = build_time(n, LegacyJob, LegacySalaryRange)
+    compact_s = build_time(n, Job, SalaryRange)
+
+    print(
+        f"  legacy dataclasses: {legacy_bytes / 2**20:8.1f} MiB  build {legacy_s:.2f}s"
+    )
+    print(
+        f"  compact models:     {compact_bytes / 2**20:8.1f} MiB  build {compact_s:.2f}s"
+    )
+    print(f"  reduction: {legacy_bytes / compact_bytes:.1f}x")
+
+    # Uncached: several jobs here share a description text
+    inflate = models._inflate.__wrapped__
+    start = time.perf_counter()
+    total = sum(len(inflate(models._packed_description(job))) for job in jobs)
+    elapsed = time.perf_counter() - start
+    print(
+        f"  description decompress: {elapsed / n * 1e6:.1f} us/job "
+        f"({total / n:,.0f} chars avg)"
+    )
+    # dedupe, the store and the matcher each read a batch's descriptions
+    batch = jobs[-100:]
+    start = time.perf_counter()
+    for _ in range(3):
+        for job in batch:
+            job.description
+    elapsed = time.perf_counter() - start
+    print(f"  3 reads per job, one batch: {elapsed / 300 * 1e6:.2f} us/read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: many-profile matching through ProfileIndex vs running
+filter_job_companies + filter_jobs once per profile.
+
+Run with: python benchmarks/bench_profiles.py [n_jobs] [n_profiles]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from corpus import LOCATIONS, TECH, TITLES, WORDS, company_name, make_jobs
+from profiles import Profile, ProfileIndex
+from targets import filter_job_companies, filter_jobs
+
+TITLE_WORDS = sorted({w for t in TITLES for w in t.split()} | set(TITLES))
+EXCLUDES = ["Senior", "Staff", "Principal", "III", "Manager", "Lead", "Intern"]
+PLACES = sorted({p.strip() for loc in LOCATIONS for p in loc.split(",")})
+# Rarer description terms, so profiles differ in more than a handful of words
+NICHE = [f"{w}-{t}" for w in WORDS[:20] for t in TECH]
+
+
+def make_profiles(n: int, seed: int = 13):
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(n):
+        rules = {
+            "role_titles": {
+                "include_any": rng.sample(TITLE_WORDS, rng.randint(1, 4)),
+                "exclude_any": rng.sample(EXCLUDES, rng.randint(0, 4)),
+            },
+            "job_descriptions": {
+                "include_any": rng.sample(TECH, rng.randint(1, 4))
+                + rng.sample(NICHE, rng.randint(0, 6)),
+                "exclude_any": rng.sample(NICHE, rng.randint(0, 3)),
+            },
+            "locations": {
+                "include_any": rng.sample(PLACES, rng.randint(1, 3)),
+                "exclude_any": [],
+                "word_boundary": rng.random() < 0.5,
+            },
+        }
+        blacklist = {company_name(rng.randrange(500)).lower() for _ in range(5)}
+        profiles.append(Profile(f"profile-{i}", rules, frozenset(blacklist)))
+    return profiles
+
+
+def naive(profiles, jobs):
+    return {
+        p.name: filter_jobs(filter_job_companies(jobs, p.blacklist), p.rules)
+        for p in profiles
+    }
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    n_profiles = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    jobs = make_jobs(n)
+    profiles = make_profiles(n_profiles)
+    print(f"corpus: {n} jobs, {n_profiles} profiles")
+
+    index, t_build = timed(ProfileIndex, profiles)
+    matched, t_index = timed(index.match_all, jobs)
+
+    # One pass per profile is too slow to run over the whole corpus; time it on
+    # a sample and scale up
+    sample = jobs[: min(n, 2_000)]
+    expected, t_naive = timed(naive, profiles, sample)
+    assert index.match_all(sample) == expected, "index disagrees with per-profile"
+    t_naive *= n / len(sample)
+
+    hits = sum(len(v) for v in matched.values())
+    print(f"per-profile passes: {t_naive:8.2f}s  (extrapolated from {len(sample)})")
+    print(f"profile index     : {t_index:8.2f}s  (+{t_build * 1000:.0f}ms build)")
+    print(f"speedup           : {t_naive / t_index:8.1f}x")
+    print(f"per job           : {t_index / n * 1e6:8.1f}µs  | matches: {hits}")
+
+
+if __name__ == "__main__":
+    main()
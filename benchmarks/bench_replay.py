@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: replaying recorded scrape results (memory-mapped Arrow IPC files)
+vs reading the same frames back from the pickle-based ScrapeCache.
+
+Run with: python benchmarks/bench_replay.py [n_queries] [rows_per_query]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from corpus import make_frame
+from providers.scrape_cache import ScrapeCache
+from providers.scrape_tape import ScrapeTape
+
+
+def timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    queries = [f"query {i}" for i in range(n)]
+    frames = [make_frame(rows, seed=i) for i in range(n)]
+    print(f"corpus: {n} queries x {rows} rows")
+
+    with tempfile.TemporaryDirectory() as d:
+        tape = ScrapeTape(str(Path(d) / "tape"), mode="record")
+        cache = ScrapeCache(str(Path(d) / "cache.db"))
+
+        def record():
+            for q, df in zip(queries, frames):
+                tape.save("indeed", q, "Austin, TX", 50, rows, df)
+
+        def fill_cache():
+            for q, df in zip(queries, frames):
+                cache.put(q, df)
+
+        _, t_record = timed(record)
+        _, t_fill = timed(fill_cache)
+        size = sum(p.stat().st_size for p in (Path(d) / "tape").glob("*.arrow"))
+
+        replay = ScrapeTape(str(Path(d) / "tape"), mode="replay")
+        loaded, t_replay = timed(
+            lambda: [replay.load("indeed", q, "Austin, TX", 50, rows) for q in queries]
+        )
+        cached, t_cache = timed(lambda: [cache.get(q) for q in queries])
+        cache.close()
+        assert sum(map(len, loaded)) == sum(map(len, cached)) == n * rows
+
+    print(f"record (arrow ipc) : {t_record:8.3f}s  | {size / 1e6:.1f} MB on disk")
+    print(f"cache put (pickle) : {t_fill:8.3f}s")
+    print(f"replay (mmap)      : {t_replay:8.3f}s  | {t_replay / n * 1e3:.2f}ms/query")
+    print(f"cache get (pickle) : {t_cache:8.3f}s  | {t_cache / n * 1e3:.2f}ms/query")
+
+
+if __name__ == "__main__":
+    main()
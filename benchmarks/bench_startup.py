@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start cost of `import main`, measured with python -X importtime
+in fresh interpreters. Fails (exit 1) if the best run exceeds the budget or a
+module that only scraping needs gets imported at startup.
+
+Run with: python benchmarks/bench_startup.py [--runs 7] [--max-ms 400]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+SRC = ROOT / "src"
+
+# Only the scraping path may import these
+FORBIDDEN = ("pandas", "numpy", "jobspy", "pyarrow")
+
+
+def import_times(module: str = "main"):
+    """(module -> cumulative µs) for one fresh `import module`, from -X importtime."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in out.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=400.0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    totals = [r["main"] / 1000 for r in runs]
+    best = runs[totals.index(min(totals))]
+    print(
+        f"import main: best {min(totals):.1f}ms  | median "
+        f"{statistics.median(totals):.1f}ms  ({args.runs} runs, budget {args.max_ms:.0f}ms)"
+    )
+    top_level = {n: us for n, us in best.items() if "." not in n and n != "main"}
+    print(f"slowest top-level imports (of {len(best)} modules):")
+    for name, us in sorted(top_level.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"  {us / 1000:8.1f}ms  {name}")
+
+    failed = False
+    loaded = [m for m in FORBIDDEN if m in best]
+    if loaded:
+        print(f"FAIL: imported at startup: {', '.join(loaded)}")
+        failed = True
+    if min(totals) > args.max_ms:
+        print(f"FAIL: {min(totals):.1f}ms is over the {args.max_ms:.0f}ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
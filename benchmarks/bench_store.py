@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JobStore add/unseen latency as the stored history grows.
+
+Run with: python benchmarks/bench_store.py [history_size]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Job
+from store import JobStore
+
+BATCH = 2_000
+
+
+def make_jobs(start: int, n: int):
+    return [
+        Job(
+            title="Software Engineer",
+            company=f"Company {i % 500}",
+            location="Austin, TX",
+            url=f"https://example.com/job/{i}",
+            source="indeed",
+            description="backend python aws " * 100,
+        )
+        for i in range(start, start + n)
+    ]
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp, JobStore(f"{tmp}/jobs.db") as store:
+        stored = 0
+        step = max(total // 4, BATCH)
+        while stored < total:
+            store.add(make_jobs(stored, step))
+            stored += step
+
+            # A run's batch: half already stored, half new
+            batch = make_jobs(stored - BATCH // 2, BATCH)
+            start = time.perf_counter()
+            new = store.unseen(batch)
+            t_unseen = time.perf_counter() - start
+            start = time.perf_counter()
+            store.add(batch)
+            t_add = time.perf_counter() - start
+            stored += BATCH // 2
+            print(
+                f"history={stored:>8}  unseen({BATCH})={t_unseen * 1000:6.1f}ms "
+                f"({len(new)} new)  add({BATCH})={t_add * 1000:6.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
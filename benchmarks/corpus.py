@@ -0,0 +1,154 @@
+"""
+Synthetic corpora for the benchmarks: Job lists with multi-KB descriptions,
+JobSpy-shaped DataFrames and Levels.fyi leaderboard pages. Everything is
+seeded, so a given (n, seed) always produces the same corpus.
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from models import Job, SalaryRange  # noqa: E402
+
+WORDS = (
+    "team build services customers data scale reliable ownership design review "
+    "deploy testing collaborate product users systems performance growth remote "
+    "engineering experience years degree benefits equal opportunity employer "
+    "platform distributed latency availability mentor roadmap stakeholders "
+    "ship iterate observability incident security compliance pipeline"
+).split()
+TECH = ["python", "java", "aws", "react", "docker", "kubernetes", "go", "ios"]
+TITLES = [
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Backend Engineer",
+    "Software Engineer III",
+    "Data Analyst",
+    "Staff Engineer",
+    "Software Developer",
+    "Frontend Developer",
+    "Product Manager",
+]
+LOCATIONS = [
+    "Austin, TX",
+    "Remote",
+    "Round Rock, Texas",
+    "Seattle, WA",
+    "New York, NY",
+    "Austin, Texas, United States",
+]
+COMPANY_COUNT = 500
+
+
+def company_name(i: int) -> str:
+    return f"Company {i % COMPANY_COUNT}"
+
+
+def make_description(rng: random.Random, words: int = 450) -> str:
+    """~3 KB of posting text with a couple of tech keywords mixed in."""
+    tokens = rng.choices(WORDS, k=words) + rng.choices(TECH, k=2)
+    rng.shuffle(tokens)
+    return " ".join(tokens)
+
+
+def make_jobs(n: int, seed: int = 7, dup_rate: float = 0.0) -> List[Job]:
+    """
+    n jobs; with dup_rate > 0 that fraction re-uses the URL of an earlier job
+    (the same posting returned by several queries).
+    """
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        url_id = rng.randrange(i) if i and rng.random() < dup_rate else i
+        salary = rng.choice([None, rng.randint(60, 250) * 1000])
+        jobs.append(
+            Job(
+                title=rng.choice(TITLES),
+                company=company_name(rng.randrange(COMPANY_COUNT)),
+                location=rng.choice(LOCATIONS),
+                url=f"https://example.com/job/{url_id}",
+                source="indeed",
+                listed_at="2025-10-01",
+                salary=SalaryRange(salary, salary and salary + 40000),
+                description=make_description(rng),
+            )
+        )
+    return jobs
+
+
+def make_frame(n: int, seed: int = 11):
+    """A DataFrame shaped like scrape_jobs output, with the usual mess."""
+    import numpy as np
+    import pandas as pd
+
+    rng = random.Random(seed)
+    salary = [rng.choice([np.nan, rng.randint(60, 250) * 1000.0]) for _ in range(n)]
+    return pd.DataFrame(
+        {
+            "title": [
+                rng.choice(TITLES) + rng.choice(["", " ", "  "]) for _ in range(n)
+            ],
+            "company": [company_name(rng.randrange(COMPANY_COUNT)) for _ in range(n)],
+            "location": [rng.choice(LOCATIONS) for _ in range(n)],
+            "job_url": [f"https://example.com/job/{i}" for i in range(n)],
+            "date_posted": ["2025-10-01"] * n,
+            "salary_min": salary,
+            "salary_max": [s + 40000 for s in salary],
+            "salary_currency": ["USD"] * n,
+            "salary_period": ["year"] * n,
+            "description": [make_description(rng) for _ in range(n)],
+        }
+    )
+
+
+def make_blacklist(n: int = 40, seed: int = 3) -> set:
+    rng = random.Random(seed)
+    return {company_name(rng.randrange(COMPANY_COUNT)).lower() for _ in range(n)}
+
+
+LEADERBOARD_ROW = """
+<tr>
+  <td class="rank-column">{rank}</td>
+  <td class="company-data-column"><a href="/companies/c{rank}"><img src="/l.png"> <strong>{company}</strong></a>
+      <span class="text-muted">Austin, TX</span></td>
+  <td class="d-none d-sm-table-cell">{level}</td>
+  <td><div class="total-comp-number">${total:,}</div>
+      <div class="base-stock-bonus">${base:,} | ${stock:,} | ${bonus:,}</div>
+      <input class="d-none total-comp" value="{total}"><input class="d-none base-salary" value="{base}">
+      <input class="d-none stock-grant" value="{stock}"><input class="d-none yearly-bonus" value="{bonus}"></td>
+</tr>"""
+
+
+def make_leaderboard_html(n_rows: int, seed: int = 5) -> str:
+    """A leaderboard page shaped like the real one: big inline JSON, nav, then the table."""
+    rng = random.Random(seed)
+    rows = []
+    for rank in range(1, n_rows + 1):
+        base = rng.randint(120, 220) * 1000
+        stock = rng.randint(0, 150) * 1000
+        bonus = rng.randint(0, 40) * 1000
+        rows.append(
+            LEADERBOARD_ROW.format(
+                rank=rank,
+                company=company_name(rank),
+                level=rng.choice(["L3", "L4", "E4", "SDE II"]),
+                total=base + stock + bonus,
+                base=base,
+                stock=stock,
+                bonus=bonus,
+            )
+        )
+    payload = json.dumps({"rows": [{"id": i, "blob": "x" * 200} for i in range(2000)]})
+    nav = "".join(f'<li><a href="/l/{i}">Link {i}</a></li>' for i in range(500))
+    return (
+        f"<!DOCTYPE html><html><head><script>window.__DATA__={payload}</script></head>"
+        f'<body><nav><ul>{nav}</ul></nav><div id="tableContainer"><table><thead><tr>'
+        f"<th>#</th><th>Company</th><th>Level</th><th>Total</th></tr></thead><tbody>"
+        f"{''.join(rows)}</tbody></table></div><footer>{nav}</footer></body></html>"
+    )
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: times the hot paths on synthetic corpora at several sizes,
+writes the results as JSON and flags regressions against a baseline run.
+
+Run with: python benchmarks/suite.py [--sizes 1000,10000] [--baseline FILE]
+
+    make bench-baseline   # record benchmarks/results/baseline.json
+    make bench            # run again and compare; exits 1 on a regression
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+from corpus import ROOT, make_blacklist, make_frame, make_jobs, make_leaderboard_html
+from matching import compile_rules
+from providers.jobspy_search import _df_to_jobs
+from providers.levels_html import parse_leaderboard_table
+from targets import (
+    deduplicate_jobs,
+    filter_companies,
+    filter_job_companies,
+    filter_jobs,
+    filter_rows,
+)
+
+RESULTS = ROOT / "benchmarks" / "results"
+SIZES = (1_000, 10_000, 100_000)
+# A case must be this much slower than its baseline, and by more than the
+# noise floor, to count as a regression
+THRESHOLD = 1.25
+NOISE_FLOOR = 0.001
+
+
+def cases(n: int):
+    """(name, fn) pairs for corpus size n; corpora are built once per size."""
+    rules = compile_rules(yaml.safe_load((ROOT / "config/rules.yaml").read_text()))
+    blacklist = make_blacklist()
+    jobs = make_jobs(n, dup_rate=0.2)
+    frame = make_frame(n)
+    names = [job.company for job in jobs]
+    rows = [{"company": name, "rank": i} for i, name in enumerate(names)]
+    # One leaderboard row per 10 jobs keeps the page size realistic at 100k
+    page = make_leaderboard_html(max(1, n // 10))
+    return [
+        ("filter_jobs", lambda: filter_jobs(jobs, rules)),
+        ("deduplicate_jobs", lambda: deduplicate_jobs(jobs)),
+        ("df_to_jobs", lambda: _df_to_jobs(frame, "indeed")),
+        (
+            "parse_leaderboard",
+            lambda: parse_leaderboard_table(page, parser="lxml", targeted=True),
+        ),
+        ("filter_companies", lambda: filter_companies(names, blacklist)),
+        ("filter_job_companies", lambda: filter_job_companies(jobs, blacklist)),
+        ("filter_rows", lambda: filter_rows(rows, blacklist)),
+    ]
+
+
+def measure(fn, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times), "runs": repeat}
+
+
+def run_suite(sizes, repeat: int, only=None) -> dict:
+    results = {}
+    for n in sizes:
+        start = time.perf_counter()
+        suite = cases(n)
+        print(f"[corpus] n={n:,} built in {time.perf_counter() - start:.1f}s")
+        for name, fn in suite:
+            if only and name not in only:
+                continue
+            result = measure(fn, repeat)
+            results[f"{name}@{n}"] = dict(result, case=name, n=n)
+            print(
+                f"[bench] {name:<22}{n:>9,}  best {result['best'] * 1000:9.2f}ms"
+                f"  median {result['median'] * 1000:9.2f}ms"
+            )
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD) -> list:
+    """Keys of cases whose best time regressed past `threshold` x the baseline."""
+    regressions = []
+    base = baseline.get("results", {})
+    for key, result in current["results"].items():
+        if key not in base:
+            continue
+        before, after = base[key]["best"], result["best"]
+        ratio = after / before if before else float("inf")
+        regressed = ratio > threshold and after - before > NOISE_FLOOR
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"[compare] {key:<32} {before * 1000:9.2f}ms -> {after * 1000:9.2f}ms"
+            f"  ({ratio:5.2f}x){flag}"
+        )
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument(
+        "--sizes",
+        default=",".join(map(str, SIZES)),
+        help="comma-separated corpus sizes (default: %(default)s)",
+    )
+    p.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    p.add_argument("--only", help="comma-separated case names to run")
+    p.add_argument(
+        "--out", type=Path, default=RESULTS / "latest.json", help="results file"
+    )
+    p.add_argument("--baseline", type=Path, help="results file to compare against")
+    p.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="slowdown ratio that counts as a regression (default: %(default)s)",
+    )
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    only = set(args.only.split(",")) if args.only else None
+    current = run_suite(sizes, args.repeat, only)
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(current, indent=2) + "\n")
+    print(f"[bench] results written to {args.out}")
+
+    if args.baseline is None:
+        return 0
+    if not args.baseline.exists():
+        print(f"[compare] no baseline at {args.baseline}; run make bench-baseline")
+        return 0
+    regressions = compare(
+        current, json.loads(args.baseline.read_text()), args.threshold
+    )
+    if regressions:
+        print(f"[compare] {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("[compare] no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
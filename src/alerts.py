@@ -0,0 +1,221 @@
+from __future__ import annotations
+import queue
+import smtplib
+import ssl
+import threading
+import time
+from email.message import EmailMessage
+from typing import Callable, Iterable, List, Optional, Sequence
+from models import Job
+
+_STOP = object()
+
+
+def _default_line(job: Job) -> str:
+    return f"{job.company} | {job.title} | {job.location} | {job.url}"
+
+
+def _hung_up(error: Exception) -> bool:
+    """The server closed the session (dropped it, or replied 421 before closing)."""
+    if isinstance(error, (smtplib.SMTPServerDisconnected, ConnectionError)):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code == 421
+
+
+def _permanent(error: Exception) -> bool:
+    """5xx replies (bad credentials, refused recipients) won't succeed on retry."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+class DigestSender:
+    """
+    Emails new matches as digests from a background thread.
+
+    submit() only enqueues, so the scrape pipeline never waits on SMTP. The
+    worker sends a digest once max_jobs are pending or max_wait seconds after
+    the first pending job, whichever comes first. It keeps one SMTP connection
+    (STARTTLS + login) open across digests; a failed send drops the connection
+    and is retried on a fresh one with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        smtp_host: str,
+        smtp_port: int,
+        from_addr: str,
+        to_addrs: Sequence[str],
+        *,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = True,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        max_jobs: int = 25,
+        max_wait: float = 300.0,
+        retries: int = 4,
+        backoff: float = 2.0,
+        timeout: float = 30.0,
+        format_job: Callable[[Job], str] = _default_line,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.smtp_host = smtp_host
+        self.smtp_port = int(smtp_port)
+        self.from_addr = from_addr
+        self.to_addrs = list(to_addrs)
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.ssl_context = ssl_context
+        self.max_jobs = max(1, int(max_jobs))
+        self.max_wait = float(max_wait)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.format_job = format_job
+        self._sleep = sleep
+        self._queue: "queue.Queue" = queue.Queue()
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._thread = threading.Thread(
+            target=self._run, name="digest-sender", daemon=True
+        )
+        self.sent = 0  # digests delivered
+        self.failed = 0  # digests dropped after exhausting retries
+        self.connections = 0  # SMTP sessions opened
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, email: dict, **kwargs) -> "DigestSender":
+        """Build from the `email` section of app.yaml."""
+        return cls(
+            email["smtp_host"],
+            email.get("smtp_port", 587),
+            email["from_addr"],
+            email["to_addrs"],
+            username=email.get("username"),
+            password=email.get("password"),
+            starttls=email.get("starttls", True),
+            max_jobs=email.get("digest_max_jobs", 25),
+            max_wait=float(email.get("digest_max_minutes", 5)) * 60,
+            **kwargs,
+        )
+
+    def submit(self, jobs: Iterable[Job]) -> None:
+        """Queue jobs for the next digest; never blocks."""
+        jobs = list(jobs)
+        if jobs:
+            self._queue.put(jobs)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Send whatever is pending, then stop the worker and QUIT. Waits at most
+        timeout seconds (default: close_timeout()); a worker still stuck on the
+        server after that is abandoned, as the thread is a daemon.
+        """
+        self._queue.put(_STOP)
+        self._thread.join(self.close_timeout() if timeout is None else timeout)
+        if self._thread.is_alive():
+            print(
+                "[email] digest sender did not stop in time; pending digest abandoned"
+            )
+
+    def close_timeout(self) -> float:
+        """
+        How long the last digest may take to go out: every attempt running
+        into the SMTP timeout, the backoff between attempts, then the QUIT.
+        """
+        attempts = self.retries + 1
+        backoff = self.backoff * (2**self.retries - 1)
+        return (attempts + 1) * self.timeout + backoff
+
+    def _run(self) -> None:
+        pending: List[Job] = []
+        deadline: Optional[float] = None
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if item is not None:
+                pending.extend(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.max_wait
+            while len(pending) >= self.max_jobs:
+                self._deliver(pending[: self.max_jobs])
+                pending = pending[self.max_jobs :]
+            if pending and deadline is not None and time.monotonic() >= deadline:
+                self._deliver(pending)
+                pending = []
+            if not pending:
+                deadline = None
+        if pending:
+            self._deliver(pending)
+        self._disconnect()
+
+    def _message(self, jobs: List[Job]) -> EmailMessage:
+        msg = EmailMessage()
+        noun = "role" if len(jobs) == 1 else "roles"
+        msg["Subject"] = f"job-alerter: {len(jobs)} new {noun}"
+        msg["From"] = self.from_addr
+        msg["To"] = ", ".join(self.to_addrs)
+        msg.set_content("\n".join(self.format_job(job) for job in jobs) + "\n")
+        return msg
+
+    def _connect(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            smtp = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
+            try:
+                smtp.ehlo()
+                if self.starttls:
+                    smtp.starttls(
+                        context=self.ssl_context or ssl.create_default_context()
+                    )
+                    smtp.ehlo()
+                if self.username:
+                    smtp.login(self.username, self.password or "")
+            except BaseException:
+                smtp.close()
+                raise
+            self._smtp = smtp
+            self.connections += 1
+        return self._smtp
+
+    def _disconnect(self, polite: bool = True) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            if polite:
+                smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            smtp.close()
+
+    def _deliver(self, jobs: List[Job]) -> None:
+        msg = self._message(jobs)
+        delay = self.backoff
+        attempt = 0
+        while True:
+            reused = self._smtp is not None
+            try:
+                self._connect().send_message(msg)
+                self.sent += 1
+                return
+            except (smtplib.SMTPException, OSError) as e:
+                # The connection may be half-dead; start the retry on a fresh one
+                self._disconnect(polite=False)
+                if reused and _hung_up(e):
+                    # Servers drop idle sessions between digests: reconnect now,
+                    # without a backoff or using up an attempt
+                    continue
+                if attempt == self.retries or _permanent(e):
+                    self.failed += 1
+                    print(f"[email] digest of {len(jobs)} jobs dropped: {e}")
+                    return
+                self._sleep(delay)
+                delay *= 2
+                attempt += 1
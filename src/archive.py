@@ -0,0 +1,295 @@
+from __future__ import annotations
+import datetime as dt
+import os
+import re
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+from models import Job
+
+# Columns of every part file; `date` (the UTC day a job was seen) is the
+# partition key, taken from the directory name, not stored in the files
+COLUMNS = (
+    "seen_at",  # epoch seconds of the sighting
+    "url",
+    "title",
+    "company",
+    "location",
+    "source",
+    "listed_at",
+    "salary_min",
+    "salary_max",
+    "currency",
+    "periodicity",
+)
+DAY = 86400
+
+
+@lru_cache(maxsize=None)
+def _arrow():
+    """pyarrow and the schema; imported on first use, it is slow to load."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [("seen_at", pa.float64())]
+        + [(c, pa.string()) for c in COLUMNS[1:7]]
+        + [("salary_min", pa.int64()), ("salary_max", pa.int64())]
+        + [(c, pa.string()) for c in COLUMNS[9:]]
+    )
+    return pa, pc, ds, pq, schema
+
+
+def _day(ts: float) -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime(ts))
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class JobArchive:
+    """
+    Append-only history of every scraped job, one row per sighting (a job
+    seen on ten runs has ten rows), as Parquet files partitioned by day:
+    <dir>/date=YYYY-MM-DD/part-*.parquet. Descriptions are left out.
+
+    Rows are buffered and written flush_rows at a time, each file through a
+    temp file and a rename, so readers never see a partial one. compact()
+    merges a past day's files into one. Queries read only the columns they
+    need and only the days asked for, and aggregate with pyarrow.compute;
+    they count distinct URLs, so a row written twice changes no answer.
+    """
+
+    def __init__(self, directory: str, flush_rows: int = 5000):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.flush_rows = flush_rows
+        self._lock = threading.Lock()
+        self._rows: Dict[str, List] = {c: [] for c in COLUMNS}
+        self.appended = 0
+
+    def __enter__(self) -> "JobArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- writing ---
+
+    def append(self, jobs: Iterable[Job], seen_at: Optional[float] = None) -> None:
+        """Buffer one sighting of each job; written once flush_rows are pending."""
+        seen_at = time.time() if seen_at is None else seen_at
+        with self._lock:
+            r = self._rows
+            n = len(r["url"])
+            for j in jobs:
+                if not j.url:
+                    continue
+                r["url"].append(j.url)
+                r["title"].append(j.title)
+                r["company"].append(j.company)
+                r["location"].append(j.location)
+                r["source"].append(j.source)
+                r["listed_at"].append(_text(j.listed_at))
+                r["salary_min"].append(j.salary.min)
+                r["salary_max"].append(j.salary.max)
+                r["currency"].append(j.salary.currency)
+                r["periodicity"].append(j.salary.periodicity)
+            r["seen_at"].extend([seen_at] * (len(r["url"]) - n))
+            self.appended += len(r["url"]) - n
+            full = len(r["url"]) >= self.flush_rows
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows, one new file per day they were seen on."""
+        pa, _, _, _, schema = _arrow()
+        with self._lock:
+            rows, self._rows = self._rows, {c: [] for c in COLUMNS}
+            if not rows["url"]:
+                return
+            table = pa.table(rows, schema=schema)
+            days = [_day(ts) for ts in rows["seen_at"]]
+            distinct = sorted(set(days))
+            for day in distinct:
+                if len(distinct) > 1:
+                    part = table.filter(pa.array([d == day for d in days]))
+                else:
+                    part = table
+                self._write(day, part)
+
+    def _write(self, day: str, table) -> Path:
+        pq = _arrow()[3]
+        partition = self.dir / f"date={day}"
+        partition.mkdir(exist_ok=True)
+        path = partition / f"part-{int(time.time())}-{uuid.uuid4().hex}.parquet"
+        # Dot-prefixed, so a dataset scan skips it until the rename
+        tmp = partition / f".{path.name}.tmp"
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, path)
+        return path
+
+    def compact(self, before: Optional[str] = None) -> int:
+        """
+        Merge each day's files into one, for days before `before` (YYYY-MM-DD,
+        default today UTC); today's partition is still being appended to.
+        Returns the number of days merged.
+        """
+        _, _, _, pq, schema = _arrow()
+        before = before or _day(time.time())
+        merged = 0
+        for partition in sorted(self.dir.glob("date=*")):
+            day = partition.name[len("date=") :]
+            parts = sorted(partition.glob("part-*.parquet"))
+            if len(parts) < 2 or day >= before:
+                continue
+            self._write(day, pq.read_table(parts, schema=schema))
+            # A crash before every old part is gone leaves duplicate rows,
+            # which queries (counting distinct URLs) do not see
+            for p in parts:
+                p.unlink()
+            merged += 1
+        return merged
+
+    def close(self) -> None:
+        self.flush()
+
+    # --- querying ---
+
+    def _dataset(self):
+        pa, _, ds, _, schema = _arrow()
+        partitioning = ds.partitioning(
+            pa.schema([("date", pa.date32())]), flavor="hive"
+        )
+        return ds.dataset(
+            self.dir,
+            format="parquet",
+            schema=schema.append(pa.field("date", pa.date32())),
+            partitioning=partitioning,
+        )
+
+    def read(
+        self,
+        columns: Sequence[str],
+        start: Optional[dt.date] = None,
+        end: Optional[dt.date] = None,
+    ):
+        """
+        The given columns (plus `date`, if asked for) of the rows seen from
+        start to end inclusive, as a pyarrow Table. Days outside the range are
+        not opened; other columns are not read.
+        """
+        _, _, ds, _, _ = _arrow()
+        condition = None
+        if start is not None:
+            condition = ds.field("date") >= start
+        if end is not None:
+            upper = ds.field("date") <= end
+            condition = upper if condition is None else condition & upper
+        return self._dataset().to_table(columns=list(columns), filter=condition)
+
+    def postings_per_week(
+        self, start: Optional[dt.date] = None, end: Optional[dt.date] = None
+    ):
+        """Distinct postings seen per company per week (weeks start Monday)."""
+        pc = _arrow()[1]
+        t = self.read(["date", "company", "url"], start, end)
+        t = t.set_column(
+            0,
+            "week",
+            pc.floor_temporal(t["date"], unit="week", week_starts_monday=True),
+        )
+        return (
+            t.group_by(["company", "week"])
+            .aggregate([("url", "count_distinct")])
+            .select(["company", "week", "url_count_distinct"])
+            .rename_columns(["company", "week", "postings"])
+            .sort_by([("week", "ascending"), ("postings", "descending")])
+        )
+
+    def salary_distribution(
+        self,
+        start: Optional[dt.date] = None,
+        end: Optional[dt.date] = None,
+        title_any: Iterable[str] = (),
+        quantiles: Sequence[float] = (0.1, 0.25, 0.5, 0.75, 0.9),
+    ) -> Dict:
+        """
+        Yearly USD salaries of the distinct postings (optionally only those
+        whose title contains one of title_any, case-insensitive). A posting's
+        salary is the middle of its range, or whichever end it gives.
+        """
+        pa, pc, _, _, _ = _arrow()
+        t = self.read(
+            ["url", "title", "salary_min", "salary_max", "currency", "periodicity"],
+            start,
+            end,
+        )
+        keep = pc.and_(
+            pc.equal(t["currency"], "USD"), pc.equal(t["periodicity"], "year")
+        )
+        terms = [s for s in title_any if s]
+        if terms:
+            pattern = "|".join(re.escape(s) for s in terms)
+            keep = pc.and_(
+                keep, pc.match_substring_regex(t["title"], pattern, ignore_case=True)
+            )
+        t = t.filter(keep)
+        per_posting = t.group_by("url").aggregate(
+            [("salary_min", "max"), ("salary_max", "max")]
+        )
+        lo = pc.cast(per_posting["salary_min_max"], pa.float64())
+        hi = pc.cast(per_posting["salary_max_max"], pa.float64())
+        salary = pc.drop_null(pc.coalesce(pc.divide(pc.add(lo, hi), 2.0), lo, hi))
+        if len(salary) == 0:
+            return {"postings": 0, "mean": None, "quantiles": {}}
+        values = pc.quantile(salary, q=list(quantiles)).to_pylist()
+        return {
+            "postings": len(salary),
+            "mean": pc.mean(salary).as_py(),
+            "quantiles": dict(zip(quantiles, values)),
+        }
+
+    def time_to_fill(
+        self,
+        start: Optional[dt.date] = None,
+        end: Optional[dt.date] = None,
+        closed_after_days: float = 3,
+    ):
+        """
+        Per company: postings that stopped appearing (not seen in the last
+        closed_after_days of the archive) and the days each stayed up, from
+        its first to its last sighting.
+        """
+        pc = _arrow()[1]
+        t = self.read(["company", "url", "seen_at"], start, end)
+        latest = pc.max(t["seen_at"]).as_py() or 0.0
+        spans = t.group_by(["company", "url"]).aggregate(
+            [("seen_at", "min"), ("seen_at", "max")]
+        )
+        closed = spans.filter(
+            pc.less_equal(spans["seen_at_max"], latest - closed_after_days * DAY)
+        )
+        days = pc.divide(
+            pc.subtract(closed["seen_at_max"], closed["seen_at_min"]), float(DAY)
+        )
+        closed = closed.append_column("days", days)
+        return (
+            closed.group_by("company")
+            .aggregate(
+                [
+                    ("url", "count"),
+                    ("days", "mean"),
+                    ("days", "approximate_median"),
+                ]
+            )
+            .select(["company", "url_count", "days_mean", "days_approximate_median"])
+            .rename_columns(["company", "filled", "mean_days", "median_days"])
+            .sort_by([("filled", "descending"), ("company", "ascending")])
+        )
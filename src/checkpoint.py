@@ -0,0 +1,153 @@
+from __future__ import annotations
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+from models import Job, SalaryRange
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _record(job: Job) -> list:
+    s = job.salary
+    return [
+        job.title,
+        job.company,
+        job.location,
+        job.url,
+        job.source,
+        _text(job.listed_at),
+        s.min,
+        s.max,
+        s.currency,
+        s.periodicity,
+        job.description,
+        job.req_id,
+    ]
+
+
+def _job(r: list) -> Job:
+    return Job(
+        title=r[0],
+        company=r[1],
+        location=r[2],
+        url=r[3],
+        source=r[4],
+        listed_at=r[5],
+        salary=SalaryRange(min=r[6], max=r[7], currency=r[8], periodicity=r[9]),
+        description=r[10],
+        req_id=r[11],
+    )
+
+
+def _read(path: Path) -> Tuple[Optional[float], Dict[str, list]]:
+    """(run start, query key -> job records) from a journal; torn lines are skipped."""
+    started = None
+    entries: Dict[str, list] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:  # a record cut short by a crash mid-write
+                continue
+            if "started" in rec:
+                started = rec["started"]
+            else:
+                entries[rec["key"]] = rec["jobs"]
+    return started, entries
+
+
+class Checkpoint:
+    """
+    Journal of the queries a run has finished and the jobs each returned, one
+    JSON line per query, so an interrupted run resumes instead of re-scraping.
+
+    - A record is appended with a single write and fsync'd before put() returns;
+      a line torn by a crash is ignored when the journal is read back.
+    - Opening rewrites the journal atomically (temp file, fsync, os.replace)
+      with one record per query. A journal whose run started more than
+      max_age_seconds ago is too stale to resume and is dropped.
+    - finish() once the run's results are all recorded: the journal is
+      compacted down to an empty one, so the next run starts from scratch.
+    Safe to share between scrape threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_age_seconds: float = 12 * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self.resumed = 0  # queries served from the journal
+        self.entries: Dict[str, list] = {}
+        started = None
+        if self.path.exists():
+            started, entries = _read(self.path)
+            if started is not None and clock() - started <= max_age_seconds:
+                self.entries = entries
+        self.started = started if self.entries else clock()
+        self._rewrite()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[List[Job]]:
+        """The jobs a query returned earlier in this run, or None if it never finished."""
+        with self._lock:
+            # Served once: a later run of the same query (daemon polls) scrapes again
+            records = self.entries.pop(key, None)
+            if records is None:
+                return None
+            self.resumed += 1
+        return [_job(r) for r in records]
+
+    def put(self, key: str, jobs: List[Job]) -> None:
+        """Record a finished query; durable on disk once this returns."""
+        line = json.dumps({"key": key, "jobs": [_record(j) for j in jobs]}) + "\n"
+        with self._lock:
+            assert self._file is not None, "checkpoint is closed"
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def finish(self) -> None:
+        """The run completed: compact the journal to an empty one for the next run."""
+        with self._lock:
+            self.entries = {}
+            self.started = self._clock()
+            self._rewrite()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _rewrite(self) -> None:
+        lines = [json.dumps({"started": self.started})]
+        lines += [json.dumps({"key": k, "jobs": v}) for k, v in self.entries.items()]
+        if self._file is not None:
+            self._file.close()
+        fd, tmp = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._file = open(self.path, "a", encoding="utf-8")
@@ -0,0 +1,202 @@
+from __future__ import annotations
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Union
+import yaml
+
+# Trailing words that name a legal form, not the company: "Google LLC",
+# "Amazon.com, Inc." and "Block, Inc" are Google, Amazon and Block
+LEGAL_SUFFIXES = frozenset(
+    {
+        "ag",
+        "bv",
+        "co",
+        "com",
+        "company",
+        "corp",
+        "corporation",
+        "gmbh",
+        "inc",
+        "incorporated",
+        "limited",
+        "llc",
+        "llp",
+        "lp",
+        "ltd",
+        "nv",
+        "pbc",
+        "plc",
+        "sa",
+    }
+)
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=65536)
+def company_key(name: Optional[str]) -> str:
+    """
+    Normalized company name: accents and case folded, "&" read as "and",
+    punctuation collapsed, a leading "The" and trailing legal suffixes
+    (Inc, LLC, L.L.C., Corp, ...) dropped, with the "&" before one ("Morgan
+    Stanley & Co. LLC"). "The Walt Disney Company" and "Walt Disney Co."
+    both become "walt disney".
+    """
+    text = unicodedata.normalize("NFKD", name or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    words = _NON_WORD.sub(" ", text.lower().replace("&", " and ")).split()
+    if len(words) > 1 and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1:
+        # "L.L.C." splits into l, l, c
+        for n in (1, 2, 3):
+            if n < len(words) and "".join(words[-n:]) in LEGAL_SUFFIXES:
+                words = words[:-n]
+                if len(words) > 1 and words[-1] == "and":
+                    words = words[:-1]
+                break
+        else:
+            break
+    return " ".join(words)
+
+
+class CompanyIndex:
+    """
+    Company name -> canonical key, through company_key() and an alias table
+    (canonical name -> other names it goes by, e.g. Google: [Alphabet]).
+    Keys are memoized per raw string, so a name seen before is one dict
+    lookup; scraped postings repeat a few thousand names many times over.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, Iterable[str]]] = None):
+        self._aliases: Dict[str, str] = {}  # company_key -> canonical key
+        self._names: Dict[str, str] = {}  # canonical key -> display name
+        self._keys: Dict[str, str] = {}  # raw name -> canonical key
+        for name, others in (aliases or {}).items():
+            canonical = company_key(name)
+            self._names[canonical] = name
+            for alias in others or ():
+                self._aliases[company_key(alias)] = canonical
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def key(self, name: Optional[str]) -> str:
+        """Canonical key of a name; names of one company share it."""
+        name = name or ""
+        k = self._keys.get(name)
+        if k is None:
+            k = company_key(name)
+            k = self._keys[name] = self._aliases.get(k, k)
+        return k
+
+    def canonical(self, name: str) -> str:
+        """The alias table's name for the company, or the name as given."""
+        return self._names.get(self.key(name), name.strip())
+
+    def same(self, a: str, b: str) -> bool:
+        return self.key(a) == self.key(b)
+
+    def unique(self, names: Iterable[str]) -> List[str]:
+        """The first of each company's names, in order."""
+        seen = set()
+        out = []
+        for name in names:
+            k = self.key(name)
+            if k not in seen:
+                seen.add(k)
+                out.append(name)
+        return out
+
+    def ranks(self, rows: Iterable[Dict]) -> Dict[str, int]:
+        """Canonical key -> best Levels.fyi rank among the leaderboard rows."""
+        out: Dict[str, int] = {}
+        for row in rows:
+            rank = row.get("rank")
+            if rank is None:
+                continue
+            k = self.key(row.get("company", ""))
+            if k not in out or rank < out[k]:
+                out[k] = rank
+        return out
+
+
+def load_company_index(path: str = "config/company_aliases.yaml") -> CompanyIndex:
+    """CompanyIndex over the alias table; without the file, suffix stripping only."""
+    p = Path(path)
+    if not p.exists():
+        return CompanyIndex()
+    return CompanyIndex(yaml.safe_load(p.read_text()) or {})
+
+
+def _any_of(terms: Iterable[str]) -> Optional[Pattern[str]]:
+    terms = sorted(set(terms))
+    return re.compile("|".join(map(re.escape, terms))) if terms else None
+
+
+class Blacklist:
+    """
+    Blacklist terms, checked against a company name and its canonical key:
+    a name is blocked if a term is a case-insensitive substring of it (so
+    "block" blocks "Block Inc." and "Blockchain Co") or a term's key is a
+    substring of the name's key (so, with Amazon: [AWS] in the alias table,
+    "amazon" also blocks "AWS"). Verdicts are memoized per name, and the
+    first check of a name is one regex search, however many terms there are.
+    """
+
+    def __init__(self, terms: Iterable[str] = (), index: Optional[CompanyIndex] = None):
+        self.terms = frozenset(t.lower() for t in terms)
+        self.index = CompanyIndex() if index is None else index
+        self._terms = _any_of(self.terms)
+        # A term of only punctuation has an empty key, which is in every key
+        self._keys = _any_of(filter(None, map(self.index.key, self.terms)))
+        self._verdicts: Dict[str, bool] = {}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __iter__(self):
+        return iter(self.terms)
+
+    def blocked(self, name: Optional[str]) -> bool:
+        name = name or ""
+        verdict = self._verdicts.get(name)
+        if verdict is None:
+            verdict = self._verdicts[name] = self._terms is not None and (
+                self._terms.search(name.lower()) is not None
+                or (
+                    self._keys is not None
+                    and self._keys.search(self.index.key(name)) is not None
+                )
+            )
+        return verdict
+
+    def blocked_column(self, names):
+        """
+        blocked() over a pyarrow string array of names, as a boolean array.
+        The terms are searched in the whole lowercased column at once; only
+        the distinct names they miss have their canonical keys checked.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if self._terms is None:
+            return pa.array([False] * len(names), pa.bool_())
+        blocked = pc.match_substring_regex(pc.utf8_lower(names), self._terms.pattern)
+        if self._keys is not None:
+            rest = pc.unique(pc.filter(names, pc.invert(blocked))).to_pylist()
+            by_key = [
+                name
+                for name in rest
+                if self._keys.search(self.index.key(name)) is not None
+            ]
+            if by_key:
+                in_keys = pc.is_in(names, value_set=pa.array(by_key, pa.string()))
+                blocked = pc.or_(blocked, in_keys)
+        return blocked
+
+
+def as_blacklist(blacklist: Union[Blacklist, Iterable[str]]) -> Blacklist:
+    """A Blacklist as is; plain terms get one without aliases."""
+    return blacklist if isinstance(blacklist, Blacklist) else Blacklist(blacklist)
@@ -0,0 +1,262 @@
+from __future__ import annotations
+import hashlib
+import re
+import string
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from companies import CompanyIndex
+from models import Job
+
+# Query parameters that only track the click, never identify the posting
+# (Indeed keeps the posting id in `jk`, Glassdoor in `jl`; those stay)
+TRACKING_PARAMS = {
+    "from",
+    "tk",
+    "vjs",
+    "advn",
+    "adid",
+    "sjdu",
+    "acatk",
+    "pub",
+    "camk",
+    "xkcb",
+    "xpse",
+    "fccid",
+    "gclid",
+    "fbclid",
+    "msclkid",
+    "refid",
+    "trackingid",
+    "trk",
+    "src",
+    "ref",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# SimHash: 64-bit fingerprint over word 3-shingles. Indexed as 4 bands of
+# 16 bits, so any two fingerprints within Hamming distance 3 share a band.
+SHINGLE = 3
+MIN_TOKENS = 20  # shorter descriptions are boilerplate-dominated; not fingerprinted
+BANDS = 4
+BAND_BITS = 64 // BANDS
+MASK64 = (1 << 64) - 1
+NO_ROW = -1  # row id of an indexed job that is not (yet) in the store
+
+# Punctuation -> space, so str.split() tokenizes (much faster than a regex)
+_SEPARATORS = str.maketrans({c: " " for c in string.punctuation})
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """numpy and the shingle mixing constants; imported on first use, it is slow to load."""
+    import numpy as np
+
+    # Odd 64-bit multipliers
+    k = np.array(
+        [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64
+    )
+    return np, k, np.uint64(0xFF51AFD7ED558CCD)
+
+
+def _is_tracking(param: str) -> bool:
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url: str) -> str:
+    """
+    URL with tracking parameters, fragment, `www.`, trailing slash and
+    http/https differences removed; remaining parameters sorted.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(k)
+    )
+    return urlunsplit((scheme, host, parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def normalize(text: Optional[str]) -> str:
+    """Lowercase; runs of punctuation/whitespace collapse to one space."""
+    return _NON_WORD.sub(" ", (text or "").lower()).strip()
+
+
+def job_key(job: Job) -> Tuple[str, str, str]:
+    """Normalized (company, title, location)."""
+    return normalize(job.company), normalize(job.title), normalize(job.location)
+
+
+def _h64(text: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_hash(token: str) -> int:
+    return _h64(token)
+
+
+def simhash(text: Optional[str]) -> Optional[int]:
+    """
+    64-bit SimHash of a description's word 3-shingles (repeats weigh more), or
+    None when the text is too short to fingerprint. Stable across processes,
+    so fingerprints can be stored.
+    """
+    if not text:
+        return None
+    tokens = text.lower().translate(_SEPARATORS).split()
+    if len(tokens) < MIN_TOKENS:
+        return None
+    np, k, fmix = _numpy()
+    t = np.fromiter(map(_token_hash, tokens), dtype=np.uint64, count=len(tokens))
+    # Shingle hash: mix of its token hashes (uint64 arithmetic wraps)
+    x = t[:-2] * k[0] + t[1:-1] * k[1] + t[2:] * k[2]
+    x ^= x >> np.uint64(33)
+    x *= fmix
+    x ^= x >> np.uint64(33)
+    bits = np.unpackbits(x.view(np.uint8), bitorder="little").reshape(len(x), 64)
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(x)
+    return int.from_bytes(np.packbits(votes, bitorder="little").tobytes(), "little")
+
+
+def _bands(fingerprint: int) -> List[int]:
+    mask = (1 << BAND_BITS) - 1
+    return [(fingerprint >> (i * BAND_BITS)) & mask for i in range(BANDS)]
+
+
+class DedupeIndex:
+    """
+    Incremental duplicate detector. A job is a duplicate of an indexed one if:
+      - its canonical URL matches ("url"),
+      - its normalized (company, title, location) matches that of a job
+        offered to this index ("key"), with the company compared by its
+        canonical key (see companies.CompanyIndex), or
+      - its description SimHash is within max_distance bits of one from the
+        same company ("content"); candidates come from LSH bands, so a lookup
+        touches a few bucket entries instead of every indexed job.
+    Keys only catch the same posting coming back from another site or query
+    in this run: jobs loaded with add() (history) are not matched by key, so
+    a new posting for a title a company has filled before is still new, and a
+    key missing its company, title or location matches nothing. History jobs
+    carry their store row id, which offer_match() reports when a new job
+    duplicates one, so the caller can mark the stored posting as seen again.
+    URLs, keys and companies are held as 64-bit hashes to keep large indexes small.
+    """
+
+    def __init__(self, max_distance: int = 3, companies: Optional[CompanyIndex] = None):
+        if not 0 <= max_distance < BANDS:
+            raise ValueError(f"max_distance must be in [0, {BANDS - 1}]")
+        self.max_distance = max_distance
+        self.companies = CompanyIndex() if companies is None else companies
+        self._urls: Dict[int, int] = {}  # URL hash -> store row id, or NO_ROW
+        self._keys: Set[int] = set()
+        self._fingerprints = array("Q")
+        self._companies = array("Q")
+        self._rows = array("q")  # store row id per fingerprint, or NO_ROW
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(BANDS)]
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _signature(self, url: str, key: Tuple[str, str, str]):
+        url_h = _h64(canonical_url(url)) if url else None
+        key_h = _h64("\x1f".join(key)) if all(key) else None
+        return url_h, key_h
+
+    def _key(self, job: Job) -> Tuple[str, str, str]:
+        return (
+            self.companies.key(job.company),
+            normalize(job.title),
+            normalize(job.location),
+        )
+
+    def check(self, job: Job) -> Optional[str]:
+        """Why `job` duplicates an indexed job ("url", "key", "content"), or None."""
+        key = self._key(job)
+        url_h, key_h = self._signature(job.url, key)
+        return self._check(url_h, key_h, _h64(key[0]), simhash(job.description))[0]
+
+    def _check(self, url_h, key_h, company_h, fingerprint) -> Tuple[Optional[str], int]:
+        if url_h is not None:
+            row = self._urls.get(url_h)
+            if row is not None:
+                return "url", row
+        if key_h is not None and key_h in self._keys:
+            return "key", NO_ROW
+        if fingerprint is not None:
+            for band, value in enumerate(_bands(fingerprint)):
+                for i in self._buckets[band].get(value, ()):
+                    if (
+                        self._companies[i] == company_h
+                        and (self._fingerprints[i] ^ fingerprint).bit_count()
+                        <= self.max_distance
+                    ):
+                        return "content", self._rows[i]
+        return None, NO_ROW
+
+    def _add(self, url_h, key_h, company_h, fingerprint, row: int) -> None:
+        self._count += 1
+        if url_h is not None:
+            self._urls[url_h] = row
+        if key_h is not None:
+            self._keys.add(key_h)
+        if fingerprint is not None:
+            i = len(self._fingerprints)
+            self._fingerprints.append(fingerprint)
+            self._companies.append(company_h)
+            self._rows.append(row)
+            for band, value in enumerate(_bands(fingerprint)):
+                self._buckets[band].setdefault(value, []).append(i)
+
+    def add(
+        self,
+        url: str,
+        company: str,
+        fingerprint: Optional[int] = None,
+        row: int = NO_ROW,
+    ) -> None:
+        """
+        Index a job by its fields (e.g. one loaded from the store, with its
+        row id), for URL and content matches only.
+        """
+        company_key = self.companies.key(company)
+        url_h = _h64(canonical_url(url)) if url else None
+        self._add(url_h, None, _h64(company_key), fingerprint, row)
+
+    def offer(self, job: Job) -> Optional[str]:
+        """
+        check() and, if the job is not a duplicate, index it. Returns the
+        duplicate reason or None for a new job.
+        """
+        return self.offer_match(job)[0]
+
+    def offer_match(self, job: Job) -> Tuple[Optional[str], int]:
+        """
+        offer(), plus the store row id of the history job it duplicates
+        (NO_ROW for new jobs and for duplicates of jobs offered this run).
+        """
+        key = self._key(job)
+        url_h, key_h = self._signature(job.url, key)
+        company_h = _h64(key[0])
+        fingerprint = simhash(job.description)
+        reason, row = self._check(url_h, key_h, company_h, fingerprint)
+        if reason is None:
+            self._add(url_h, key_h, company_h, fingerprint, NO_ROW)
+        return reason, row
+
+    def add_all(self, rows: Iterable[Tuple[str, str, Optional[int], int]]) -> None:
+        """Index (url, company, fingerprint, row id) rows, e.g. JobStore.fingerprints()."""
+        for row in rows:
+            self.add(*row)
@@ -1,16 +1,41 @@
+import argparse
+import copy
+import datetime
+import math
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import yaml
-from providers.levels_html import fetch_leaderboards
-from providers.jobspy_search import search_company_roles, search_by_query
+from providers.http_cache import PageCache
+from providers.executor import SiteRateLimiter
+from providers.scrape_cache import ScrapeCache
+from providers.scrape_tape import ScrapeTape
+from providers.query_plan import QueryPlanner, build_query
+from providers.scrape_window import ScrapeWindow, window_key
+from scheduler import PollScheduler
 from targets import (
-    filter_job_companies,
     load_blacklist,
     filter_companies,
-    filter_rows,
+    filter_job_companies,
     filter_jobs,
-    deduplicate_jobs,
+    filter_rows,
 )
 from models import Job
+from alerts import DigestSender
+from archive import JobArchive
+from checkpoint import Checkpoint
+from companies import Blacklist, CompanyIndex, as_blacklist, load_company_index
+from matching import Prefilter, compile_rules
+from metrics import Metrics, serve, timed
+from dedupe import DedupeIndex
+from pipeline import Batch, merge_sites, new_matching_jobs
+from profiles import ProfileIndex, load_profiles, union_rules
+from store import JobStore
+
+# Heavy modules are imported where a stage needs them, not here, so commands
+# that never scrape start fast: providers.jobspy_search (pandas, jobspy) when
+# a search runs, providers.levels_html (requests, bs4) when the leaderboard
+# is fetched; dedupe loads numpy on the first fingerprint.
 
 
 def load_yaml(p: str):
@@ -29,45 +54,207 @@ def format_salary(job: Job) -> str:
         return "N/A"
 
 
-def main():
-    app = load_yaml("config/app.yaml")
-    rules = load_yaml("config/rules.yaml")
+def job_line(job: Job) -> str:
+    sal_txt = format_salary(job)
+    return f"{job.company:<22} | {job.title:<30} | {job.location:<20} | {sal_txt} | {job.url}"
 
-    print("job-alerter bootstrap OK")
-    print(f"- seed_mode: {app['runtime']['seed_mode']}")
-    print(f"- levels urls: {len(app['levels']['urls'])}")
-    print(
-        f"- include keywords: {rules['role_titles']['include_any'] + rules['job_descriptions']['include_any']}"
+
+def print_jobs(jobs, rank_of: Optional[Callable[[str], Optional[int]]] = None):
+    """One line per job; with rank_of, a company's Levels.fyi rank is appended."""
+    for job in jobs:
+        rank = rank_of(job.company) if rank_of is not None else None
+        suffix = f" | levels #{rank}" if rank is not None else ""
+        print(f" - {job_line(job)}{suffix}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check top companies for new roles.")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="run",
+        choices=[
+            "run",
+            "daemon",
+            "profiles",
+            "leaderboard",
+            "filter",
+            "dry-run",
+            "trends",
+        ],
+        help=(
+            "run: check once and exit (default); daemon: keep polling on a "
+            "schedule; profiles: check once for every profile in config/profiles; "
+            "leaderboard: print the Levels.fyi leaderboard only; filter: re-apply "
+            "the rules to stored jobs; dry-run: show the planned queries; "
+            "trends: postings, salaries and time-to-fill from the archive"
+        ),
+    )
+    parser.add_argument(
+        "--days",
+        type=float,
+        help="filter, trends: only jobs seen in the last DAYS days",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore cached scrape results and re-scrape everything",
+    )
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="scrape every query over the full hours_old window, ignoring watermarks",
+    )
+    tape = parser.add_mutually_exclusive_group()
+    tape.add_argument(
+        "--record",
+        metavar="DIR",
+        help="save the leaderboard and every scrape result to DIR for --replay",
     )
+    tape.add_argument(
+        "--replay",
+        metavar="DIR",
+        help=(
+            "rerun offline from a --record directory instead of scraping, into "
+            "an in-memory store (no cache, checkpoint, archive or email)"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def open_tape(args) -> Optional[ScrapeTape]:
+    if args.record:
+        return ScrapeTape(args.record, mode="record")
+    if args.replay:
+        return ScrapeTape(args.replay, mode="replay")
+    return None
+
+
+def replay_config(app):
+    """
+    app.yaml adjusted for a replay: a fresh in-memory store so every replay
+    sees the same jobs as new, and nothing that reads or writes outside state.
+    """
+    app = copy.deepcopy(app)
+    app["runtime"]["db_path"] = ":memory:"
+    for section in ("scrape_cache", "checkpoint", "email", "archive"):
+        app.setdefault(section, {})["enabled"] = False
+    return app
 
-    # Load & apply blacklist
-    bl = load_blacklist()  # case-insensitive substring match
-    print(f"[blacklist] terms: {len(bl)}")
 
-    # --- JobSpy configuration ---
+def open_scrape_cache(app, refresh: bool = False):
+    """ScrapeCache from the scrape_cache section of app.yaml, or None if disabled."""
+    sc = app.get("scrape_cache", {})
+    if not sc.get("enabled", False):
+        return None
+    return ScrapeCache(
+        sc.get("path", "./data/scrape_cache.db"),
+        ttl_seconds=float(sc.get("ttl_minutes", 60)) * 60,
+        max_bytes=int(sc.get("max_mb", 256)) * 1024 * 1024,
+        refresh=refresh,
+    )
+
+
+def open_archive(app) -> Optional[JobArchive]:
+    """JobArchive from the archive section of app.yaml, or None if disabled."""
+    ac = app.get("archive", {})
+    if not ac.get("enabled", False):
+        return None
+    return JobArchive(
+        ac.get("dir", "./data/archive"), flush_rows=int(ac.get("flush_rows", 5000))
+    )
+
+
+def open_checkpoint(app):
+    """Checkpoint journal from the checkpoint section of app.yaml, or None if disabled."""
+    cp = app.get("checkpoint", {})
+    if not cp.get("enabled", False):
+        return None
+    return Checkpoint(
+        cp.get("path", "./data/checkpoint.jsonl"),
+        max_age_seconds=float(cp.get("max_age_hours", 12)) * 3600,
+    )
+
+
+def open_scrape_window(app, store: JobStore, backfill: bool = False):
+    """ScrapeWindow seeded from the store's watermarks, or None if not incremental."""
     js = app.get("jobspy", {})
-    site = js.get("site", "indeed")
-    location = js.get("location", "Austin, TX")
-    radius_miles = js.get("radius_miles", 50)
-    results_wanted = js.get("results_wanted", 100)
-    hours_old = js.get("hours_old", 168)
+    if not js.get("incremental", False):
+        return None
+    # A cached frame can be up to the cache TTL old, so overlap at least that much
+    overlap = float(js.get("overlap_hours", 2))
+    sc = app.get("scrape_cache", {})
+    if sc.get("enabled", False):
+        overlap = max(overlap, float(sc.get("ttl_minutes", 60)) / 60)
+    return ScrapeWindow(
+        store.watermarks(),
+        max_hours=js.get("hours_old", 168),
+        overlap_hours=overlap,
+        backfill=backfill,
+    )
+
+
+def configured_sites(app) -> List[str]:
+    """jobspy.site as a list; it may be one board or several."""
+    sites = app.get("jobspy", {}).get("site", "indeed")
+    return [sites] if isinstance(sites, str) else list(sites)
+
 
-    # Extract role keywords from rules.yaml for JobSpy search terms
-    role_keywords = (
+def role_keywords(rules) -> List[str]:
+    """JobSpy search terms: the title and description include terms of rules.yaml."""
+    return (
         rules["role_titles"]["include_any"] + rules["job_descriptions"]["include_any"]
     )
 
-    urls = app["levels"]["urls"]
-    user_agent = app["runtime"]["user_agent"]
-    timeout = app["runtime"]["request_timeout"]
 
-    rows, companies = fetch_leaderboards(urls, timeout, user_agent)
+def open_blacklist(companies: Optional[CompanyIndex] = None) -> Blacklist:
+    """blacklist.txt, matched by name and by canonical company (config/company_aliases.yaml)."""
+    return Blacklist(
+        load_blacklist(), load_company_index() if companies is None else companies
+    )
+
+
+def open_levels_cache(app):
+    cache_dir = app["levels"].get("cache_dir")
+    return PageCache(cache_dir) if cache_dir else None
+
+
+def fetch_leaderboard(
+    app,
+    blacklist,
+    cache=None,
+    metrics: Optional[Metrics] = None,
+    tape: Optional[ScrapeTape] = None,
+) -> Tuple[List[Dict], List[str]]:
+    """
+    Levels.fyi rows and companies, after the blacklist. Companies are one per
+    canonical name, so "Google" and "Google LLC" are searched once.
+    """
+    blacklist = as_blacklist(blacklist)
+    if tape is not None and tape.replaying:
+        rows, companies = tape.load_leaderboard()
+    else:
+        from providers.levels_html import fetch_leaderboards
+
+        levels = app["levels"]
+        with timed(metrics, "leaderboard"):
+            rows, companies = fetch_leaderboards(
+                levels["urls"],
+                app["runtime"]["request_timeout"],
+                app["runtime"]["user_agent"],
+                parser=levels.get("parser", "html5lib"),
+                targeted=levels.get("targeted", False),
+                cache=cache,
+                max_concurrency=levels.get("max_concurrency", 4),
+            )
+        if tape is not None:
+            tape.save_leaderboard(rows, companies)
     print(f"[levels] rows parsed: {len(rows)}  | unique companies: {len(companies)}")
+    companies_f = blacklist.index.unique(filter_companies(companies, blacklist))
+    return filter_rows(rows, blacklist), companies_f
 
-    rows_f = filter_rows(rows, bl)
-    companies_f = filter_companies(companies, bl)
 
-    # Preview before/after
+def print_leaderboard(rows_f: List[Dict], companies_f: List[str]) -> None:
     print(f"[filtered] rows: {len(rows_f)}  | companies: {len(companies_f)}")
     print("\nTop 10 (after blacklist):")
     for r in rows_f[:15]:
@@ -80,80 +267,576 @@ def main():
     for c in companies_f[:15]:
         print(" -", c)
 
-    print("\n=== JobSpy Primary Query (Top 15 Companies) ===")
-    print(
-        f"Searching for roles at top (levels.fyi ranked) companies with keywords: {role_keywords}"
-    )
 
-    # Primary query: Search top 15 (levels.fyi ranked) companies
-    all_jobs = []
-    top_companies = companies_f[:15]  # Limit to top 15
+# jobspy.lanes settings a site may override
+LANE_PARAMS = ("max_workers", "results_wanted")
 
-    for company in top_companies:
-        print(f"\nSearching {company}...")
-        try:
-            company_jobs = search_company_roles(
+
+class Alerter:
+    """
+    Everything a check needs, built once from app.yaml and rules.yaml: the job
+    store, compiled rules, rate limiter, caches, query planner and dedupe index.
+    One-shot runs use it once; the daemon keeps it (and its warm caches) alive.
+    """
+
+    def __init__(
+        self,
+        app,
+        rules,
+        refresh: bool = False,
+        backfill: bool = False,
+        tape: Optional[ScrapeTape] = None,
+    ):
+        self.app = app
+        self.rules = rules
+        # Records scrape results, or replays them instead of scraping
+        self.tape = tape
+        # Job history; lets us alert only on postings we haven't seen before
+        self.store = JobStore(app["runtime"]["db_path"])
+
+        # Company names -> canonical keys (suffixes stripped, aliases joined);
+        # shared by the blacklist, dedupe and the Levels.fyi rank lookup
+        self.companies = load_company_index()
+        # Load & apply blacklist
+        self.blacklist = open_blacklist(self.companies)
+        # Canonical company -> Levels.fyi rank, from the last leaderboard()
+        self.levels_ranks: Dict[str, int] = {}
+
+        # --- JobSpy configuration ---
+        js = app.get("jobspy", {})
+        self.sites = configured_sites(app)
+        self.search_params = dict(
+            location=js.get("location", "Austin, TX"),
+            radius_miles=js.get("radius_miles", 50),
+            results_wanted=js.get("results_wanted", 100),
+            hours_old=js.get("hours_old", 168),
+            max_workers=app["runtime"].get("max_workers", 4),
+        )
+        # Each site runs in its own lane; jobspy.lanes overrides its budget
+        lanes = {site: js.get("lanes", {}).get(site) or {} for site in self.sites}
+        self.site_params = {
+            site: dict(
+                self.search_params,
+                **{k: v for k, v in lane.items() if k in LANE_PARAMS},
+            )
+            for site, lane in lanes.items()
+        }
+
+        # Compile rules once; optionally push the cheap predicates down into the
+        # DataFrame conversion so rejected rows never become Job objects
+        self.compiled_rules = compile_rules(rules)
+        pushdown = js.get("pushdown", False)
+        self.primary_prefilter = Prefilter(self.compiled_rules) if pushdown else None
+        self.broad_prefilter = (
+            Prefilter(self.compiled_rules, self.blacklist) if pushdown else None
+        )
+
+        # Extract role keywords from rules.yaml for JobSpy search terms
+        self.role_keywords = role_keywords(rules)
+
+        # One token bucket per site, shared by every scrape thread
+        self.limiter = SiteRateLimiter(
+            app["runtime"].get("per_domain_sleep", 0),
+            overrides={
+                site: lane["per_domain_sleep"]
+                for site, lane in lanes.items()
+                if "per_domain_sleep" in lane
+            },
+        )
+        self.cache = open_scrape_cache(app, refresh=refresh)
+        # Finished queries are journaled so an interrupted run resumes
+        self.checkpoint = open_checkpoint(app)
+        # Every sighting of every scraped job, for trend queries; see run_trends
+        self.archive = open_archive(app)
+        # OR-group role terms into as few searches as each site allows
+        self.planners = {
+            site: QueryPlanner(site, max_terms=js.get("max_terms_per_query", 1))
+            for site in self.sites
+        }
+        # Narrow hours_old per query to the time since its last successful scrape
+        self.window = open_scrape_window(app, self.store, backfill=backfill)
+        # Shared by every search and preloaded with the history, so reposts under
+        # new URLs (or on other sites) are caught as near-duplicates
+        self.dedupe_index = DedupeIndex(companies=self.companies)
+        self.dedupe_index.add_all(self.store.fingerprints())
+        self.dedupe_cutoff: Optional[float] = None  # see trim_dedupe_index
+
+        # Stage timings and per-query scrape stats; see metrics.Metrics
+        self.metrics = Metrics()
+
+        self.levels_cache = open_levels_cache(app)
+
+        # Digest emails go out from a background thread; see notify()
+        email = app.get("email", {})
+        self.digests = (
+            DigestSender.from_config(email, format_job=job_line)
+            if email.get("enabled", False)
+            else None
+        )
+
+    def notify(self, jobs: List[Job]) -> None:
+        """Print new matches and queue them for the next digest email."""
+        print_jobs(jobs, self.levels_rank)
+        if self.digests is not None:
+            self.digests.submit(jobs)
+
+    def leaderboard(self) -> Tuple[List[Dict], List[str]]:
+        """Levels.fyi rows and companies, after the blacklist."""
+        rows, companies = fetch_leaderboard(
+            self.app, self.blacklist, self.levels_cache, self.metrics, self.tape
+        )
+        self.levels_ranks = self.companies.ranks(rows)
+        return rows, companies
+
+    def levels_rank(self, company: str) -> Optional[int]:
+        """Levels.fyi rank of a posting's company ("Google LLC" is Google's)."""
+        return self.levels_ranks.get(self.companies.key(company))
+
+    def _scrape(self, search, prefilter, **kwargs) -> Iterator[Batch]:
+        """Run a provider search on every site, each in its own lane, merged."""
+        lanes = {
+            site: search(
                 site=site,
-                company=company,
-                role_terms=role_keywords,
-                location=location,
-                radius_miles=radius_miles,
-                results_wanted=results_wanted,
-                hours_old=hours_old,
+                role_terms=self.role_keywords,
+                limiter=self.limiter,
+                cache=self.cache,
+                window=self.window,
+                prefilter=prefilter,
+                planner=self.planners[site],
+                metrics=self.metrics,
+                checkpoint=self.checkpoint,
+                tape=self.tape,
+                **self.site_params[site],
+                **kwargs,
             )
-            all_jobs.extend(company_jobs)
-            print(f"  Found {len(company_jobs)} jobs at {company}")
-        except Exception as e:
-            print(f"  Error searching {company}: {e}")
+            for site in self.sites
+        }
+        return merge_sites(lanes)
 
-    # Deduplicate and filter jobs
-    unique_jobs = deduplicate_jobs(all_jobs)
-    print(f"\nTotal unique jobs found across all companies: {len(unique_jobs)}")
+    def search_companies(
+        self, companies: List[str], new_counts: Optional[Dict[str, int]] = None
+    ) -> Iterator[Batch]:
+        """New matching jobs per company, streamed as each company's queries finish."""
+        from providers import jobspy_search
 
-    # Apply blacklist and rules filtering
-    final_jobs = filter_jobs(unique_jobs, rules)
-    print(f"After rules filtering: {len(final_jobs)}")
+        scraped = self._scrape(
+            jobspy_search.search_companies,
+            self.primary_prefilter,
+            companies=companies,
+        )
+        return new_matching_jobs(
+            scraped,
+            self.compiled_rules,
+            self.store,
+            index=self.dedupe_index,
+            new_counts=new_counts,
+            metrics=self.metrics,
+            archive=self.archive,
+        )
 
-    # Print results
-    print("\n=== Available Roles at Top Companies (Levels.fyi Ranked) ===")
-    for job in final_jobs:
-        sal_txt = format_salary(job)
-        print(
-            f" - {job.company:<22} | {job.title:<30} | {job.location:<20} | {sal_txt} | {job.url}"
+    def search_broad(
+        self, new_counts: Optional[Dict[str, int]] = None
+    ) -> Iterator[Batch]:
+        """New matching jobs from the keyword search over any company, per query."""
+        from providers import jobspy_search
+
+        scraped = self._scrape(jobspy_search.search_terms, self.broad_prefilter)
+        return new_matching_jobs(
+            scraped,
+            self.compiled_rules,
+            self.store,
+            blacklist=self.blacklist,
+            index=self.dedupe_index,
+            new_counts=new_counts,
+            metrics=self.metrics,
+            archive=self.archive,
         )
 
+    def advance_watermarks(self) -> None:
+        """Call once a search's batches are all recorded, so its queries can advance."""
+        if self.window is not None:
+            self.store.set_watermarks(self.window.advance())
+
+    def trim_dedupe_index(
+        self, max_age_days: Optional[float], now: Optional[float] = None
+    ) -> bool:
+        """
+        Rebuild the dedupe index from the jobs last seen within max_age_days
+        (all of history if None), if that cutoff has moved since the last
+        rebuild. The cutoff moves in whole days, so the daemon, which calls
+        this after every poll, reloads the history at most once a day instead
+        of keeping everything offered since it started. A posting that is
+        still listed stays in: dedupe bumps its last_seen on every sighting.
+        The store still remembers every URL for good. Returns whether the
+        index was rebuilt.
+        """
+        now = time.time() if now is None else now
+        cutoff = (
+            None
+            if max_age_days is None
+            else math.floor(now / 86400 - max_age_days) * 86400.0
+        )
+        if cutoff == self.dedupe_cutoff:
+            return False
+        index = DedupeIndex(companies=self.companies)
+        index.add_all(self.store.fingerprints(cutoff))
+        self.dedupe_index = index
+        self.dedupe_cutoff = cutoff
+        return True
+
+    def finish_run(self) -> None:
+        """Call once a whole run is recorded; the next run won't resume from it."""
+        if self.archive is not None:
+            self.archive.flush()
+        if self.checkpoint is not None:
+            self.checkpoint.finish()
+
+    def close(self) -> None:
+        if self.digests is not None:
+            self.digests.close()  # sends whatever is still pending
+            print(
+                f"[email] digests sent: {self.digests.sent}"
+                f"  | failed: {self.digests.failed}"
+            )
+        self.store.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+        if self.archive is not None:
+            self.archive.close()
+            self.archive.compact()
+
+
+def run_once(alerter: Alerter) -> None:
+    """Check the top companies and the broad search once, printing new roles."""
+    rows_f, companies_f = alerter.leaderboard()
+    print_leaderboard(rows_f, companies_f)
+
+    print("\n=== JobSpy Primary Query (Top 15 Companies) ===")
+    print(
+        f"Searching for roles at top (levels.fyi ranked) companies with keywords: {alerter.role_keywords}"
+    )
+
+    # Primary query: Search top 15 (levels.fyi ranked) companies.
+    # Each company's jobs stream through dedupe -> store -> rules and are
+    # printed as soon as its queries finish.
+    top_companies = companies_f[:15]  # Limit to top 15
+    lanes = ", ".join(
+        f"{site} ({params['max_workers']} workers)"
+        for site, params in alerter.site_params.items()
+    )
+    print(f"Fanning out over {len(top_companies)} companies on {lanes}")
+    print("\n=== New Roles at Top Companies (Levels.fyi Ranked) ===")
+    primary_new = 0
+    for company, new_jobs, errors in alerter.search_companies(top_companies):
+        print(f"\n{company}: {len(new_jobs)} new matching jobs")
+        for e in errors:
+            print(f"  Error searching {company}: {e}")
+        alerter.notify(new_jobs)
+        primary_new += len(new_jobs)
+    print(
+        f"\nUnique jobs indexed (incl. history): {len(alerter.dedupe_index)}"
+        f"  | new matching roles: {primary_new}"
+    )
+    alerter.advance_watermarks()
+
     # Secondary query: Broad keyword search
     print("\n\n=== JobSpy Broad Keyword Search ===")
     print("Searching any company for roles matching keywords...")
+    print("\n=== New Broad Search Results ===")
+    broad_new = 0
+    try:
+        for term, new_jobs, errors in alerter.search_broad():
+            for e in errors:
+                print(f"  Error searching '{term}': {e}")
+            alerter.notify(new_jobs)
+            broad_new += len(new_jobs)
+        print(f"Broad search new matching jobs: {broad_new}")
+        alerter.advance_watermarks()
+        alerter.finish_run()
+
+    except Exception as e:
+        print(f"Error in broad search: {e}")
+
+
+def run_profiles(alerter: Alerter, index: ProfileIndex) -> Dict[str, List[Job]]:
+    """
+    One scrape for many profiles. The alerter runs on union_rules(profiles), so
+    it keeps every job some profile could want; each new job is then matched
+    against all profiles at once. Prints and returns each profile's new roles.
+    """
+    results: Dict[str, List[Job]] = {name: [] for name in index.names}
+    _, companies_f = alerter.leaderboard()
+    top_companies = companies_f[:15]
+    print(f"\nSearching {len(top_companies)} companies for {len(index)} profiles")
+    for company, new_jobs, errors in alerter.search_companies(top_companies):
+        for e in errors:
+            print(f"  Error searching {company}: {e}")
+        index.match_all(new_jobs, into=results)
+    alerter.advance_watermarks()
 
-    # Build broad query from keywords
     try:
-        broad_jobs = search_by_query(
-            site=site,
-            role_terms=role_keywords,
-            location=location,
-            radius_miles=radius_miles,
-            results_wanted=results_wanted,
-            hours_old=hours_old,
+        for term, new_jobs, errors in alerter.search_broad():
+            for e in errors:
+                print(f"  Error searching '{term}': {e}")
+            index.match_all(new_jobs, into=results)
+        alerter.advance_watermarks()
+        alerter.finish_run()
+    except Exception as e:
+        print(f"Error in broad search: {e}")
+
+    for name, jobs in results.items():
+        print(f"\n=== {name}: {len(jobs)} new matching roles ===")
+        print_jobs(jobs, alerter.levels_rank)
+    return results
+
+
+def run_leaderboard(app) -> None:
+    """Fetch and print the leaderboard only; no store, no scraping."""
+    rows_f, companies_f = fetch_leaderboard(
+        app, open_blacklist(), open_levels_cache(app)
+    )
+    print_leaderboard(rows_f, companies_f)
+
+
+def run_filter(app, rules, days: Optional[float] = None) -> List[Job]:
+    """
+    Re-apply the current rules.yaml and blacklist to jobs already in the store
+    (first seen in the last `days`, if given) and print the matches. No scraping.
+    """
+    db_path = app["runtime"]["db_path"]
+    if db_path != ":memory:" and not Path(db_path).exists():
+        print(f"[store] {db_path} does not exist yet; run a scrape first")
+        return []
+    since = None if days is None else time.time() - days * 86400
+    with JobStore(db_path) as store:
+        jobs = list(store.iter_jobs(since))
+    matched = filter_jobs(filter_job_companies(jobs, open_blacklist()), rules)
+    print(f"[filter] {len(matched)} of {len(jobs)} stored jobs match the current rules")
+    print_jobs(matched)
+    return matched
+
+
+def run_dry(app, rules) -> None:
+    """
+    Show what a run would search, per site: the planned queries and the
+    hours_old each broad query would get. Checks the config and rules compile;
+    no network calls, and the store is only read.
+    """
+    js = app.get("jobspy", {})
+    compile_rules(rules)
+    terms = role_keywords(rules)
+    location = js.get("location", "Austin, TX")
+    radius = js.get("radius_miles", 50)
+    db_path = app["runtime"]["db_path"]
+    window = None
+    if Path(db_path).exists():
+        with JobStore(db_path, read_only=True) as store:
+            window = open_scrape_window(app, store)
+    for site in configured_sites(app):
+        planner = QueryPlanner(site, max_terms=js.get("max_terms_per_query", 1))
+        groups = planner.groups(terms)
+        print(f"\n[dry-run] {site}: {len(groups)} queries per company")
+        for group in groups:
+            print(f"  {build_query(group, '<company>')}")
+        print(f"[dry-run] {site}: {len(groups)} broad queries")
+        for group in groups:
+            query = build_query(group)
+            hours = js.get("hours_old", 168)
+            if window is not None:
+                hours = window.hours_old(window_key(site, query, location, radius))
+            print(f"  {query}  (hours_old={hours})")
+
+
+def run_trends(app, rules, days: Optional[float] = None) -> None:
+    """Weekly postings, salaries of matching titles and time-to-fill, from the archive."""
+    directory = app.get("archive", {}).get("dir", "./data/archive")
+    if not Path(directory).is_dir():
+        print(f"[archive] {directory} does not exist yet; run a scrape first")
+        return
+    archive = JobArchive(directory)
+    start = None
+    if days is not None:
+        start = datetime.date.fromtimestamp(time.time() - days * 86400)
+    t0 = time.perf_counter()
+
+    weekly = archive.postings_per_week(start).to_pylist()
+    print("\n=== Postings per company per week (top 5 per week) ===")
+    shown: Dict = {}
+    for row in weekly:
+        if shown.get(row["week"], 0) < 5:
+            shown[row["week"]] = shown.get(row["week"], 0) + 1
+            print(f"{row['week']}  {row['company']:<25} {row['postings']}")
+
+    titles = rules["role_titles"]["include_any"]
+    salaries = archive.salary_distribution(start, title_any=titles)
+    print("\n=== Yearly USD salaries, titles matching rules.yaml ===")
+    print(f"postings with a salary: {salaries['postings']}")
+    if salaries["postings"]:
+        print(f"mean: {salaries['mean']:,.0f}")
+        for q, value in salaries["quantiles"].items():
+            print(f"p{q * 100:.0f}: {value:,.0f}")
+
+    print("\n=== Time to fill (postings no longer listed) ===")
+    for row in archive.time_to_fill(start).to_pylist()[:15]:
+        print(
+            f"{row['company']:<25} filled: {row['filled']:<5}"
+            f" median: {row['median_days']:.1f}d  mean: {row['mean_days']:.1f}d"
         )
-        print(f"Found {len(broad_jobs)} broad jobs")
+    print(f"\n[archive] queried in {time.perf_counter() - t0:.3f}s")
+
+
+# Scheduler key for the broad keyword search (company keys are strings)
+BROAD_SEARCH = ("broad search",)
 
-        # Apply filtering rules
-        broad_unique = deduplicate_jobs(broad_jobs)
-        broad_companies_f = filter_job_companies(broad_unique, bl)
-        broad_final = filter_jobs(broad_companies_f, rules)
 
-        print(f"Broad search found {len(broad_final)} matching jobs after filtering")
+def run_daemon(alerter: Alerter, scheduler: Optional[PollScheduler] = None) -> None:
+    """
+    Poll each top company (and the broad search) on its own adaptive schedule;
+    the leaderboard is re-read every daemon.leaderboard_refresh_hours.
+    """
+    d = alerter.app.get("daemon", {})
+    top_n = d.get("top_companies", 15)
+    refresh = float(d.get("leaderboard_refresh_hours", 24)) * 3600
+    dedupe_days = d.get("dedupe_history_days", 30)
+    dedupe_days = None if dedupe_days is None else float(dedupe_days)
+    if scheduler is None:
+        scheduler = PollScheduler(
+            initial_interval=float(d.get("initial_interval_minutes", 60)) * 60,
+            min_interval=float(d.get("min_interval_minutes", 15)) * 60,
+            max_interval=float(d.get("max_interval_hours", 24)) * 3600,
+            spacing=float(d.get("spacing_seconds", 30)),
+        )
+    clock = scheduler.clock
+
+    def poll(key) -> int:
+        new_counts: Dict[str, int] = {}
+        if key == BROAD_SEARCH:
+            batches = alerter.search_broad(new_counts)
+        else:
+            batches = alerter.search_companies([key], new_counts)
+        for label, new_jobs, errors in batches:
+            for e in errors:
+                print(f"  Error searching {label}: {e}")
+            if new_jobs:
+                print(f"[{time.strftime('%H:%M:%S')}] {len(new_jobs)} new at {label}")
+                alerter.notify(new_jobs)
+        alerter.advance_watermarks()
+        alerter.finish_run()
+        alerter.trim_dedupe_index(dedupe_days)
+        return sum(new_counts.values())
 
-        print("\n=== Example Broad Search Results ===")
-        for job in broad_final:
-            sal_txt = format_salary(job)
+    def on_error(key, e: Exception) -> None:
+        print(f"[daemon] poll of {key} failed: {e}")
+
+    while True:
+        try:
+            _, companies_f = alerter.leaderboard()
+            scheduler.sync(companies_f[:top_n] + [BROAD_SEARCH])
+        except Exception as e:  # keep the previous companies until the next refresh
+            print(f"[daemon] leaderboard refresh failed: {e}")
+        print(f"[daemon] polling {len(scheduler)} targets")
+        next_refresh = clock.time() + refresh
+        scheduler.run(poll, until=next_refresh, on_error=on_error)
+        clock.sleep(next_refresh - clock.time())
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    app = load_yaml("config/app.yaml")
+    rules = load_yaml("config/rules.yaml")
+    profile_index = None
+    if args.command == "profiles":
+        profiles_dir = app.get("profiles", {}).get("dir", "config/profiles")
+        profiles = load_profiles(profiles_dir)
+        if not profiles:
+            print(f"[profiles] no profiles found in {profiles_dir}")
+            return
+        print(f"[profiles] {len(profiles)} loaded from {profiles_dir}")
+        # Scrape and prefilter once, loosely enough for every profile
+        rules = union_rules(profiles)
+        profile_index = ProfileIndex(profiles, load_company_index())
+
+    print("job-alerter bootstrap OK")
+    print(f"- seed_mode: {app['runtime']['seed_mode']}")
+    print(f"- levels urls: {len(app['levels']['urls'])}")
+    print(
+        f"- include keywords: {rules['role_titles']['include_any'] + rules['job_descriptions']['include_any']}"
+    )
+
+    # Commands that never scrape skip the Alerter (and never import pandas)
+    if args.command == "leaderboard":
+        run_leaderboard(app)
+        return
+    if args.command == "filter":
+        run_filter(app, rules, days=args.days)
+        return
+    if args.command == "dry-run":
+        run_dry(app, rules)
+        return
+    if args.command == "trends":
+        run_trends(app, rules, days=args.days)
+        return
+
+    tape = open_tape(args)
+    if tape is not None and tape.replaying:
+        app = replay_config(app)
+        print(f"[replay] {len(tape)} recorded queries from {args.replay}")
+    alerter = Alerter(
+        app, rules, refresh=args.refresh, backfill=args.backfill, tape=tape
+    )
+    print(f"[store] {app['runtime']['db_path']}: {len(alerter.store)} jobs seen so far")
+    print(f"[blacklist] terms: {len(alerter.blacklist)}")
+    mc = app.get("metrics", {})
+    try:
+        if args.command == "daemon":
+            port = mc.get("port", 0)
+            if port:
+                server = serve(
+                    alerter.metrics.registry, mc.get("host", "127.0.0.1"), port
+                )
+                host, port = server.server_address[:2]
+                print(f"[metrics] serving http://{host}:{port}/metrics")
+            run_daemon(alerter)
+        elif profile_index is not None:
+            run_profiles(alerter, profile_index)
+        else:
+            run_once(alerter)
+
+    finally:
+        # Every scraped batch was recorded as it went through the pipeline
+        print(f"\n[store] {len(alerter.store)} jobs recorded")
+        window = alerter.window
+        if window is not None:
             print(
-                f" - {job.company:<22} | {job.title:<30} | {job.location:<20} | {sal_txt} | {job.url}"
+                f"[window] queries narrowed: {window.narrowed}"
+                f"  | full {window.max_hours}h: {window.full}"
             )
-
-    except Exception as e:
-        print(f"Error in broad search: {e}")
+        for site, planner in alerter.planners.items():
+            print(
+                f"[planner] {site} queries: {planner.issued}"
+                f" vs {planner.baseline} one-per-term"
+                f"  | saved: {planner.saved}  | split: {planner.splits}"
+            )
+        cache = alerter.cache
+        if cache is not None:
+            print(f"[cache] hits: {cache.hits}  | misses: {cache.misses}")
+        if tape is not None:
+            print(
+                f"[tape] recorded: {tape.recorded}  | replayed: {tape.replayed}"
+                f"  | {tape.dir}"
+            )
+        checkpoint = alerter.checkpoint
+        if checkpoint is not None and checkpoint.resumed:
+            print(
+                f"[checkpoint] queries resumed from the journal: {checkpoint.resumed}"
+            )
+        alerter.close()
+        report_path = mc.get("report_path")
+        if args.command != "daemon" and report_path:
+            alerter.metrics.write_report(report_path)
+            print(f"[metrics] run report written to {report_path}")
 
 
 if __name__ == "__main__":
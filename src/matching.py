@@ -0,0 +1,246 @@
+from __future__ import annotations
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Union
+from companies import Blacklist, as_blacklist
+from models import Job
+
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """
+    Build a regex alternation from a character trie of the terms.
+    Shared prefixes are factored out ("software engineer|software developer"
+    becomes "software (?:developer|engineer)"), so the regex engine walks each
+    text position once instead of retrying every keyword.
+    Optional groups are greedy, so a match is always the longest term at its start.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # terminal marker
+    return _node_regex(trie)
+
+
+def _node_regex(node: Dict) -> str:
+    branches = [
+        re.escape(ch) + _node_regex(child)
+        for ch, child in sorted(node.items())
+        if ch != ""
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return f"(?:{body})?"
+    return body
+
+
+_WORD_RE = re.compile(r"\w")
+
+
+def compile_keywords(
+    terms: Iterable[str], word_boundary: bool = False
+) -> Optional[Pattern[str]]:
+    """
+    Compile keywords into one lowercase pattern; None when there are no terms.
+
+    With word_boundary=True a term may not sit inside a larger word: "tx" still
+    matches "Austin, TX" but no longer matches "Ptx Labs". Only the ends of a term
+    that are word characters get a boundary check, so ".net" or "c++" still work.
+    """
+    lowered = sorted({t.lower() for t in terms})
+    if not lowered:
+        return None
+    if not word_boundary:
+        return re.compile(_trie_regex(lowered))
+
+    groups: Dict[tuple, List[str]] = {}
+    for t in lowered:
+        key = (
+            bool(t) and bool(_WORD_RE.match(t[0])),
+            bool(t) and bool(_WORD_RE.match(t[-1])),
+        )
+        groups.setdefault(key, []).append(t)
+
+    parts = []
+    for (starts_word, ends_word), group in sorted(groups.items()):
+        prefix = r"(?<!\w)" if starts_word else ""
+        suffix = r"(?!\w)" if ends_word else ""
+        parts.append(f"{prefix}(?:{_trie_regex(group)}){suffix}")
+    return re.compile("|".join(parts))
+
+
+# Below this many terms, one `in` scan per term (memchr-backed) beats a
+# regex that has to try a match at every text position.
+SUBSTRING_SCAN_MAX_TERMS = 32
+
+
+class _Substrings:
+    """Small keyword set; same `search` contract as a compiled pattern."""
+
+    __slots__ = ("terms", "pattern")
+
+    def __init__(self, terms: List[str]):
+        self.terms = tuple(terms)
+        self.pattern = _trie_regex(self.terms)  # for whole-column searches
+
+    def search(self, text: str):
+        return True if any(t in text for t in self.terms) else None
+
+
+def _compile_matcher(terms: Iterable[str], word_boundary: bool):
+    lowered = sorted({t.lower() for t in terms})
+    if not lowered:
+        return None
+    if not word_boundary and len(lowered) <= SUBSTRING_SCAN_MAX_TERMS:
+        return _Substrings(lowered)
+    return compile_keywords(lowered, word_boundary)
+
+
+class KeywordFilter:
+    """
+    Include/exclude keyword sets compiled once.
+    Same semantics as the matches_* helpers in targets: pass if any include term
+    is present (or there are none) and no exclude term is present.
+    Large sets scan the lowercased text once through a trie regex.
+    """
+
+    __slots__ = ("include", "exclude", "word_boundary")
+
+    def __init__(
+        self,
+        include_any: Iterable[str] = (),
+        exclude_any: Iterable[str] = (),
+        word_boundary: bool = False,
+    ):
+        self.include = _compile_matcher(include_any, word_boundary)
+        self.exclude = _compile_matcher(exclude_any, word_boundary)
+        self.word_boundary = word_boundary
+
+    def matches(self, text: str) -> bool:
+        text = text.lower()
+        if self.include is not None and self.include.search(text) is None:
+            return False
+        if self.exclude is not None and self.exclude.search(text) is not None:
+            return False
+        return True
+
+    def matches_column(self, texts):
+        """
+        matches() over a pyarrow string array, as a boolean array (None when
+        every row passes). Plain terms run as one RE2 search over the whole
+        column; word-boundary patterns need lookarounds, which RE2 lacks, so
+        those fall back to a search per row.
+        """
+        import pyarrow.compute as pc
+
+        lowered = pc.utf8_lower(texts)
+        keep = None
+        if self.include is not None:
+            keep = self._search_column(self.include, lowered)
+        if self.exclude is not None:
+            passed = pc.invert(self._search_column(self.exclude, lowered))
+            keep = passed if keep is None else pc.and_(keep, passed)
+        return keep
+
+    def _search_column(self, matcher, lowered):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if self.word_boundary:
+            hits = [matcher.search(text) is not None for text in lowered.to_pylist()]
+            return pa.array(hits, pa.bool_())
+        return pc.match_substring_regex(lowered, matcher.pattern)
+
+
+def _description_text(job: Job) -> str:
+    # Use actual job description if available, otherwise fall back to title + company
+    return job.description or f"{job.title} {job.company}"
+
+
+class CompiledRules:
+    """rules.yaml compiled into title, description and location filters."""
+
+    __slots__ = ("title", "description", "location")
+
+    def __init__(
+        self, title: KeywordFilter, description: KeywordFilter, location: KeywordFilter
+    ):
+        self.title = title
+        self.description = description
+        self.location = location
+
+    def matches(self, job: Job) -> bool:
+        # Description last: it is the longest text and may need decompressing
+        return (
+            self.title.matches(job.title)
+            and self.location.matches(job.location)
+            and self.description.matches(_description_text(job))
+        )
+
+
+def _section_filter(section: Dict, word_boundary: Optional[bool]) -> KeywordFilter:
+    if word_boundary is None:
+        word_boundary = bool(section.get("word_boundary", False))
+    return KeywordFilter(
+        section.get("include_any") or [],
+        section.get("exclude_any") or [],
+        word_boundary=word_boundary,
+    )
+
+
+def compile_rules(rules: Dict, word_boundary: Optional[bool] = None) -> CompiledRules:
+    """
+    Compile a rules.yaml dict. Each section may set `word_boundary: true`;
+    passing word_boundary here overrides every section.
+    """
+    return CompiledRules(
+        title=_section_filter(rules.get("role_titles", {}), word_boundary),
+        description=_section_filter(rules.get("job_descriptions", {}), word_boundary),
+        location=_section_filter(rules.get("locations", {}), word_boundary),
+    )
+
+
+class Prefilter:
+    """
+    The cheap predicates of a rule set: company blacklist, title and location.
+    Used to drop scraped rows before Job objects are built; the description
+    rules still run later in filter_jobs. Verdicts are identical to
+    filter_job_companies + filter_jobs for these fields.
+    """
+
+    __slots__ = ("title", "location", "blacklist")
+
+    def __init__(
+        self, rules: CompiledRules, blacklist: Union[Blacklist, Iterable[str]] = ()
+    ):
+        self.title = rules.title
+        self.location = rules.location
+        self.blacklist = as_blacklist(blacklist) if blacklist else None
+
+    def keep(self, title: str, company: str, location: str) -> bool:
+        return (
+            (self.blacklist is None or not self.blacklist.blocked(company))
+            and self.title.matches(title)
+            and self.location.matches(location)
+        )
+
+    def keep_column(self, titles, companies, locations):
+        """
+        keep() over pyarrow string arrays of one frame's titles, companies and
+        locations, as a boolean array (None when every row passes).
+        """
+        import pyarrow.compute as pc
+
+        masks = [
+            self.title.matches_column(titles),
+            self.location.matches_column(locations),
+        ]
+        if self.blacklist is not None:
+            masks.append(pc.invert(self.blacklist.blocked_column(companies)))
+        keep = None
+        for mask in masks:
+            if mask is not None:
+                keep = mask if keep is None else pc.and_(keep, mask)
+        return keep
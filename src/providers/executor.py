@@ -0,0 +1,166 @@
+# src/providers/executor.py
+from __future__ import annotations
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+K = TypeVar("K")
+
+_LANE_DONE = object()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills `rate` tokens per second up to `capacity`.
+    Callers that find the bucket empty reserve their token and sleep off the
+    deficit outside the lock, so waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take `tokens`, blocking until available. Returns seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class SiteRateLimiter:
+    """
+    One shared TokenBucket per site, e.g. "indeed".
+    `per_domain_sleep` is the steady-state gap between calls to the same site
+    (runtime.per_domain_sleep in app.yaml); 0 disables limiting. `overrides`
+    gives individual sites their own gap.
+    """
+
+    def __init__(
+        self,
+        per_domain_sleep: float,
+        burst: float = 1.0,
+        overrides: Optional[Dict[str, float]] = None,
+    ):
+        self.per_domain_sleep = float(per_domain_sleep or 0)
+        self.burst = burst
+        self.overrides = dict(overrides or {})  # site -> its own per_domain_sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, site: str) -> TokenBucket:
+        with self._lock:
+            b = self._buckets.get(site)
+            if b is None:
+                gap = float(self.overrides.get(site, self.per_domain_sleep) or 0)
+                rate = 1.0 / gap if gap > 0 else 0
+                b = self._buckets[site] = TokenBucket(rate, self.burst)
+            return b
+
+    def acquire(self, site: str) -> float:
+        return self.bucket(site).acquire()
+
+
+def run_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 4,
+) -> Iterator[Tuple[T, Optional[R], Optional[Exception]]]:
+    """
+    Run fn over items on a thread pool and yield (item, result, error) in input
+    order, whatever order the calls finish in. At most 2 * max_workers calls are
+    in flight, so a slow consumer never piles up unbounded results.
+    """
+    max_workers = max(1, int(max_workers))
+    window = 2 * max_workers
+    pending: deque = deque()
+    it = iter(items)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for item in it:
+            pending.append((item, pool.submit(fn, item)))
+            if len(pending) >= window:
+                yield _settle(*pending.popleft())
+        while pending:
+            yield _settle(*pending.popleft())
+
+
+def _settle(item, future) -> Tuple:
+    try:
+        return item, future.result(), None
+    except Exception as e:
+        return item, None, e
+
+
+def run_lanes(
+    lanes: Dict[K, Iterable[R]], buffer: int = 4
+) -> Iterator[Tuple[K, Optional[R], Optional[Exception]]]:
+    """
+    Drain several iterables in parallel, one thread per lane, and yield
+    (lane, item, error) in completion order, so a slow lane never holds up the
+    others. A lane runs at most `buffer` items ahead of the consumer. A lane
+    that raises yields (lane, None, error) once and stops; the rest carry on.
+    Closing the generator early stops every lane at its next item.
+    """
+    out: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    slots = {lane: threading.Semaphore(max(1, buffer)) for lane in lanes}
+
+    def drain(lane: K, items: Iterable[R]) -> None:
+        it = iter(items)
+        try:
+            for item in it:
+                while not slots[lane].acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                out.put((lane, item, None))
+        except Exception as e:
+            out.put((lane, None, e))
+        finally:
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+            out.put((lane, _LANE_DONE, None))
+
+    for lane, items in lanes.items():
+        threading.Thread(
+            target=drain, args=(lane, items), name=f"lane-{lane}", daemon=True
+        ).start()
+    try:
+        live = len(lanes)
+        while live:
+            lane, item, error = out.get()
+            if item is _LANE_DONE:
+                live -= 1
+                continue
+            if error is None:
+                slots[lane].release()
+            yield lane, item, error
+    finally:
+        stop.set()
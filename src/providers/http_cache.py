@@ -0,0 +1,97 @@
+# src/providers/http_cache.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    parser: str  # which parser produced `rows`
+    rows: List[Dict]
+    body_path: Path
+
+    def body(self) -> str:
+        return self.body_path.read_text(encoding="utf-8")
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class PageCache:
+    """
+    On-disk cache of fetched pages: the response body, its validators
+    (ETag / Last-Modified) and the rows parsed from it, one pair of files per URL.
+    Files are replaced atomically, so a crash never leaves a half-written entry.
+    """
+
+    def __init__(self, directory: str):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.dir / f"{key}.json", self.dir / f"{key}.html"
+
+    def load(self, url: str) -> Optional[CachedPage]:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not body_path.exists():
+            return None
+        return CachedPage(
+            url=url,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            parser=meta.get("parser", ""),
+            rows=meta.get("rows", []),
+            body_path=body_path,
+        )
+
+    def save(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        parser: str,
+        rows: List[Dict],
+        body: Optional[str] = None,
+    ) -> None:
+        """Store rows and validators; body=None keeps the stored body."""
+        meta_path, body_path = self._paths(url)
+        if body is not None:
+            _atomic_write(body_path, body)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "parser": parser,
+            "rows": rows,
+        }
+        _atomic_write(meta_path, json.dumps(meta))
@@ -1,8 +1,24 @@
 from __future__ import annotations
-from typing import Iterable, List
+from contextlib import nullcontext
+from typing import Iterable, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from jobspy import scrape_jobs
 from models import Job, SalaryRange
+from checkpoint import Checkpoint
+from matching import Prefilter
+from metrics import Metrics, timed
+from providers.executor import SiteRateLimiter, run_ordered
+from providers.query_plan import QueryPlanner, build_query
+from providers.scrape_cache import ScrapeCache, cache_key
+from providers.scrape_tape import ScrapeTape
+from providers.scrape_window import ScrapeWindow, window_key
+
+
+# From this many rows, the prefilter runs on whole Arrow columns
+# (Prefilter.keep_column); below it, per-row keep() beats the kernels' fixed cost
+PREFILTER_COLUMN_MIN_ROWS = 256
 
 
 def _coerce_int(x):
@@ -12,14 +28,154 @@ def _coerce_int(x):
         return None
 
 
-def _df_to_jobs(df: pd.DataFrame, source_site: str) -> List[Job]:
-    jobs: List[Job] = []
+def _column(df: pd.DataFrame, name: str) -> list:
+    """Column values as Python objects; all None if the column is missing."""
+    if name not in df.columns:
+        return [None] * len(df)
+    return df[name].tolist()
+
+
+def _int_column(df: pd.DataFrame, name: str) -> List[Optional[int]]:
+    """
+    Column coerced like _coerce_int, vectorized for numeric dtypes:
+    NaN/inf -> None, floats truncate toward zero.
+    """
+    if name not in df.columns:
+        return [None] * len(df)
+    col = df[name]
+    kind = getattr(col.dtype, "kind", "O")
+    if kind in "iu" and isinstance(col.dtype, np.dtype):
+        return col.tolist()
+    if kind == "f" and isinstance(col.dtype, np.dtype):
+        arr = col.to_numpy(dtype="float64")
+        out = np.full(len(arr), None, dtype=object)
+        ok = np.isfinite(arr) & (np.abs(arr) < 2**63)
+        out[ok] = np.trunc(arr[ok]).astype(np.int64).tolist()
+        # Beyond int64 (never real salaries): fall back to Python ints
+        for i in np.flatnonzero(np.isfinite(arr) & ~ok):
+            out[i] = int(arr[i])
+        return out.tolist()
+    return [_coerce_int(x) for x in col.tolist()]
+
+
+def _is_missing(x) -> bool:
+    return x is None or x is pd.NaT or (isinstance(x, float) and x != x)
+
+
+def _str_column(df: pd.DataFrame, name: str) -> List[str]:
+    return [str(x or "").strip() for x in _column(df, name)]
+
+
+def _prefilter_mask(
+    prefilter: Prefilter, titles: List[str], companies: List[str], locations: List[str]
+) -> Optional[np.ndarray]:
+    """Rows prefilter.keep() passes, as a bool array; None when all pass."""
+    if len(titles) < PREFILTER_COLUMN_MIN_ROWS:
+        return np.fromiter(
+            map(prefilter.keep, titles, companies, locations),
+            dtype=bool,
+            count=len(titles),
+        )
+    mask = prefilter.keep_column(
+        pa.array(titles, pa.string()),
+        pa.array(companies, pa.string()),
+        pa.array(locations, pa.string()),
+    )
+    return None if mask is None else mask.to_numpy(zero_copy_only=False)
+
+
+def _df_to_jobs(
+    df: pd.DataFrame, source_site: str, prefilter: Optional[Prefilter] = None
+) -> List[Job]:
+    """
+    Convert a JobSpy DataFrame to Jobs one column at a time: each column is
+    normalized in a single pass, then the columns are zipped into objects.
+    Output matches _df_to_jobs_rowwise field for field, except that missing
+    descriptions and dates (None/NaN) always become None; the row-wise path
+    crashed on a NaN description and kept NaN dates.
+
+    With a prefilter, rows failing the blacklist/title/location predicates are
+    dropped from the frame first, so their descriptions are never normalized
+    or copied into objects. Large frames run the predicates on whole columns
+    (see Prefilter.keep_column).
+    """
     if df is None or df.empty:
-        return jobs
+        return []
 
     # JobSpy common columns (as of writing):
     # title, company, location, job_url, date_posted, is_remote,
     # salary_min, salary_max, salary_period, salary_currency, description
+    titles = _str_column(df, "title")
+    companies = _str_column(df, "company")
+    locations = _str_column(df, "location")
+    if prefilter is not None:
+        keep = _prefilter_mask(prefilter, titles, companies, locations)
+        if keep is not None and not keep.all():
+            idx = np.flatnonzero(keep)
+            df = df.iloc[idx]
+            titles = [titles[i] for i in idx]
+            companies = [companies[i] for i in idx]
+            locations = [locations[i] for i in idx]
+            if df.empty:
+                return []
+
+    urls = _str_column(df, "job_url")
+    columns = zip(
+        titles,
+        companies,
+        locations,
+        urls,
+        [None if _is_missing(x) else (x or None) for x in _column(df, "date_posted")],
+        _int_column(df, "salary_min"),
+        _int_column(df, "salary_max"),
+        [x or "USD" for x in _column(df, "salary_currency")],
+        [x or "year" for x in _column(df, "salary_period")],
+        [
+            # Missing descriptions arrive as NaN in string columns
+            (x.strip() or None) if isinstance(x, str) else None
+            for x in _column(df, "description")
+        ],
+        [u or None for u in urls],
+    )
+    return [
+        Job(
+            title=title,
+            company=company,
+            location=location,
+            url=url,
+            source=source_site,
+            listed_at=listed_at,
+            salary=SalaryRange(
+                min=sal_min, max=sal_max, currency=currency, periodicity=period
+            ),
+            description=description,
+            req_id=req_id,
+        )
+        for (
+            title,
+            company,
+            location,
+            url,
+            listed_at,
+            sal_min,
+            sal_max,
+            currency,
+            period,
+            description,
+            req_id,
+        ) in columns
+    ]
+
+
+def _df_to_jobs_rowwise(df: pd.DataFrame, source_site: str) -> List[Job]:
+    """
+    Original row-by-row conversion, kept as the reference for _df_to_jobs
+    in tests and benchmarks/bench_df_to_jobs.py.
+    """
+    jobs: List[Job] = []
+    if df is None or df.empty:
+        return jobs
+
     for _, row in df.iterrows():
         salary = SalaryRange(
             min=_coerce_int(row.get("salary_min")),
@@ -43,6 +199,177 @@ def _df_to_jobs(df: pd.DataFrame, source_site: str) -> List[Job]:
     return jobs
 
 
+def _fetch_frame(
+    site: str,
+    search_term: str,
+    *,
+    location: str,
+    radius_miles: int,
+    results_wanted: int,
+    hours_old: int,
+    limiter: Optional[SiteRateLimiter],
+    cache: Optional[ScrapeCache],
+    window: Optional[ScrapeWindow] = None,
+    metrics: Optional[Metrics] = None,
+    tape: Optional[ScrapeTape] = None,
+) -> pd.DataFrame:
+    wkey = window_key(site, search_term, location, radius_miles)
+    if window is not None:
+        hours_old = window.hours_old(wkey)
+    key = cache_key(
+        site, search_term, location, radius_miles, hours_old, results_wanted
+    )
+    df = None
+    if cache is not None:
+        df = cache.get(key)
+        if metrics is not None:
+            result = "miss" if df is None else "hit"
+            metrics.scrape_cache.inc(site=site, result=result)
+    if df is None and tape is not None and tape.replaying:
+        # Stands in for scrape_jobs: no network, no rate limit
+        df = tape.load(site, search_term, location, radius_miles, results_wanted)
+    elif df is None:
+        if limiter is not None:
+            limiter.acquire(site)
+        scrape = nullcontext() if metrics is None else metrics.scrape(site, search_term)
+        with scrape:
+            df = scrape_jobs(
+                site_name=site,
+                search_term=search_term,
+                location=location,
+                results_wanted=int(results_wanted),
+                hours_old=int(hours_old),
+                distance=int(radius_miles),
+                country_indeed="USA",  # Adjust if outside US
+                verbose=False,
+            )
+        if cache is not None:
+            cache.put(key, df)
+    if tape is not None and not tape.replaying:
+        tape.save(site, search_term, location, radius_miles, results_wanted, df)
+    if metrics is not None:
+        rows = 0 if df is None else len(df)
+        metrics.scrape_rows.inc(rows, site=site, query=search_term)
+    if window is not None:
+        window.succeeded(wkey)
+    return df
+
+
+def scrape_query(
+    site: str,
+    search_term: str,
+    *,
+    location: str,
+    radius_miles: int = 50,
+    results_wanted: int = 50,
+    hours_old: int = 168,
+    limiter: Optional[SiteRateLimiter] = None,
+    cache: Optional[ScrapeCache] = None,
+    window: Optional[ScrapeWindow] = None,
+    prefilter: Optional[Prefilter] = None,
+    metrics: Optional[Metrics] = None,
+    tape: Optional[ScrapeTape] = None,
+) -> List[Job]:
+    """
+    One JobSpy call. Served from the cache when a fresh entry exists; otherwise
+    waits on the site's token bucket (if a limiter is given) and scrapes.
+    The cache holds the raw frame; a prefilter only affects the converted Jobs.
+    With a window, hours_old is narrowed to the time since the query last succeeded.
+    A recording tape saves every frame; a replaying one stands in for scrape_jobs.
+    """
+    df = _fetch_frame(
+        site,
+        search_term,
+        location=location,
+        radius_miles=radius_miles,
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        limiter=limiter,
+        cache=cache,
+        window=window,
+        metrics=metrics,
+        tape=tape,
+    )
+    with timed(metrics, "convert"):
+        return _df_to_jobs(df, site, prefilter)
+
+
+def scrape_terms(
+    site: str,
+    terms: Tuple[str, ...],
+    company: Optional[str] = None,
+    *,
+    planner: QueryPlanner,
+    location: str,
+    radius_miles: int = 50,
+    results_wanted: int = 50,
+    hours_old: int = 168,
+    limiter: Optional[SiteRateLimiter] = None,
+    cache: Optional[ScrapeCache] = None,
+    window: Optional[ScrapeWindow] = None,
+    prefilter: Optional[Prefilter] = None,
+    metrics: Optional[Metrics] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    tape: Optional[ScrapeTape] = None,
+) -> List[Job]:
+    """
+    One combined query for a group of role terms (see build_query). A combined
+    query that comes back with results_wanted rows was probably truncated, so
+    the group is split in half and each half searched, recursively; the
+    truncated results are kept too; dedupe downstream drops the overlap.
+    With a checkpoint, a query an interrupted run already finished is served
+    from its journal, and a finished query is journaled before returning.
+    """
+    query = build_query(terms, company)
+    ckey = window_key(site, query, location, radius_miles)
+    if checkpoint is not None:
+        done = checkpoint.get(ckey)
+        if done is not None:
+            return done
+    df = _fetch_frame(
+        site,
+        query,
+        location=location,
+        radius_miles=radius_miles,
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        limiter=limiter,
+        cache=cache,
+        window=window,
+        metrics=metrics,
+        tape=tape,
+    )
+    split = len(terms) > 1 and df is not None and len(df) >= results_wanted
+    planner.ran(split)
+    with timed(metrics, "convert"):
+        jobs = _df_to_jobs(df, site, prefilter)
+    if split:
+        mid = len(terms) // 2
+        for half in (terms[:mid], terms[mid:]):
+            jobs.extend(
+                scrape_terms(
+                    site,
+                    half,
+                    company,
+                    planner=planner,
+                    location=location,
+                    radius_miles=radius_miles,
+                    results_wanted=results_wanted,
+                    hours_old=hours_old,
+                    limiter=limiter,
+                    cache=cache,
+                    window=window,
+                    prefilter=prefilter,
+                    metrics=metrics,
+                    tape=tape,
+                    checkpoint=checkpoint,
+                )
+            )
+    if checkpoint is not None:
+        checkpoint.put(ckey, jobs)
+    return jobs
+
+
 def search_company_roles(
     site: str,
     company: str,
@@ -52,30 +379,169 @@ def search_company_roles(
     radius_miles: int = 50,
     results_wanted: int = 50,
     hours_old: int = 168,
+    limiter: Optional[SiteRateLimiter] = None,
+    cache: Optional[ScrapeCache] = None,
+    window: Optional[ScrapeWindow] = None,
+    prefilter: Optional[Prefilter] = None,
+    planner: Optional[QueryPlanner] = None,
+    metrics: Optional[Metrics] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    tape: Optional[ScrapeTape] = None,
 ) -> List[Job]:
     """
     Search roles for a specific company using JobSpy.
-    Strategy: run one search per role term with a 'company' filter where possible.
-    Indeed does not expose a clean company-only param, so we include company in search term.
+    Indeed does not expose a clean company-only param, so we include company in
+    the search term. Without a planner that is one search per role term; a
+    QueryPlanner packs the terms into OR-queries where the site supports it.
     """
+    terms = list(role_terms)
+    planner = planner or QueryPlanner(site, max_terms=1)
+    planner.planned(terms)
     jobs: List[Job] = []
-    for term in role_terms:
-        # Include company name in the search query to bias results
-        query = f"{term} {company}"
-        df = scrape_jobs(
-            site_name=site,
-            search_term=query,
-            location=location,
-            results_wanted=int(results_wanted),
-            hours_old=int(hours_old),
-            distance=int(radius_miles),
-            country_indeed="USA",  # Adjust if outside US
-            verbose=False,
+    for group in planner.groups(terms):
+        jobs.extend(
+            scrape_terms(
+                site,
+                group,
+                company,
+                planner=planner,
+                location=location,
+                radius_miles=radius_miles,
+                results_wanted=results_wanted,
+                hours_old=hours_old,
+                limiter=limiter,
+                cache=cache,
+                window=window,
+                prefilter=prefilter,
+                metrics=metrics,
+                tape=tape,
+                checkpoint=checkpoint,
+            )
         )
-        jobs.extend(_df_to_jobs(df, site))
     return jobs
 
 
+def search_companies(
+    site: str,
+    companies: Iterable[str],
+    role_terms: Iterable[str],
+    *,
+    location: str,
+    radius_miles: int = 50,
+    results_wanted: int = 50,
+    hours_old: int = 168,
+    max_workers: int = 4,
+    limiter: Optional[SiteRateLimiter] = None,
+    cache: Optional[ScrapeCache] = None,
+    window: Optional[ScrapeWindow] = None,
+    prefilter: Optional[Prefilter] = None,
+    planner: Optional[QueryPlanner] = None,
+    metrics: Optional[Metrics] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    tape: Optional[ScrapeTape] = None,
+) -> Iterator[Tuple[str, List[Job], List[Exception]]]:
+    """
+    Concurrent search_company_roles over many companies.
+    Fans out every (company, term group) pair on a thread pool; all calls share
+    the limiter's per-site token bucket. Yields (company, jobs, errors) in input
+    order, with each company's jobs in role_terms order, so output is stable.
+    A failed group is reported in errors without dropping the company's others.
+    """
+    terms = list(role_terms)
+    planner = planner or QueryPlanner(site, max_terms=1)
+    groups = planner.groups(terms)
+    pairs: List[Tuple[str, Tuple[str, ...]]] = []
+    for company in companies:
+        planner.planned(terms)
+        pairs.extend((company, group) for group in groups)
+
+    def run(pair: Tuple[str, Tuple[str, ...]]) -> List[Job]:
+        company, group = pair
+        return scrape_terms(
+            site,
+            group,
+            company,
+            planner=planner,
+            location=location,
+            radius_miles=radius_miles,
+            results_wanted=results_wanted,
+            hours_old=hours_old,
+            limiter=limiter,
+            cache=cache,
+            window=window,
+            prefilter=prefilter,
+            metrics=metrics,
+            tape=tape,
+            checkpoint=checkpoint,
+        )
+
+    current: Optional[str] = None
+    jobs: List[Job] = []
+    errors: List[Exception] = []
+    for (company, _), found, error in run_ordered(run, pairs, max_workers):
+        if company != current:
+            if current is not None:
+                yield current, jobs, errors
+            current, jobs, errors = company, [], []
+        if error is not None:
+            errors.append(error)
+        elif found:
+            jobs.extend(found)
+    if current is not None:
+        yield current, jobs, errors
+
+
+def search_terms(
+    site: str,
+    role_terms: Iterable[str],
+    *,
+    location: str,
+    radius_miles: int = 50,
+    results_wanted: int = 50,
+    hours_old: int = 168,
+    max_workers: int = 1,
+    limiter: Optional[SiteRateLimiter] = None,
+    cache: Optional[ScrapeCache] = None,
+    window: Optional[ScrapeWindow] = None,
+    prefilter: Optional[Prefilter] = None,
+    planner: Optional[QueryPlanner] = None,
+    metrics: Optional[Metrics] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    tape: Optional[ScrapeTape] = None,
+) -> Iterator[Tuple[str, List[Job], List[Exception]]]:
+    """
+    Broad search (secondary list) independent of the Levels companies.
+    Yields (query, jobs, errors) per planned query in input order, as each finishes.
+    """
+    terms = list(role_terms)
+    planner = planner or QueryPlanner(site, max_terms=1)
+    planner.planned(terms)
+
+    def run(group: Tuple[str, ...]) -> List[Job]:
+        return scrape_terms(
+            site,
+            group,
+            planner=planner,
+            location=location,
+            radius_miles=radius_miles,
+            results_wanted=results_wanted,
+            hours_old=hours_old,
+            limiter=limiter,
+            cache=cache,
+            window=window,
+            prefilter=prefilter,
+            metrics=metrics,
+            tape=tape,
+            checkpoint=checkpoint,
+        )
+
+    for group, found, error in run_ordered(run, planner.groups(terms), max_workers):
+        if error is not None:
+            yield build_query(group), [], [error]
+        else:
+            yield build_query(group), found or [], []
+
+
 def search_by_query(
     site: str,
     role_terms: str,
@@ -83,21 +549,39 @@ def search_by_query(
     radius_miles: int = 50,
     results_wanted: int = 50,
     hours_old: int = 168,
+    max_workers: int = 1,
+    limiter: Optional[SiteRateLimiter] = None,
+    cache: Optional[ScrapeCache] = None,
+    window: Optional[ScrapeWindow] = None,
+    prefilter: Optional[Prefilter] = None,
+    planner: Optional[QueryPlanner] = None,
+    metrics: Optional[Metrics] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    tape: Optional[ScrapeTape] = None,
 ) -> List[Job]:
     """
     Broad search (secondary list) independent of the Levels companies.
+    Collects search_terms into one list; raises the first failed query's error.
     """
     jobs: List[Job] = []
-    for term in role_terms:
-        df = scrape_jobs(
-            site_name=site,
-            search_term=term,
-            location=location,
-            results_wanted=int(results_wanted),
-            hours_old=int(hours_old),
-            distance=int(radius_miles),
-            country_indeed="USA",  # Adjust if outside US
-            verbose=False,
-        )
-        jobs.extend(_df_to_jobs(df, site))
+    for _, found, errors in search_terms(
+        site,
+        role_terms,
+        location=location,
+        radius_miles=radius_miles,
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        max_workers=max_workers,
+        limiter=limiter,
+        cache=cache,
+        window=window,
+        prefilter=prefilter,
+        planner=planner,
+        metrics=metrics,
+        tape=tape,
+        checkpoint=checkpoint,
+    ):
+        if errors:
+            raise errors[0]
+        jobs.extend(found)
     return jobs
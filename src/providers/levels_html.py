@@ -1,9 +1,11 @@
 # src/providers/levels_html.py
 from __future__ import annotations
 import re
-from typing import List, Dict, Tuple
+from typing import AbstractSet, Any, List, Dict, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
+from providers.executor import run_ordered
+from providers.http_cache import PageCache
 
 
 def _norm_text(node) -> str:
@@ -36,10 +38,20 @@ def _parse_money_to_int(s: str | None) -> int | None:
     return int(digits) if digits else None
 
 
-def parse_leaderboard_table(html: str) -> List[Dict]:
+PARSERS = ("html5lib", "lxml")
+
+
+def parse_leaderboard_table(
+    html: str, parser: str = "html5lib", targeted: bool = False
+) -> List[Dict]:
     """
     Parse the Levels leaderboard table structure you shared.
 
+    parser="html5lib" builds a BeautifulSoup tree (slow, most forgiving);
+    parser="lxml" walks an lxml tree in C with one pass per row and returns
+    the same rows. targeted=True (lxml only) parses just the #tableContainer
+    table out of the page instead of the whole document.
+
     Returns a list of rows:
       {
         "rank": int,
@@ -51,6 +63,13 @@ def parse_leaderboard_table(html: str) -> List[Dict]:
         "comp_bonus": int|None,
       }
     """
+    if parser == "lxml":
+        return _parse_leaderboard_lxml(html, targeted)
+    if parser != "html5lib":
+        raise ValueError(
+            f"unknown leaderboard parser: {parser!r} (use one of {PARSERS})"
+        )
+
     soup = BeautifulSoup(html, "html5lib")
 
     container = soup.select_one("#tableContainer") or soup
@@ -162,18 +181,278 @@ def parse_leaderboard_table(html: str) -> List[Dict]:
     return rows
 
 
+# --- lxml backend ---------------------------------------------------------
+
+_id_attr_re = re.compile(r"""\bid\s*=\s*["']?$""")
+_COMP_INPUTS = ("total-comp", "base-salary", "stock-grant", "yearly-bonus")
+
+
+def _table_fragment(html: str) -> str | None:
+    """Slice the #tableContainer element's table out of the raw page."""
+    # str.find is memchr-fast; a regex over the whole page is not
+    pos = html.find("tableContainer")
+    while pos >= 0 and not (
+        _id_attr_re.search(html, max(0, pos - 16), pos)
+        and not html[pos + 14 : pos + 15].isalnum()
+    ):
+        pos = html.find("tableContainer", pos + 1)
+    if pos < 0:
+        return None
+    start = html.rfind("<", 0, pos)
+    end = html.find("</table>", pos)
+    if start < 0 or end < 0:
+        return None
+    return html[start : end + len("</table>")]
+
+
+def _lx_text(node) -> str:
+    """Same text as _norm_text: stripped text nodes joined by spaces, no comments."""
+    parts: List[str] = []
+
+    def walk(el):
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            if isinstance(child.tag, str) and child.tag not in ("script", "style"):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    if node is not None:
+        walk(node)
+    return " ".join(p for p in (p.strip() for p in parts) if p)
+
+
+def _lx_classes(el) -> set:
+    return set(el.get("class", "").split())
+
+
+def _lx_first(node, tag: str | None = None, classes: AbstractSet[str] = frozenset()):
+    """First descendant (not node itself) with tag and all of classes."""
+    for el in node.iterdescendants(tag) if tag else node.iterdescendants():
+        if isinstance(el.tag, str) and classes <= _lx_classes(el):
+            return el
+    return None
+
+
+def _lx_rows(doc) -> List:
+    container = doc.get_element_by_id("tableContainer", None)
+    if container is None:
+        container = doc
+    table = _lx_first(container, "table")
+    if table is None:
+        table = _lx_first(doc, "table")
+    if table is None:
+        return []
+    tbody = _lx_first(table, "tbody")
+    if tbody is not None:
+        return list(tbody.iterdescendants("tr"))
+    # html5lib wraps loose <tr>s in an implied <tbody>; lxml leaves them in place
+    return [
+        tr
+        for tr in table.iterdescendants("tr")
+        if tr.getparent().tag not in ("thead", "tfoot")
+    ]
+
+
+def _parse_leaderboard_lxml(html: str, targeted: bool = False) -> List[Dict]:
+    from lxml import html as lxml_html
+
+    if targeted:
+        html = _table_fragment(html) or html
+    if not html or not html.strip():
+        return []
+    try:
+        doc = lxml_html.document_fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        doc = lxml_html.document_fromstring(html.encode("utf-8"))
+
+    rows: List[Dict] = []
+    for idx, tr in enumerate(_lx_rows(doc)):
+        tds = list(tr.iterdescendants("td"))
+        if not tds:
+            continue
+
+        company_td = None
+        title_td = None
+        for td in tds:
+            classes = _lx_classes(td)
+            if company_td is None and "company-data-column" in classes:
+                company_td = td
+            if title_td is None and {"d-none", "d-sm-table-cell"} <= classes:
+                title_td = td
+
+        if company_td is not None:
+            strong = _lx_first(company_td, "strong")
+            company = _lx_text(strong if strong is not None else company_td)
+        else:
+            company = _lx_text(tds[1]) if len(tds) >= 2 else ""
+
+        if title_td is not None:
+            title = _lx_text(title_td)
+        else:
+            title = _lx_text(tds[2]) if len(tds) >= 3 else ""
+
+        # One pass over the comp cell: hidden inputs plus the text fallbacks
+        last_td = tds[-1]
+        total_div = None
+        bsb_div = None
+        inputs: Dict[str, Any] = {}
+        for el in last_td.iterdescendants():
+            if not isinstance(el.tag, str):
+                continue
+            classes = _lx_classes(el)
+            if total_div is None and "total-comp-number" in classes:
+                total_div = el
+            if bsb_div is None and "base-stock-bonus" in classes:
+                bsb_div = el
+            if el.tag == "input":
+                for name in _COMP_INPUTS:
+                    if name in classes and name not in inputs:
+                        inputs[name] = el
+
+        comp_total_txt = _lx_text(total_div if total_div is not None else last_td)
+        values: Dict[str, int | None] = {}
+        for name in _COMP_INPUTS:
+            inp = inputs.get(name)
+            value = None
+            if inp is not None and "value" in inp.attrib:
+                try:
+                    value = int(inp.get("value"))
+                except Exception:
+                    value = None
+            values[name] = value
+
+        comp_total = values["total-comp"]
+        if comp_total is None:
+            comp_total = _parse_money_to_int(comp_total_txt)
+        comp_base = values["base-salary"]
+        comp_stock = values["stock-grant"]
+        comp_bonus = values["yearly-bonus"]
+
+        # If hidden inputs missing, try parsing "Base | Stock | Bonus" text
+        if comp_base is None or comp_stock is None or comp_bonus is None:
+            if bsb_div is not None:
+                parts = [p.strip() for p in _lx_text(bsb_div).split("|")]
+                if len(parts) >= 3:
+                    base, stock, bonus = parts[0], parts[1], parts[2]
+                    if comp_base is None:
+                        comp_base = _parse_money_to_int(base)
+                    if comp_stock is None:
+                        comp_stock = _parse_money_to_int(stock)
+                    if comp_bonus is None:
+                        comp_bonus = _parse_money_to_int(bonus)
+
+        rows.append(
+            {
+                "rank": idx + 1,
+                "company": company,
+                "title": title,
+                "comp_total": comp_total,
+                "comp_base": comp_base,
+                "comp_stock": comp_stock,
+                "comp_bonus": comp_bonus,
+            }
+        )
+
+    rows.sort(key=lambda r: r.get("rank", 100))
+    return rows
+
+
+def make_session(user_agent: str, pool_size: int = 8) -> requests.Session:
+    """
+    Session with a keep-alive connection pool, shared across leaderboard fetches.
+    pool_size should be at least the fetch concurrency.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = user_agent
+    return session
+
+
+_sessions: Dict[str, requests.Session] = {}
+
+
+def _shared_session(user_agent: str) -> requests.Session:
+    if user_agent not in _sessions:
+        _sessions[user_agent] = make_session(user_agent)
+    return _sessions[user_agent]
+
+
+def fetch_leaderboard(
+    url: str,
+    session: requests.Session,
+    timeout: int,
+    parser: str = "html5lib",
+    targeted: bool = False,
+    cache: Optional[PageCache] = None,
+) -> List[Dict]:
+    """
+    Fetch and parse one leaderboard page.
+    With a cache, the request is conditional (If-None-Match / If-Modified-Since)
+    and a 304 returns the cached rows without parsing anything.
+    """
+    parser_key = f"{parser}{'+targeted' if targeted else ''}"
+    cached = cache.load(url) if cache is not None else None
+    headers = cached.validators() if cached is not None else {}
+
+    resp = session.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and cache is not None and cached is not None:
+        if cached.parser == parser_key:
+            return cached.rows
+        # Parser changed since the rows were cached: re-parse the stored body
+        rows = parse_leaderboard_table(cached.body(), parser, targeted)
+        cache.save(url, cached.etag, cached.last_modified, parser_key, rows)
+        return rows
+
+    resp.raise_for_status()
+    rows = parse_leaderboard_table(resp.text, parser, targeted)
+    if cache is not None:
+        cache.save(
+            url,
+            resp.headers.get("ETag"),
+            resp.headers.get("Last-Modified"),
+            parser_key,
+            rows,
+            body=resp.text,
+        )
+    return rows
+
+
 def fetch_leaderboards(
-    urls: List[str], timeout: int, user_agent: str
+    urls: List[str],
+    timeout: int,
+    user_agent: str,
+    parser: str = "html5lib",
+    targeted: bool = False,
+    session: Optional[requests.Session] = None,
+    cache: Optional[PageCache] = None,
+    max_concurrency: int = 4,
 ) -> Tuple[List[Dict], List[str]]:
     """
     Fetch multiple leaderboard pages and merge rows. Also returns a deduped company list.
+    parser/targeted select the parse_leaderboard_table backend. Requests go through
+    one pooled session; pass a PageCache to revalidate instead of re-downloading.
+
+    Up to max_concurrency pages are fetched and parsed at once (lxml parses
+    without holding the GIL, so parsing overlaps other downloads). Rows are
+    still merged in URL order, so the company ranking is unchanged.
     """
-    headers = {"User-Agent": user_agent}
+    session = session or _shared_session(user_agent)
+
+    def fetch(url: str) -> List[Dict]:
+        return fetch_leaderboard(url, session, timeout, parser, targeted, cache)
+
     all_rows: List[Dict] = []
-    for url in urls:
-        req = requests.get(url, headers=headers, timeout=timeout)
-        req.raise_for_status()
-        all_rows.extend(parse_leaderboard_table(req.text))
+    for _, rows, error in run_ordered(fetch, urls, max_concurrency):
+        if error is not None:
+            raise error
+        all_rows.extend(rows or [])
 
     # Deduplicate companies keeping appearance order
     seen = set()
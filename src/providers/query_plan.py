@@ -0,0 +1,66 @@
+# src/providers/query_plan.py
+from __future__ import annotations
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+# Sites whose search box understands `"quoted phrases"` joined with OR
+OR_SYNTAX = {"indeed", "linkedin"}
+
+
+def _phrase(term: str) -> str:
+    term = term.strip()
+    return f'"{term}"' if " " in term else term
+
+
+def build_query(terms: Tuple[str, ...], company: Optional[str] = None) -> str:
+    """
+    Search string for a group of role terms, optionally biased to a company.
+    A single term is used as-is ("{term} {company}", as before); several are
+    OR-ed as phrases: ("software engineer" OR developer) Google.
+    """
+    if len(terms) == 1:
+        query = terms[0]
+    else:
+        query = "(" + " OR ".join(_phrase(t) for t in terms) + ")"
+    return f"{query} {company}" if company else query
+
+
+class QueryPlanner:
+    """
+    Packs role terms into as few searches as the site's syntax allows and
+    counts how many scrape calls that saved versus one call per term.
+    max_terms=1 (or a site without OR support) plans one query per term.
+    """
+
+    def __init__(self, site: str, max_terms: int = 16):
+        self.site = site
+        self.max_terms = max(1, max_terms) if site in OR_SYNTAX else 1
+        self.baseline = 0  # calls one-query-per-term would have made
+        self.issued = 0  # queries actually run, including bisected halves
+        self.splits = 0  # combined queries that hit results_wanted and were split
+        self._lock = threading.Lock()
+
+    def groups(self, terms: Iterable[str]) -> List[Tuple[str, ...]]:
+        """Terms (deduplicated case-insensitively, order kept) in groups of max_terms."""
+        unique, seen = [], set()
+        for term in terms:
+            key = term.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(term.strip())
+        n = self.max_terms
+        return [tuple(unique[i : i + n]) for i in range(0, len(unique), n)]
+
+    def planned(self, terms: Iterable[str]) -> None:
+        """Count the one-per-term calls a search over these terms replaces."""
+        with self._lock:
+            self.baseline += len(list(terms))
+
+    def ran(self, split: bool = False) -> None:
+        with self._lock:
+            self.issued += 1
+            self.splits += split
+
+    @property
+    def saved(self) -> int:
+        return self.baseline - self.issued
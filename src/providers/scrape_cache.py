@@ -0,0 +1,139 @@
+# src/providers/scrape_cache.py
+from __future__ import annotations
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    created  REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size     INTEGER NOT NULL,
+    value    BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def cache_key(
+    site: str,
+    search_term: str,
+    location: str,
+    distance: int,
+    hours_old: int,
+    results_wanted: int,
+) -> str:
+    """Stable key for one scrape_jobs call."""
+    params = [
+        site,
+        search_term,
+        location,
+        int(distance),
+        int(hours_old),
+        int(results_wanted),
+    ]
+    return hashlib.sha1(json.dumps(params).encode("utf-8")).hexdigest()
+
+
+class ScrapeCache:
+    """
+    On-disk cache of scrape results (pickled DataFrames) in a SQLite file.
+
+    - Entries older than ttl_seconds are treated as misses and dropped.
+    - When the total stored size passes max_bytes, the least recently used
+      entries are evicted.
+    - refresh=True skips every lookup but still stores fresh results,
+      forcing a re-scrape that repopulates the cache.
+    Safe to share between scrape threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, or None on a miss, expiry or refresh."""
+        if self.refresh:
+            with self._lock:
+                self.misses += 1
+            return None
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created, size, value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            created, size, blob = row
+            with self._conn:
+                if now - created > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._total -= size
+                    self.misses += 1
+                    return None
+                self._conn.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ?", (now, key)
+                )
+            self.hits += 1
+        return pickle.loads(blob)
+
+    def put(self, key: str, value: Any) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        now = self._clock()
+        with self._lock, self._conn:
+            old = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, created, accessed, size, value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, now, now, len(blob), blob),
+            )
+            self._total += len(blob) - (old[0] if old else 0)
+            self._evict()
+
+    def _evict(self) -> None:
+        # Caller holds the lock and an open transaction
+        while self._total > self.max_bytes:
+            victims = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed LIMIT 16"
+            ).fetchall()
+            if not victims:
+                break
+            for key, size in victims:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._total -= size
+                if self._total <= self.max_bytes:
+                    break
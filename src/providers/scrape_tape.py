@@ -0,0 +1,160 @@
+# src/providers/scrape_tape.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+INDEX = "index.json"
+LEADERBOARD = "leaderboard.json"
+
+
+def tape_key(
+    site: str, search_term: str, location: str, distance: int, results_wanted: int
+) -> str:
+    """
+    Stable key for one recorded query. hours_old is left out: an incremental
+    window narrows it from run to run, and a replay should still find the query.
+    """
+    params = [site, search_term, location, int(distance), int(results_wanted)]
+    return hashlib.sha1(json.dumps(params).encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, write) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _to_table(df):
+    import pandas as pd
+    import pyarrow as pa
+
+    if df is None:
+        df = pd.DataFrame()
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    # An object column mixing types (numbers and text, say) has no Arrow type;
+    # keep those columns' values as text
+    df = df.copy()
+    for name in df.columns:
+        try:
+            pa.array(df[name], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df[name] = [x if x is None or x != x else str(x) for x in df[name]]
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+class ScrapeTape:
+    """
+    scrape_jobs results recorded to a directory, for deterministic offline runs:
+    one Arrow IPC file per query plus index.json describing them, and the
+    Levels.fyi leaderboard as leaderboard.json.
+
+    - mode="record": every frame jobspy_search gets (scraped or cached) is
+      saved; a query seen twice keeps its latest frame.
+    - mode="replay": frames are memory-mapped back in place of scrape_jobs.
+      A query that was never recorded raises LookupError, which the search
+      reports like any failed scrape.
+    Files are replaced atomically. Safe to share between scrape threads.
+    """
+
+    def __init__(self, directory: str, mode: str = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"mode must be 'record' or 'replay', got {mode!r}")
+        self.dir = Path(directory)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        index_path = self.dir / INDEX
+        if mode == "replay" and not index_path.exists():
+            raise FileNotFoundError(f"no recording in {self.dir} ({INDEX} missing)")
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.index: Dict[str, Dict] = (
+            json.loads(index_path.read_text()) if index_path.exists() else {}
+        )
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def save(
+        self,
+        site: str,
+        search_term: str,
+        location: str,
+        distance: int,
+        results_wanted: int,
+        df,
+    ) -> None:
+        import pyarrow as pa
+
+        key = tape_key(site, search_term, location, distance, results_wanted)
+        table = _to_table(df)
+
+        def write(tmp: str) -> None:
+            with pa.OSFile(tmp, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+        _atomic_write(self.dir / f"{key}.arrow", write)
+        with self._lock:
+            self.index[key] = {
+                "site": site,
+                "search_term": search_term,
+                "location": location,
+                "distance": int(distance),
+                "results_wanted": int(results_wanted),
+                "rows": table.num_rows,
+            }
+            text = json.dumps(self.index, indent=1, sort_keys=True)
+            _atomic_write(self.dir / INDEX, lambda tmp: Path(tmp).write_text(text))
+            self.recorded += 1
+
+    def load(
+        self,
+        site: str,
+        search_term: str,
+        location: str,
+        distance: int,
+        results_wanted: int,
+    ):
+        """The recorded frame for a query, read through a memory map."""
+        import pyarrow as pa
+
+        key = tape_key(site, search_term, location, distance, results_wanted)
+        if key not in self.index:
+            raise LookupError(
+                f"no recording of {site} {search_term!r} in {location} "
+                f"(distance={distance}, results_wanted={results_wanted})"
+            )
+        with pa.memory_map(str(self.dir / f"{key}.arrow")) as source:
+            df = pa.ipc.open_file(source).read_all().to_pandas()
+        with self._lock:
+            self.replayed += 1
+        return df
+
+    def save_leaderboard(self, rows: List[Dict], companies: List[str]) -> None:
+        text = json.dumps({"rows": rows, "companies": companies})
+        _atomic_write(self.dir / LEADERBOARD, lambda tmp: Path(tmp).write_text(text))
+
+    def load_leaderboard(self) -> Tuple[List[Dict], List[str]]:
+        path = self.dir / LEADERBOARD
+        if not path.exists():
+            raise LookupError(f"no leaderboard recorded in {self.dir}")
+        data = json.loads(path.read_text())
+        return data["rows"], data["companies"]
@@ -0,0 +1,85 @@
+# src/providers/scrape_window.py
+from __future__ import annotations
+import bisect
+import json
+import threading
+import time
+from typing import Callable, Dict
+
+# hours_old values a query may get. Quantizing keeps search parameters (and
+# so scrape cache keys) stable from run to run instead of drifting by minutes.
+HOURS_LADDER = (1, 2, 4, 6, 12, 24, 48, 72, 120, 168)
+
+
+def window_key(site: str, search_term: str, location: str, distance: int) -> str:
+    """Watermark key: everything that identifies a query except its time window."""
+    return json.dumps([site, search_term, location, int(distance)])
+
+
+class ScrapeWindow:
+    """
+    Per-query incremental scraping. hours_old for a query covers the time since
+    its last successful scrape plus `overlap_hours`, rounded up to the ladder
+    and capped at max_hours. Queries without a watermark (new companies or
+    terms) or backfill=True get the full max_hours.
+
+    Watermarks are only collected here; the caller persists completed() once the
+    run's results are safely recorded, so a crashed run is simply re-scraped.
+    """
+
+    def __init__(
+        self,
+        watermarks: Dict[str, float],
+        max_hours: int = 168,
+        overlap_hours: float = 2.0,
+        backfill: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.watermarks = dict(watermarks)
+        self.max_hours = int(max_hours)
+        self.overlap_hours = float(overlap_hours)
+        self.backfill = backfill
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started: Dict[str, float] = {}  # key -> when its scrape was issued
+        self._done: Dict[str, float] = {}
+        self.full = 0  # queries scraped over the full window
+        self.narrowed = 0
+
+    def hours_old(self, key: str) -> int:
+        """The window for this query; call succeeded(key) once its results are in."""
+        now = self._clock()
+        last = None if self.backfill else self.watermarks.get(key)
+        hours = self.max_hours
+        if last is not None:
+            span = max(0.0, now - last) / 3600 + self.overlap_hours
+            i = bisect.bisect_left(HOURS_LADDER, span)
+            if i < len(HOURS_LADDER):
+                hours = min(hours, HOURS_LADDER[i])
+        with self._lock:
+            self._started[key] = now
+            if hours < self.max_hours:
+                self.narrowed += 1
+            else:
+                self.full += 1
+        return hours
+
+    def succeeded(self, key: str) -> None:
+        with self._lock:
+            self._done[key] = self._started[key]
+
+    def completed(self) -> Dict[str, float]:
+        """Watermarks for the queries that succeeded: key -> time the scrape was issued."""
+        with self._lock:
+            return dict(self._done)
+
+    def advance(self) -> Dict[str, float]:
+        """
+        completed(), also applied to this window's own watermarks, so later
+        scrapes in a long-running process narrow from them. Call once the
+        results are recorded; returns the marks to persist.
+        """
+        with self._lock:
+            done, self._done = self._done, {}
+            self.watermarks.update(done)
+            return done
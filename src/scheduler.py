@@ -0,0 +1,170 @@
+from __future__ import annotations
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class SystemClock:
+    """Monotonic time and real sleeps; tests substitute a simulated clock."""
+
+    def time(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class Target:
+    """Polling state for one scheduled target (a company, or the broad search)."""
+
+    __slots__ = ("key", "entry", "interval", "rate", "last_poll", "polls", "found")
+
+    def __init__(self, key: Hashable, interval: float):
+        self.key = key
+        self.entry = -1  # seq of this target's live heap entry
+        self.interval = interval
+        self.rate: Optional[float] = None  # EWMA of new postings per second
+        self.last_poll: Optional[float] = None
+        self.polls = 0
+        self.found = 0
+
+
+class PollScheduler:
+    """
+    Priority-queue scheduler with an adaptive interval per target.
+
+    Each target keeps an EWMA of how many new postings appear per second and is
+    polled about once per `target_new` postings: hot targets approach
+    min_interval, and a target that keeps coming back empty backs off by
+    1 / (1 - alpha) per poll until max_interval. Initial polls are staggered
+    evenly over initial_interval, and consecutive polls are at least `spacing`
+    seconds apart, so work is spread out instead of bursting.
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[Hashable] = (),
+        *,
+        initial_interval: float = 3600.0,
+        min_interval: float = 900.0,
+        max_interval: float = 86400.0,
+        target_new: float = 1.0,
+        alpha: float = 0.3,
+        spacing: float = 0.0,
+        clock=None,
+    ):
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.alpha = alpha
+        self.spacing = spacing
+        self.clock = clock or SystemClock()
+        self.targets: Dict[Hashable, Target] = {}
+        # (due, seq, key); entries that are no longer a target's live entry
+        # (removed, or re-added by sync) are skipped when popped
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._seq = itertools.count()
+        self._last_start: Optional[float] = None
+        self.sync(targets)
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def _push(self, due: float, key: Hashable) -> None:
+        seq = next(self._seq)
+        self.targets[key].entry = seq
+        heapq.heappush(self._heap, (due, seq, key))
+
+    def _live(self, entry: Tuple[float, int, Hashable]) -> bool:
+        target = self.targets.get(entry[2])
+        return target is not None and target.entry == entry[1]
+
+    def sync(self, keys: Iterable[Hashable]) -> None:
+        """
+        Make the scheduled set equal `keys`: new targets are staggered evenly
+        over initial_interval from now; targets no longer listed are dropped.
+        """
+        keys = list(dict.fromkeys(keys))
+        for key in set(self.targets) - set(keys):
+            del self.targets[key]
+        new = [key for key in keys if key not in self.targets]
+        now = self.clock.time()
+        for i, key in enumerate(new):
+            self.targets[key] = Target(key, self.initial_interval)
+            self._push(now + self.initial_interval * i / len(new), key)
+
+    def next_due(self) -> Optional[Tuple[float, Hashable]]:
+        """(start time, key) of the next poll without removing it; None if idle."""
+        while self._heap and not self._live(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        due, _, key = self._heap[0]
+        if self._last_start is not None:
+            due = max(due, self._last_start + self.spacing)
+        return due, key
+
+    def pop(self) -> Optional[Hashable]:
+        """Sleep until the next poll is due and return its key."""
+        nxt = self.next_due()
+        if nxt is None:
+            return None
+        due, key = nxt
+        heapq.heappop(self._heap)
+        self.clock.sleep(due - self.clock.time())
+        self._last_start = max(due, self.clock.time())
+        return key
+
+    def report(self, key: Hashable, new_postings: int) -> float:
+        """Record a finished poll and reschedule its target; returns the new interval."""
+        target = self.targets.get(key)
+        if target is None:  # dropped by sync() while it was being polled
+            return 0.0
+        now = self.clock.time()
+        elapsed = target.interval
+        if target.last_poll is not None and now > target.last_poll:
+            elapsed = now - target.last_poll
+        observed = new_postings / max(elapsed, 1.0)
+        if target.rate is None:
+            target.rate = observed
+        else:
+            target.rate = self.alpha * observed + (1 - self.alpha) * target.rate
+        if target.rate > 0:
+            interval = self.target_new / target.rate
+        else:
+            interval = target.interval / (1 - self.alpha)
+        target.interval = min(self.max_interval, max(self.min_interval, interval))
+        target.last_poll = now
+        target.polls += 1
+        target.found += new_postings
+        self._push(now + target.interval, key)
+        return target.interval
+
+    def run(
+        self,
+        poll: Callable[[Hashable], int],
+        *,
+        until: Optional[float] = None,
+        on_error: Optional[Callable[[Hashable, Exception], None]] = None,
+    ) -> None:
+        """
+        Poll targets as they come due until the clock passes `until` (forever
+        if None). poll(key) returns the number of new postings found; a poll
+        that raises counts as finding nothing.
+        """
+        while True:
+            nxt = self.next_due()
+            if nxt is None or (until is not None and nxt[0] > until):
+                return
+            key = self.pop()
+            try:
+                found = poll(key)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(key, e)
+                found = 0
+            self.report(key, found)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from models import Job, SalaryRange
+from dedupe import simhash
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY,
+    url_hash    BLOB NOT NULL,
+    url         TEXT NOT NULL,
+    title       TEXT,
+    company     TEXT,
+    location    TEXT,
+    source      TEXT,
+    listed_at   TEXT,
+    salary_min  INTEGER,
+    salary_max  INTEGER,
+    currency    TEXT,
+    periodicity TEXT,
+    description TEXT,
+    req_id      TEXT,
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL,
+    simhash     INTEGER
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_url_hash ON jobs (url_hash);
+CREATE TABLE IF NOT EXISTS watermarks (
+    query        TEXT PRIMARY KEY,
+    last_success REAL NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "url_hash, url, title, company, location, source, listed_at, salary_min, "
+    "salary_max, currency, periodicity, description, req_id, first_seen, last_seen, "
+    "simhash"
+)
+
+
+def url_hash(url: str) -> bytes:
+    """16-byte digest of the posting URL; the store's lookup key."""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+
+
+def _signed64(value: Optional[int]) -> Optional[int]:
+    # SQLite integers are signed; fingerprints are unsigned 64-bit
+    return value - (1 << 64) if value is not None and value >= 1 << 63 else value
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class JobStore:
+    """
+    SQLite-backed history of every job seen (runtime.db_path in app.yaml).
+    Jobs are keyed by a hash of their URL; jobs without a URL are not tracked.
+    """
+
+    def __init__(self, path: str, read_only: bool = False):
+        self.path = path
+        self.read_only = read_only
+        if read_only:
+            # An existing store, opened for reads only: nothing is created,
+            # migrated or switched to WAL, and writes fail
+            uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True)
+            return
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "simhash" not in columns:  # stores created before fingerprints
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN simhash INTEGER")
+        self._conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS probe (url_hash BLOB PRIMARY KEY) WITHOUT ROWID"
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def unseen(self, jobs: Iterable[Job]) -> List[Job]:
+        """
+        Jobs whose URL is not in the store yet, in input order.
+        The batch's hashes go into a temp table and are anti-joined against the
+        url_hash index in one query, so cost tracks the batch, not the history.
+        """
+        keyed = [(url_hash(j.url), j) for j in jobs if j.url]
+        with self._conn:
+            self._conn.execute("DELETE FROM probe")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO probe (url_hash) VALUES (?)",
+                ((h,) for h, _ in keyed),
+            )
+            seen = {
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT p.url_hash FROM probe p JOIN jobs j ON j.url_hash = p.url_hash"
+                )
+            }
+            self._conn.execute("DELETE FROM probe")
+        return [j for h, j in keyed if h not in seen]
+
+    def add(self, jobs: Iterable[Job], now: Optional[float] = None) -> None:
+        """
+        Upsert jobs in a single transaction. New URLs are inserted;
+        known ones only get last_seen bumped.
+        """
+        now = time.time() if now is None else now
+        rows = (
+            (
+                url_hash(j.url),
+                j.url,
+                j.title,
+                j.company,
+                j.location,
+                j.source,
+                _text(j.listed_at),
+                j.salary.min,
+                j.salary.max,
+                _text(j.salary.currency),
+                _text(j.salary.periodicity),
+                j.description,
+                j.req_id,
+                now,
+                now,
+                _signed64(simhash(j.description)),
+            )
+            for j in jobs
+            if j.url
+        )
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO jobs ({_COLUMNS}) VALUES ({', '.join('?' * 16)}) "
+                "ON CONFLICT (url_hash) DO UPDATE SET last_seen = excluded.last_seen",
+                rows,
+            )
+
+    def watermarks(self) -> Dict[str, float]:
+        """Per-query time of the last successful scrape (see ScrapeWindow)."""
+        try:
+            return dict(
+                self._conn.execute("SELECT query, last_success FROM watermarks")
+            )
+        except sqlite3.OperationalError:
+            if not self.read_only:
+                raise
+            return {}  # read-only, so the table was never added to this older store
+
+    def set_watermarks(self, marks: Dict[str, float]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO watermarks (query, last_success) VALUES (?, ?) "
+                "ON CONFLICT (query) DO UPDATE SET last_success = excluded.last_success",
+                marks.items(),
+            )
+
+    def fingerprints(self, since: Optional[float] = None) -> Iterator[tuple]:
+        """
+        (url, company, simhash, row id) per stored job (last seen at or after
+        `since`, if given), for DedupeIndex.add_all.
+        """
+        cur = self._conn.execute(
+            "SELECT url, company, simhash, id FROM jobs "
+            "WHERE last_seen >= ? ORDER BY id",
+            (since if since is not None else float("-inf"),),
+        )
+        for url, company, fingerprint, row in cur:
+            if fingerprint is not None and fingerprint < 0:
+                fingerprint += 1 << 64
+            yield url, company or "", fingerprint, row
+
+    def touch(self, rows: Iterable[int], now: Optional[float] = None) -> None:
+        """Bump last_seen of stored jobs by row id (see DedupeIndex.offer_match)."""
+        now = time.time() if now is None else now
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE jobs SET last_seen = ? WHERE id = ?",
+                ((now, row) for row in rows),
+            )
+
+    def iter_jobs(self, since: Optional[float] = None) -> Iterator[Job]:
+        """Every stored job (first seen at or after `since`, if given), oldest first."""
+        cur = self._conn.execute(
+            "SELECT url, title, company, location, source, listed_at, salary_min, "
+            "salary_max, currency, periodicity, description, req_id FROM jobs "
+            "WHERE first_seen >= ? ORDER BY id",
+            (since if since is not None else float("-inf"),),
+        )
+        for row in cur:
+            yield Job(
+                title=row[1] or "",
+                company=row[2] or "",
+                location=row[3] or "",
+                url=row[0],
+                source=row[4] or "",
+                listed_at=row[5],
+                salary=SalaryRange(
+                    min=row[6],
+                    max=row[7],
+                    currency=row[8] or "USD",
+                    periodicity=row[9] or "year",
+                ),
+                description=row[10],
+                req_id=row[11],
+            )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Iterable, List, Dict, Set
+from typing import Iterable, List, Dict, Set, Union
+from companies import Blacklist, as_blacklist
 from models import Job
+from matching import CompiledRules, compile_rules
 
 
 def load_blacklist(path: str = "config/blacklist.txt") -> Set[str]:
@@ -16,32 +18,34 @@ def load_blacklist(path: str = "config/blacklist.txt") -> Set[str]:
     return set(ln.lower() for ln in lines if ln and not ln.startswith("#"))
 
 
-def _is_blocked(name: str, blacklist: Iterable[str]) -> bool:
+BlacklistLike = Union[Blacklist, Iterable[str]]
+
+
+def _is_blocked(name: str, blacklist: BlacklistLike) -> bool:
     """
-    Block if any blacklist token is a case-insensitive substring of the company name.
+    Block if any blacklist token is a case-insensitive substring of the company name,
+    or of its canonical key (see companies.Blacklist).
     Ex: "block" blocks "Block", "Block Inc.", etc.
     """
-    ln = name.lower()
-    return any(token in ln for token in blacklist)
+    return as_blacklist(blacklist).blocked(name)
 
 
-def filter_companies(companies: List[str], blacklist: Set[str]) -> List[str]:
+def filter_companies(companies: List[str], blacklist: BlacklistLike) -> List[str]:
     """Preserve original order; drop blacklisted names."""
-    out = []
-    for c in companies:
-        if not _is_blocked(c, blacklist):
-            out.append(c)
-    return out
+    blacklist = as_blacklist(blacklist)
+    return [c for c in companies if not blacklist.blocked(c)]
 
 
-def filter_job_companies(companies: List[Job], blacklist: Set[str]) -> List[Job]:
+def filter_job_companies(companies: List[Job], blacklist: BlacklistLike) -> List[Job]:
     """Preserve original order; drop blacklisted names."""
-    return [c for c in companies if not _is_blocked(c.company, blacklist)]
+    blacklist = as_blacklist(blacklist)
+    return [c for c in companies if not blacklist.blocked(c.company)]
 
 
-def filter_rows(rows: List[Dict], blacklist: List[str]) -> List[Dict]:
+def filter_rows(rows: List[Dict], blacklist: BlacklistLike) -> List[Dict]:
     """Drop rows whose company is blacklisted; preserve order."""
-    return [r for r in rows if not _is_blocked(r.get("company", ""), blacklist)]
+    blacklist = as_blacklist(blacklist)
+    return [r for r in rows if not blacklist.blocked(r.get("company", ""))]
 
 
 def matches_role_title(
@@ -114,32 +118,14 @@ def matches_location(
     return True
 
 
-def filter_jobs(jobs: List[Job], rules: Dict) -> List[Job]:
+def filter_jobs(jobs: List[Job], rules: Union[Dict, CompiledRules]) -> List[Job]:
     """
     Filter jobs based on rules.yaml configuration.
     Applies role title, job description, and location filters.
+    Rules are compiled once per call; pass a CompiledRules to reuse them across calls.
     """
-    role_titles = rules.get("role_titles", {})
-    job_descriptions = rules.get("job_descriptions", {})
-    locations = rules.get("locations", {})
-
-    include_titles = role_titles.get("include_any", [])
-    exclude_titles = role_titles.get("exclude_any", [])
-    include_descriptions = job_descriptions.get("include_any", [])
-    exclude_descriptions = job_descriptions.get("exclude_any", [])
-    include_locations = locations.get("include_any", [])
-    exclude_locations = locations.get("exclude_any", [])
-
-    filtered_jobs = []
-    for job in jobs:
-        if (
-            matches_role_title(job, include_titles, exclude_titles)
-            and matches_job_description(job, include_descriptions, exclude_descriptions)
-            and matches_location(job, include_locations, exclude_locations)
-        ):
-            filtered_jobs.append(job)
-
-    return filtered_jobs
+    compiled = rules if isinstance(rules, CompiledRules) else compile_rules(rules)
+    return [job for job in jobs if compiled.matches(job)]
 
 
 def deduplicate_jobs(jobs: List[Job]) -> List[Job]:
@@ -0,0 +1,256 @@
+"""
+Digest emails against a local SMTP stand-in server (STARTTLS, AUTH, DATA).
+"""
+
+import shutil
+import socketserver
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from email import message_from_bytes
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from alerts import DigestSender
+from models import Job
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+        self.wfile.flush()
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        tls = False
+        self.reply("220 localhost stand-in")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            cmd = line.decode().strip()
+            verb = cmd.split(" ", 1)[0].upper()
+            server.commands.append(verb)
+            if verb in ("EHLO", "HELO"):
+                caps = ["250-localhost", "250-AUTH PLAIN LOGIN"]
+                if server.tls_context is not None and not tls:
+                    caps.append("250-STARTTLS")
+                self.reply("\r\n".join(caps + ["250 SIZE 1000000"]))
+            elif verb == "STARTTLS":
+                self.reply("220 go ahead")
+                self.request = server.tls_context.wrap_socket(
+                    self.request, server_side=True
+                )
+                self.rfile = self.request.makefile("rb")
+                self.wfile = self.request.makefile("wb")
+                tls = True
+            elif verb == "AUTH":
+                server.auth.append(cmd)
+                self.reply("235 ok")
+            elif verb == "DATA":
+                if server.fail_data:
+                    server.fail_data -= 1
+                    self.reply("451 try again later")
+                    continue
+                self.reply("354 end with .")
+                body = b""
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b".\r\n", b""):
+                        break
+                    body += chunk
+                time.sleep(server.delay)
+                server.messages.append((tls, message_from_bytes(body)))
+                self.reply("250 queued")
+                if server.hang_up_after_data:
+                    return  # like an idle timeout before the next digest
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:  # MAIL, RCPT, RSET, NOOP
+                self.reply("250 ok")
+
+
+class SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, tls_context=None):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.tls_context = tls_context
+        self.connections = 0
+        self.commands = []
+        self.auth = []
+        self.messages = []
+        self.fail_data = 0
+        self.delay = 0.0
+        self.hang_up_after_data = False
+
+
+def start(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def smtp_server():
+    server = start(SMTPServer())
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def jobs(n, start=0):
+    return [
+        Job(
+            title=f"Software Engineer {i}",
+            company="Google",
+            location="Austin, TX",
+            url=f"https://example.com/{i}",
+            source="indeed",
+        )
+        for i in range(start, start + n)
+    ]
+
+
+def sender(server, **kw):
+    kw.setdefault("starttls", False)
+    kw.setdefault("sleep", lambda s: None)
+    return DigestSender(
+        "127.0.0.1",
+        server.server_address[1],
+        "alerts@example.com",
+        ["me@example.com"],
+        **kw,
+    )
+
+
+def test_size_window_batches_and_reuses_one_connection(smtp_server):
+    s = sender(smtp_server, max_jobs=3, max_wait=60, username="u", password="p")
+    s.submit(jobs(2))
+    s.submit(jobs(5, start=2))
+    s.submit([])
+    s.close(timeout=10)
+
+    bodies = [msg.get_payload() for _, msg in smtp_server.messages]
+    assert [b.count("\n") for b in bodies] == [3, 3, 1]  # 7 jobs, 3 per digest
+    assert "https://example.com/6" in bodies[-1]
+    assert smtp_server.messages[0][1]["Subject"] == "job-alerter: 3 new roles"
+    assert smtp_server.connections == 1 and s.connections == 1
+    assert smtp_server.auth == ["AUTH PLAIN AHUAcA=="]
+    assert (s.sent, s.failed) == (3, 0)
+    assert smtp_server.commands[-1] == "QUIT"
+
+
+def test_time_window_flushes_partial_digest(smtp_server):
+    s = sender(smtp_server, max_jobs=100, max_wait=0.2)
+    s.submit(jobs(2))
+    deadline = time.monotonic() + 5
+    while not smtp_server.messages and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert len(smtp_server.messages) == 1, "pending jobs not sent after max_wait"
+    s.close(timeout=10)
+
+
+def test_transient_failures_are_retried_with_backoff(smtp_server):
+    slept = []
+    smtp_server.fail_data = 2
+    s = sender(smtp_server, max_jobs=1, sleep=slept.append, backoff=0.5)
+    s.submit(jobs(1))
+    s.close(timeout=10)
+    assert len(smtp_server.messages) == 1
+    assert slept == [0.5, 1.0]
+    assert s.connections == 3  # each retry starts on a fresh connection
+
+
+def test_dropped_idle_connection_reconnects_without_backoff(smtp_server):
+    slept = []
+    smtp_server.hang_up_after_data = True
+    s = sender(smtp_server, max_jobs=1, retries=0, sleep=slept.append)
+    for i in range(3):
+        s.submit(jobs(1, start=i))
+        deadline = time.monotonic() + 5
+        while len(smtp_server.messages) <= i and time.monotonic() < deadline:
+            time.sleep(0.01)
+    s.close(timeout=10)
+    assert len(smtp_server.messages) == 3
+    assert (s.sent, s.failed, slept) == (3, 0, [])
+    assert s.connections == 3
+
+
+def test_gives_up_after_retries(smtp_server):
+    smtp_server.fail_data = 10
+    s = sender(smtp_server, max_jobs=1, retries=2)
+    s.submit(jobs(1))
+    s.close(timeout=10)
+    assert (s.sent, s.failed) == (0, 1)
+    assert smtp_server.messages == []
+
+
+def test_close_gives_up_on_a_stuck_worker(smtp_server):
+    release = threading.Event()
+    smtp_server.fail_data = 10
+    s = sender(
+        smtp_server,
+        max_jobs=1,
+        retries=1,
+        backoff=0.1,
+        timeout=0.1,
+        sleep=lambda s: release.wait(),  # backoff never ends
+    )
+    assert s.close_timeout() == pytest.approx(0.4)
+    s.submit(jobs(1))
+    start = time.perf_counter()
+    s.close()
+    assert time.perf_counter() - start < 2
+    assert s._thread.is_alive()
+    release.set()
+    s._thread.join(10)
+    assert (s.sent, s.failed) == (0, 1)
+
+
+def test_submit_never_blocks_on_a_slow_server(smtp_server):
+    smtp_server.delay = 0.2
+    s = sender(smtp_server, max_jobs=1)
+    start = time.perf_counter()
+    for i in range(3):
+        s.submit(jobs(1, start=i))
+    assert time.perf_counter() - start < 0.1
+    s.close(timeout=10)
+    assert len(smtp_server.messages) == 3
+
+
+def test_starttls_upgrade(tmp_path):
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl CLI not available to make a test certificate")
+    cert, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", str(key), "-out", str(cert), "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+    server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_ctx.load_cert_chain(cert, key)
+    server = start(SMTPServer(tls_context=server_ctx))
+    try:
+        client_ctx = ssl.create_default_context(cafile=str(cert))
+        s = sender(server, starttls=True, ssl_context=client_ctx, max_jobs=1)
+        s.submit(jobs(2))
+        s.close(timeout=10)
+        assert [tls for tls, _ in server.messages] == [True, True]
+        assert server.commands[:3] == ["EHLO", "STARTTLS", "EHLO"]
+        assert server.connections == 1
+    finally:
+        server.shutdown()
+        server.server_close()
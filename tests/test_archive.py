@@ -0,0 +1,117 @@
+"""
+Tests for the columnar job history archive and its trend queries.
+"""
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive import JobArchive
+from models import Job, SalaryRange
+from pipeline import new_matching_jobs
+from store import JobStore
+
+pytest.importorskip("pyarrow")
+
+MONDAY = 1759708800.0  # 2025-10-06 00:00 UTC
+DAY = 86400
+
+
+def job(i, company="Google", title="Software Engineer", salary=SalaryRange()):
+    return Job(
+        title, company, "Austin, TX", f"https://e.com/{i}", "indeed", salary=salary
+    )
+
+
+def test_sightings_are_partitioned_by_day(tmp_path):
+    archive = JobArchive(str(tmp_path), flush_rows=1000)
+    archive.append([job(1), job(2)], seen_at=MONDAY)
+    archive.append([job(1), job(3, "Amazon")], seen_at=MONDAY + DAY)
+    archive.append([job(1)], seen_at=MONDAY + 7 * DAY)
+    archive.close()
+
+    days = sorted(p.name for p in tmp_path.iterdir())
+    assert days == ["date=2025-10-06", "date=2025-10-07", "date=2025-10-13"]
+    assert archive.postings_per_week().to_pylist() == [
+        {"company": "Google", "week": dt.date(2025, 10, 6), "postings": 2},
+        {"company": "Amazon", "week": dt.date(2025, 10, 6), "postings": 1},
+        {"company": "Google", "week": dt.date(2025, 10, 13), "postings": 1},
+    ]
+    week = archive.postings_per_week(start=dt.date(2025, 10, 13))
+    assert week["postings"].to_pylist() == [1]
+
+
+def test_reads_only_the_columns_and_days_asked_for(tmp_path):
+    archive = JobArchive(str(tmp_path))
+    archive.append([job(1)], seen_at=MONDAY)
+    archive.close()
+    # An unreadable file in a day outside the range is never opened
+    (tmp_path / "date=2020-01-01").mkdir()
+    (tmp_path / "date=2020-01-01" / "part-0.parquet").write_bytes(b"not parquet")
+
+    t = archive.read(["url"], start=dt.date(2025, 1, 1))
+    assert t.column_names == ["url"]
+    assert t["url"].to_pylist() == ["https://e.com/1"]
+
+
+def test_salary_distribution_of_matching_titles(tmp_path):
+    archive = JobArchive(str(tmp_path))
+    yearly = [SalaryRange(100_000, 140_000), SalaryRange(150_000), SalaryRange()]
+    archive.append([job(i, salary=s) for i, s in enumerate(yearly)], seen_at=MONDAY)
+    archive.append(
+        [
+            job(0, salary=yearly[0]),  # seen again: still one posting
+            job(5, title="Data Analyst", salary=SalaryRange(90_000, 90_000)),
+            job(6, salary=SalaryRange(60, 80, periodicity="hour")),
+        ],
+        seen_at=MONDAY + DAY,
+    )
+    archive.close()
+
+    dist = archive.salary_distribution(title_any=["software"], quantiles=(0.5,))
+    assert dist == {"postings": 2, "mean": 135_000.0, "quantiles": {0.5: 135_000.0}}
+    assert archive.salary_distribution()["postings"] == 3
+
+
+def test_time_to_fill_counts_postings_that_came_down(tmp_path):
+    archive = JobArchive(str(tmp_path))
+    archive.append([job(1), job(2), job(3, "Amazon"), job(4)], seen_at=MONDAY)
+    archive.append([job(4)], seen_at=MONDAY + DAY)
+    archive.append([job(1), job(3, "Amazon")], seen_at=MONDAY + 4 * DAY)
+    archive.append([job(3, "Amazon")], seen_at=MONDAY + 10 * DAY)
+    archive.close()
+
+    # job 3 is still up; jobs 1, 2 and 4 were listed for 4, 0 and 1 days
+    assert archive.time_to_fill().to_pylist() == [
+        {"company": "Google", "filled": 3, "mean_days": 5 / 3, "median_days": 1.0}
+    ]
+
+
+def test_compaction_keeps_answers(tmp_path):
+    archive = JobArchive(str(tmp_path), flush_rows=1)
+    for i in range(4):
+        archive.append([job(i), job(i + 1)], seen_at=MONDAY + i * 3600)
+    archive.close()
+    before = archive.postings_per_week().to_pylist()
+    assert len(list((tmp_path / "date=2025-10-06").glob("*.parquet"))) == 4
+
+    assert archive.compact(before="2025-10-06") == 0  # that day is still open
+    assert archive.compact() == 1
+    assert len(list((tmp_path / "date=2025-10-06").glob("*.parquet"))) == 1
+    assert archive.postings_per_week().to_pylist() == before
+
+
+def test_pipeline_archives_repeat_sightings(tmp_path):
+    rules = {"role_titles": {"include_any": ["Software Engineer"]}}
+    archive = JobArchive(str(tmp_path / "archive"))
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        for _ in range(2):  # the second run finds nothing new
+            batches = [("Google", [job(1), job(1), job(2, title="Analyst")], [])]
+            list(new_matching_jobs(batches, rules, store, archive=archive))
+    archive.close()
+    assert archive.read(["url"]).num_rows == 6
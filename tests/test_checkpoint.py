@@ -0,0 +1,131 @@
+"""
+Tests for the checkpoint journal: durable records, torn-line recovery,
+staleness, compaction, and resuming an interrupted search.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from checkpoint import Checkpoint
+from models import Job, SalaryRange
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+JOBS = [
+    Job(
+        "Backend Engineer",
+        "Google",
+        "Austin, TX",
+        "https://e.com/1",
+        "indeed",
+        listed_at="2024-05-01",
+        salary=SalaryRange(120000, 150000),
+        description="python " * 200,  # long enough to be stored compressed
+        req_id="https://e.com/1",
+    ),
+    Job("Data Engineer", "Amazon", "Remote", "https://e.com/2", "linkedin"),
+]
+
+
+def test_resume_serves_finished_queries_once(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    cp = Checkpoint(path)
+    cp.put("q1", JOBS)
+    cp.put("q2", [])
+    cp.close()  # the run dies here
+
+    resumed = Checkpoint(path)
+    assert len(resumed) == 2
+    assert resumed.get("q1") == JOBS
+    assert resumed.get("q2") == []
+    assert resumed.get("q3") is None
+    assert resumed.get("q1") is None  # a later run of the query scrapes again
+    assert resumed.resumed == 2
+
+
+def test_torn_last_record_is_ignored(tmp_path):
+    path = tmp_path / "run.jsonl"
+    cp = Checkpoint(str(path))
+    cp.put("q1", JOBS)
+    cp.close()
+    with open(path, "a") as f:
+        f.write('{"key": "q2", "jobs": [["Eng')  # crash mid-write
+
+    resumed = Checkpoint(str(path))
+    assert resumed.get("q1") == JOBS
+    assert resumed.get("q2") is None
+    # Reopening compacted the journal, so new records start on a clean line
+    resumed.put("q2", JOBS[1:])
+    resumed.close()
+    assert Checkpoint(str(path)).get("q2") == JOBS[1:]
+
+
+def test_stale_journal_starts_over(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "run.jsonl")
+    Checkpoint(path, max_age_seconds=60, clock=clock).put("q1", JOBS)
+    clock.now += 61
+    assert len(Checkpoint(path, max_age_seconds=60, clock=clock)) == 0
+
+
+def test_finish_compacts_the_journal(tmp_path):
+    path = tmp_path / "run.jsonl"
+    cp = Checkpoint(str(path))
+    cp.put("q1", JOBS)
+    cp.put("q1", JOBS)
+    cp.finish()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1 and "started" in json.loads(lines[0])
+    assert not list(tmp_path.glob("*.tmp"))
+    cp.close()
+    assert len(Checkpoint(str(path))) == 0
+
+
+def test_interrupted_search_resumes_where_it_stopped(monkeypatch, tmp_path):
+    pd = pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    calls = []
+
+    def fake_scrape_jobs(**kwargs):
+        calls.append(kwargs["search_term"])
+        if kwargs["search_term"] == "java" and len(calls) < 4:
+            raise KeyboardInterrupt  # the process dies mid-run
+        return pd.DataFrame(
+            {"title": ["Engineer"], "job_url": [f"https://e.com/{len(calls)}"]}
+        )
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake_scrape_jobs)
+    path = str(tmp_path / "run.jsonl")
+    terms = ["python", "go", "java"]
+
+    cp = Checkpoint(path)
+    with pytest.raises(KeyboardInterrupt):
+        list(jobspy_search.search_terms("indeed", terms, location="TX", checkpoint=cp))
+    cp.close()
+    assert calls == ["python", "go", "java"]
+
+    cp = Checkpoint(path)
+    results = list(
+        jobspy_search.search_terms("indeed", terms, location="TX", checkpoint=cp)
+    )
+    assert calls == ["python", "go", "java", "java"]  # only the unfinished query
+    assert [[j.url for j in jobs] for _, jobs, _ in results] == [
+        ["https://e.com/1"],
+        ["https://e.com/2"],
+        ["https://e.com/4"],
+    ]
+    assert cp.resumed == 2
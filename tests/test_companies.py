@@ -0,0 +1,120 @@
+"""
+Tests for company name canonicalization and the blacklist built on it.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from companies import Blacklist, CompanyIndex, company_key, load_company_index
+from dedupe import DedupeIndex
+from matching import Prefilter, compile_rules
+from models import Job
+from profiles import Profile, ProfileIndex
+from targets import filter_companies, filter_job_companies, filter_rows
+
+ALIASES = {"Google": ["Alphabet"], "Amazon": ["AWS", "Amazon Web Services"]}
+
+
+def job(company, url="https://e.com/1"):
+    return Job("Software Engineer", company, "Austin, TX", url, "indeed")
+
+
+def test_company_key_strips_case_punctuation_and_suffixes():
+    assert (
+        company_key("Google LLC")
+        == company_key("google, l.l.c.")
+        == company_key("GOOGLE")
+        == "google"
+    )
+    assert company_key("Amazon.com, Inc.") == "amazon"
+    assert company_key("The Walt Disney Company") == "walt disney"
+    assert company_key("Procter & Gamble Co.") == "procter and gamble"
+    # "& Co." goes with its "&"
+    assert (
+        company_key("Morgan Stanley & Co. LLC")
+        == company_key("Morgan Stanley")
+        == "morgan stanley"
+    )
+    assert company_key("Bain & Company") == company_key("Bain") == "bain"
+    assert company_key("Johnson & Johnson") == "johnson and johnson"
+    assert company_key("Nestlé S.A.") == "nestle"
+    # A name that is all suffix keeps its last word
+    assert company_key("Co") == "co"
+    assert company_key(None) == ""
+
+
+def test_aliases_join_names_of_one_company():
+    index = CompanyIndex(ALIASES)
+    assert index.key("Alphabet Inc.") == index.key("Google") == "google"
+    assert index.same("Amazon Web Services, Inc.", "amazon.com")
+    assert not index.same("Google", "Amazon")
+    assert index.canonical("alphabet inc") == "Google"
+    assert index.canonical(" Stripe, Inc. ") == "Stripe, Inc."
+    assert index.unique(["Google", "Amazon", "Alphabet", "Google LLC", "AWS"]) == [
+        "Google",
+        "Amazon",
+    ]
+    rows = [
+        {"rank": 1, "company": "Alphabet"},
+        {"rank": 2, "company": "Stripe"},
+        {"rank": 3, "company": "Google LLC"},
+    ]
+    assert index.ranks(rows) == {"google": 1, "stripe": 2}
+
+
+def test_blacklist_matches_names_and_canonical_keys():
+    blacklist = Blacklist(["amazon", "whole foods", "block"], CompanyIndex(ALIASES))
+    # Substring semantics of blacklist.txt are unchanged
+    assert blacklist.blocked("Block, Inc.")
+    assert blacklist.blocked("Blockchain Co")
+    # Aliases and punctuation are matched through the canonical key
+    assert blacklist.blocked("AWS")
+    assert blacklist.blocked("Whole-Foods Market")
+    assert not blacklist.blocked("Google")
+    assert not Blacklist([]).blocked("Amazon")
+
+    names = ["Google", "AWS", "Stripe", "Square Block"]
+    assert filter_companies(names, blacklist) == ["Google", "Stripe"]
+    assert filter_rows([{"company": n} for n in names], blacklist) == [
+        {"company": "Google"},
+        {"company": "Stripe"},
+    ]
+    # Plain terms still work, without aliases
+    assert filter_companies(names, {"amazon", "block"}) == ["Google", "AWS", "Stripe"]
+
+
+def test_prefilter_and_profiles_agree_with_the_blacklist():
+    companies = CompanyIndex(ALIASES)
+    terms = frozenset({"amazon", "whole foods", "google inc"})
+    jobs = [
+        job(c, f"https://e.com/{i}")
+        for i, c in enumerate(
+            ["Google LLC", "Alphabet", "AWS", "Whole Foods Market", "Stripe", ""]
+        )
+    ]
+    expected = filter_job_companies(jobs, Blacklist(terms, companies))
+    assert [j.company for j in expected] == ["Stripe", ""]
+
+    prefilter = Prefilter(compile_rules({}), Blacklist(terms, companies))
+    assert [j for j in jobs if prefilter.keep(j.title, j.company, j.location)] == (
+        expected
+    )
+    index = ProfileIndex([Profile("p", {}, terms)], companies)
+    assert index.match_all(jobs) == {"p": expected}
+
+
+def test_dedupe_compares_canonical_companies():
+    index = DedupeIndex(companies=CompanyIndex(ALIASES))
+    assert index.offer(job("Google", "https://e.com/1")) is None
+    assert index.offer(job("Alphabet Inc.", "https://e.com/2")) == "key"
+    assert index.offer(job("Stripe", "https://e.com/3")) is None
+
+
+def test_shipped_alias_table_loads():
+    config = Path(__file__).parent.parent / "config" / "company_aliases.yaml"
+    index = load_company_index(str(config))
+    assert index.same("Facebook", "Meta Platforms, Inc.")
+    assert len(load_company_index("missing.yaml")) == 0
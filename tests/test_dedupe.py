@@ -0,0 +1,149 @@
+"""
+Tests for URL canonicalization, SimHash fingerprints and the dedupe index.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dedupe import DedupeIndex, canonical_url, job_key, simhash
+from models import Job
+from store import JobStore
+
+WORDS = (
+    "build scalable backend services in python and go on aws with a small team "
+    "owning design review deployment monitoring and on call for customer facing "
+    "systems that process millions of events per day across regions"
+).split()
+
+
+def description(seed, n=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def make_job(
+    url, company="Google", title="Software Engineer", location="Austin, TX", **kw
+):
+    return Job(
+        title=title, company=company, location=location, url=url, source="indeed", **kw
+    )
+
+
+def test_canonical_url_strips_tracking():
+    assert (
+        canonical_url(
+            "http://www.Indeed.com/viewjob?jk=abc&from=serp&vjs=3&utm_source=x#top"
+        )
+        == canonical_url("https://indeed.com/viewjob/?tk=1&jk=abc")
+        == "https://indeed.com/viewjob?jk=abc"
+    )
+    assert canonical_url(
+        "https://www.linkedin.com/jobs/view/123/?refId=a&trackingId=b"
+    ) == ("https://linkedin.com/jobs/view/123")
+    # The posting id is not tracking
+    assert canonical_url("https://indeed.com/viewjob?jk=a") != canonical_url(
+        "https://indeed.com/viewjob?jk=b"
+    )
+
+
+def test_job_key_normalizes_case_and_punctuation():
+    a = make_job("u1", company="Google, Inc.", title="Software Engineer - II")
+    b = make_job("u2", company="google inc", title="software engineer ii")
+    assert (
+        job_key(a) == job_key(b) == ("google inc", "software engineer ii", "austin tx")
+    )
+
+
+def test_simhash_near_duplicates_are_close():
+    text = description(1)
+    edited = text + " Apply today on our careers site."
+    assert simhash(text) == simhash(text)
+    assert (simhash(text) ^ simhash(edited)).bit_count() <= 3
+    assert (simhash(text) ^ simhash(description(2))).bit_count() > 10
+    assert simhash("too short to fingerprint") is None
+    assert simhash(None) is None
+
+
+def test_index_reasons():
+    index = DedupeIndex()
+    text = description(1)
+    assert (
+        index.offer(make_job("https://indeed.com/viewjob?jk=1", description=text))
+        is None
+    )
+
+    tracked = make_job("https://www.indeed.com/viewjob?jk=1&from=serp", title="Other")
+    assert index.offer(tracked) == "url"
+    same_key = make_job("https://linkedin.com/jobs/view/9", title="software engineer")
+    assert index.offer(same_key) == "key"
+    repost = make_job(
+        "https://glassdoor.com/job?jl=5",
+        title="Software Engineer (Backend)",
+        description=text + " Apply today.",
+    )
+    assert index.check(repost) == "content"
+    # Same text from another company is not a duplicate
+    other = make_job("https://x.com/1", company="Meta", description=text)
+    assert index.offer(other) is None
+    assert index.offer(make_job("https://x.com/2", title="Data Engineer")) is None
+    assert len(index) == 3
+
+    with pytest.raises(ValueError):
+        DedupeIndex(max_distance=4)
+
+
+def test_store_fingerprints_preload_index(tmp_path):
+    text = description(3)
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        store.add([make_job("https://indeed.com/viewjob?jk=1", description=text)])
+        store.add([make_job("https://indeed.com/viewjob?jk=2", title="SRE")])
+        rows = list(store.fingerprints())
+
+    assert rows[0][2] == simhash(text) and rows[1][2] is None
+    index = DedupeIndex()
+    index.add_all(rows)
+    repost = make_job(
+        "https://linkedin.com/jobs/view/7", title="Backend SWE", description=text
+    )
+    assert index.check(repost) == "content"
+
+
+def test_store_fingerprints_since_last_seen(tmp_path):
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        store.add([make_job("https://indeed.com/viewjob?jk=1")], now=100.0)
+        store.add([make_job("https://indeed.com/viewjob?jk=2")], now=200.0)
+        # Seen again: its last_seen moves up
+        store.add([make_job("https://indeed.com/viewjob?jk=1")], now=300.0)
+        store.add([make_job("https://indeed.com/viewjob?jk=3")], now=400.0)
+        urls = [row[0][-1] for row in store.fingerprints(since=250.0)]
+        assert urls == ["1", "3"]
+        assert len(list(store.fingerprints())) == 3
+
+
+def test_same_title_at_the_same_company_is_a_new_posting_on_a_later_run(tmp_path):
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        store.add(
+            [make_job("https://indeed.com/viewjob?jk=111", description=description(4))]
+        )
+        rows = list(store.fingerprints())
+    index = DedupeIndex()
+    index.add_all(rows)
+    reopened = make_job("https://indeed.com/viewjob?jk=999", description=description(5))
+    assert index.offer(reopened) is None
+    # The same posting from another site in this run is still caught by key
+    elsewhere = make_job("https://linkedin.com/jobs/view/999")
+    assert index.offer(elsewhere) == "key"
+
+
+def test_incomplete_keys_never_match():
+    index = DedupeIndex()
+    assert index.offer(make_job("https://x.com/1", company="", location="")) is None
+    assert index.offer(make_job("https://x.com/2", company="", location="")) is None
+    assert index.offer(make_job("https://x.com/3", location="")) is None
+    assert index.offer(make_job("https://x.com/4", location="")) is None
@@ -0,0 +1,168 @@
+"""
+The column-wise _df_to_jobs must produce exactly what the row-wise path did.
+"""
+
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from providers.jobspy_search import _df_to_jobs, _df_to_jobs_rowwise  # noqa: E402
+
+
+def messy_frame():
+    return pd.DataFrame(
+        {
+            "title": [" Software Engineer ", None, "Backend Engineer", "", "Dev"],
+            "company": ["Google", "Amazon ", None, "Acme", np.nan],
+            "location": ["Austin, TX", "Remote", " Texas ", None, "TX"],
+            "job_url": [
+                "https://example.com/1",
+                " https://example.com/2 ",
+                None,
+                "",
+                "https://example.com/5",
+            ],
+            "date_posted": [datetime.date(2025, 10, 1), "", "", "2025-10-02", ""],
+            "salary_min": [120000.0, np.nan, 99999.9, -5.5, np.inf],
+            "salary_max": ["180000", None, "", "abc", 150000],
+            "salary_currency": ["USD", None, "", "EUR", np.nan],
+            "salary_period": ["year", "hour", None, "", "month"],
+            "description": [" Backend Python ", "", "   ", "AWS", "Java"],
+        }
+    )
+
+
+def test_matches_rowwise_on_messy_frame():
+    df = messy_frame()
+    assert _df_to_jobs(df, "indeed") == _df_to_jobs_rowwise(df, "indeed")
+
+
+def test_matches_rowwise_with_integer_and_missing_columns():
+    df = messy_frame().drop(columns=["salary_currency", "description"])
+    df["salary_min"] = [1, 2, 3, 4, 5]
+    df["salary_max"] = pd.array([1, None, 3, None, 5], dtype="Int64")
+    assert _df_to_jobs(df, "linkedin") == _df_to_jobs_rowwise(df, "linkedin")
+
+
+def test_salaries_are_python_ints():
+    jobs = _df_to_jobs(messy_frame(), "indeed")
+    assert [j.salary.min for j in jobs] == [120000, None, 99999, -5, None]
+    assert all(type(j.salary.min) in (int, type(None)) for j in jobs)
+    assert jobs[0].salary.max == 180000
+
+
+def test_missing_values_become_none():
+    """None/NaN descriptions and dates map to None (the row-wise path crashed)."""
+    df = pd.DataFrame(
+        {
+            "title": ["a", "b", "c"],
+            "description": [" text ", None, np.nan],
+            "date_posted": pd.Series(
+                [datetime.date(2025, 1, 1), None, np.nan], dtype=object
+            ),
+        }
+    )
+    jobs = _df_to_jobs(df, "indeed")
+    assert [j.description for j in jobs] == ["text", None, None]
+    assert [j.listed_at for j in jobs] == [datetime.date(2025, 1, 1), None, None]
+
+
+def test_empty_frame():
+    assert _df_to_jobs(pd.DataFrame(), "indeed") == []
+    assert _df_to_jobs(None, "indeed") == []
+
+
+def test_prefilter_pushdown_matches_post_filtering():
+    """Pushed-down predicates keep exactly the jobs the later filters would."""
+    from matching import Prefilter, compile_rules
+    from targets import filter_job_companies, filter_jobs
+
+    df = pd.DataFrame(
+        {
+            "title": [
+                "Software Engineer",
+                "Senior Software Engineer",
+                "Backend Engineer",
+                "Software Engineer",
+                "Data Analyst",
+                "Software Developer",
+            ],
+            "company": ["Google", "Google", "Amazon", "Ptx Labs", "Meta", "Twitch"],
+            "location": ["Austin, TX", "Remote", "Remote", "Ptx, CA", "Austin", "TX"],
+            "job_url": [f"https://example.com/{i}" for i in range(6)],
+            "description": ["python backend"] * 5 + ["frontend only"],
+        }
+    )
+    rules = {
+        "role_titles": {
+            "include_any": ["Software Engineer", "Backend Engineer", "Developer"],
+            "exclude_any": ["Senior"],
+        },
+        "job_descriptions": {"include_any": ["python"], "exclude_any": []},
+        "locations": {"include_any": ["Austin", "Remote", "TX"], "word_boundary": True},
+    }
+    blacklist = {"amazon", "twitch"}
+    compiled = compile_rules(rules)
+
+    pushed = _df_to_jobs(df, "indeed", Prefilter(compiled, blacklist))
+    assert [j.company for j in pushed] == ["Google"]
+    assert filter_jobs(pushed, compiled) == filter_jobs(
+        filter_job_companies(_df_to_jobs(df, "indeed"), blacklist), rules
+    )
+
+    # Without a blacklist only title/location are pushed down
+    assert [j.company for j in _df_to_jobs(df, "indeed", Prefilter(compiled))] == [
+        "Google",
+        "Amazon",
+        "Twitch",
+    ]
+
+
+@pytest.mark.parametrize("word_boundary", [False, True])
+def test_prefilter_columns_match_keep(word_boundary):
+    """Large frames take the column path; its verdicts are keep()'s."""
+    from companies import Blacklist, CompanyIndex
+    from matching import Prefilter, compile_rules
+    from providers.jobspy_search import PREFILTER_COLUMN_MIN_ROWS
+
+    titles = ["Software Engineer", "Senior Software Engineer", "SOFTWARE DEV", "Chef"]
+    companies = ["Google", "AWS", "Amazon.com, Inc.", "Ptx Labs", "Twitch", ""]
+    locations = ["Austin, TX", "Ptx, CA", "remote", "Dallas", ""]
+    n = PREFILTER_COLUMN_MIN_ROWS + 1
+    df = pd.DataFrame(
+        {
+            "title": [titles[i % len(titles)] for i in range(n)],
+            "company": [companies[i % len(companies)] for i in range(n)],
+            "location": [locations[i % len(locations)] for i in range(n)],
+            "job_url": [f"https://example.com/{i}" for i in range(n)],
+        }
+    )
+    rules = {
+        "role_titles": {
+            "include_any": ["Software Engineer", "Software Dev"],
+            "exclude_any": ["Senior"],
+        },
+        "locations": {"include_any": ["Austin", "Remote", "TX"]},
+    }
+    compiled = compile_rules(rules, word_boundary=word_boundary)
+    blacklist = Blacklist(["amazon", "twitch"], CompanyIndex({"Amazon": ["AWS"]}))
+    prefilter = Prefilter(compiled, blacklist)
+
+    pushed = _df_to_jobs(df, "indeed", prefilter)
+    expected = [
+        j
+        for j in _df_to_jobs(df, "indeed")
+        if prefilter.keep(j.title, j.company, j.location)
+    ]
+    assert pushed == expected
+    # "TX" inside "Ptx" only passes without word boundaries
+    assert any(j.location == "Ptx, CA" for j in pushed) is not word_boundary
+    assert {j.company for j in pushed}.isdisjoint({"AWS", "Amazon.com, Inc.", "Twitch"})
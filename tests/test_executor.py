@@ -0,0 +1,177 @@
+"""
+Tests for the concurrent scrape executor and per-site rate limiting.
+JobSpy is monkeypatched, so these run offline.
+"""
+
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from providers.executor import SiteRateLimiter, TokenBucket, run_lanes, run_ordered
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def test_token_bucket_spaces_calls():
+    """After the initial burst, each acquire waits 1/rate seconds."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=1.0, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits[0] == 0.0
+    assert all(w == pytest.approx(0.5) for w in waits[1:])
+    assert clock.now == pytest.approx(1.5)
+
+
+def test_token_bucket_refills_while_idle():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1.0, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    clock.now += 5.0
+    assert bucket.acquire() == 0.0
+
+
+def test_rate_limiter_has_one_bucket_per_site():
+    limiter = SiteRateLimiter(per_domain_sleep=2.0)
+    assert limiter.bucket("indeed") is limiter.bucket("indeed")
+    assert limiter.bucket("indeed") is not limiter.bucket("linkedin")
+    assert limiter.bucket("indeed").rate == pytest.approx(0.5)
+    assert SiteRateLimiter(0).acquire("indeed") == 0.0
+
+
+def test_rate_limiter_per_site_overrides():
+    limiter = SiteRateLimiter(per_domain_sleep=1.0, overrides={"linkedin": 4.0})
+    assert limiter.bucket("indeed").rate == pytest.approx(1.0)
+    assert limiter.bucket("linkedin").rate == pytest.approx(0.25)
+
+
+def test_run_ordered_keeps_input_order_and_captures_errors():
+    rng = random.Random(3)
+    delays = [rng.random() / 100 for _ in range(20)]
+
+    def work(i):
+        time.sleep(delays[i])
+        if i == 7:
+            raise ValueError("boom")
+        return i * i
+
+    results = list(run_ordered(work, range(20), max_workers=5))
+    assert [item for item, _, _ in results] == list(range(20))
+    assert [r for i, r, e in results if e is None] == [
+        i * i for i in range(20) if i != 7
+    ]
+    assert isinstance(results[7][2], ValueError)
+
+
+def test_run_lanes_slow_or_failing_lane_does_not_hold_up_others():
+    release = threading.Event()
+
+    def slow():
+        yield "slow-1"
+        release.wait(5)
+        yield "slow-2"
+
+    def failing():
+        yield "fail-1"
+        raise RuntimeError("site down")
+
+    def fast():
+        yield from ("fast-1", "fast-2", "fast-3")
+
+    seen = []
+    for lane, item, error in run_lanes(
+        {"slow": slow(), "failing": failing(), "fast": fast()}
+    ):
+        seen.append((lane, item if error is None else str(error)))
+        if len([s for s in seen if s[0] != "slow"]) == 5:
+            release.set()  # everything else arrived while the slow lane waited
+
+    assert seen[-1] == ("slow", "slow-2")
+    assert [s for s in seen if s[0] == "fast"] == [
+        ("fast", "fast-1"),
+        ("fast", "fast-2"),
+        ("fast", "fast-3"),
+    ]
+    assert [s for s in seen if s[0] == "failing"] == [
+        ("failing", "fail-1"),
+        ("failing", "site down"),
+    ]
+
+
+def test_run_lanes_close_stops_lanes():
+    produced = []
+    closed = threading.Event()
+
+    def endless():
+        try:
+            i = 0
+            while True:
+                produced.append(i)
+                yield i
+                i += 1
+        finally:
+            closed.set()
+
+    lanes = run_lanes({"a": endless()}, buffer=2)
+    assert next(lanes)[1] == 0
+    lanes.close()
+    assert closed.wait(2)
+    assert len(produced) <= 4  # never ran more than `buffer` ahead
+
+
+def test_search_companies_groups_results_by_company(monkeypatch):
+    pd = pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    calls = []
+
+    def fake_scrape_jobs(site_name, search_term, **kwargs):
+        calls.append(search_term)
+        time.sleep(random.random() / 200)
+        if search_term == "java Beta":
+            raise RuntimeError("rate limited")
+        return pd.DataFrame(
+            {
+                "title": [search_term],
+                "company": [search_term.split()[-1]],
+                "location": ["Austin, TX"],
+                "job_url": [f"https://example.com/{search_term}"],
+            }
+        )
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake_scrape_jobs)
+
+    out = list(
+        jobspy_search.search_companies(
+            "indeed",
+            ["Alpha", "Beta", "Gamma"],
+            ["python", "java"],
+            location="Austin, TX",
+            max_workers=4,
+        )
+    )
+
+    assert len(calls) == 6
+    assert [company for company, _, _ in out] == ["Alpha", "Beta", "Gamma"]
+    assert [j.title for j in out[0][1]] == ["python Alpha", "java Alpha"]
+    assert [j.title for j in out[1][1]] == ["python Beta"]
+    assert len(out[1][2]) == 1 and "rate limited" in str(out[1][2][0])
+    assert out[2][2] == []
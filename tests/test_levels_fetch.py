@@ -0,0 +1,167 @@
+"""
+Leaderboard fetching against a local HTTP stand-in server:
+pooled keep-alive connections and ETag / Last-Modified revalidation.
+"""
+
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from providers import levels_html  # noqa: E402
+from providers.http_cache import PageCache  # noqa: E402
+
+FIXTURE = (
+    Path(__file__).parent / "fixtures/levels/leaderboard_austin.html"
+).read_bytes()
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 Oct 2025 00:00:00 GMT"
+
+
+class LeaderboardServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), LeaderboardHandler)
+        self.requests = []  # (path, client port, conditional headers)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class LeaderboardHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is visible
+
+    def do_GET(self):
+        conditional = {
+            k: self.headers[k]
+            for k in ("If-None-Match", "If-Modified-Since")
+            if self.headers.get(k)
+        }
+        self.server.requests.append((self.path, self.client_address[1], conditional))
+        query = parse_qs(urlparse(self.path).query)
+        time.sleep(float(query.get("delay", ["0"])[0]))
+        body = FIXTURE
+        if "top" in query:
+            body = body.replace(b"Google", query["top"][0].encode())
+        if conditional.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = LeaderboardServer()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_not_modified_skips_parse(server, tmp_path, monkeypatch):
+    urls = [f"{server.base_url}/leaderboard/a", f"{server.base_url}/leaderboard/b"]
+    cache = PageCache(str(tmp_path / "levels"))
+    session = levels_html.make_session("job-alerter-test")
+
+    rows, companies = levels_html.fetch_leaderboards(
+        urls, 5, "job-alerter-test", parser="lxml", session=session, cache=cache
+    )
+    assert companies == ["Google", "Meta & Co", "Apple", "Block", "Indeed"]
+    assert len(rows) == 10
+    assert all(not cond for _, _, cond in server.requests)
+
+    parses = []
+    real_parse = levels_html.parse_leaderboard_table
+    monkeypatch.setattr(
+        levels_html,
+        "parse_leaderboard_table",
+        lambda *a, **kw: parses.append(a) or real_parse(*a, **kw),
+    )
+    again, _ = levels_html.fetch_leaderboards(
+        urls, 5, "job-alerter-test", parser="lxml", session=session, cache=cache
+    )
+
+    assert again == rows
+    assert parses == [], "a 304 must not re-parse the page"
+    conditionals = [cond for _, _, cond in server.requests[2:]]
+    assert (
+        conditionals
+        == [{"If-None-Match": ETAG, "If-Modified-Since": LAST_MODIFIED}] * 2
+    )
+    # The second round reused the pooled keep-alive connections of the first
+    first_ports = {port for _, port, _ in server.requests[:2]}
+    assert {port for _, port, _ in server.requests[2:]} <= first_ports
+
+
+def test_parser_change_reparses_cached_body(server, tmp_path):
+    url = f"{server.base_url}/leaderboard/a"
+    cache = PageCache(str(tmp_path / "levels"))
+    session = levels_html.make_session("job-alerter-test")
+
+    first = levels_html.fetch_leaderboard(url, session, 5, "html5lib", cache=cache)
+    second = levels_html.fetch_leaderboard(url, session, 5, "lxml", True, cache=cache)
+
+    assert second == first
+    assert server.requests[-1][2].get("If-None-Match") == ETAG
+    assert cache.load(url).parser == "lxml+targeted"
+
+
+def test_cache_entries_survive_reload(tmp_path):
+    cache = PageCache(str(tmp_path))
+    cache.save("https://x/a", '"e"', None, "lxml", [{"rank": 1}], body="<html/>")
+    entry = PageCache(str(tmp_path)).load("https://x/a")
+    assert entry.rows == [{"rank": 1}]
+    assert entry.body() == "<html/>"
+    assert entry.validators() == {"If-None-Match": '"e"'}
+    assert PageCache(str(tmp_path)).load("https://x/other") is None
+
+
+def test_fetches_run_concurrently_and_merge_in_url_order(server):
+    # Later URLs answer faster, so completion order is the reverse of URL order
+    urls = [
+        f"{server.base_url}/lb?top=First&delay=0.4",
+        f"{server.base_url}/lb?top=Second&delay=0.3",
+        f"{server.base_url}/lb?top=Third&delay=0.2",
+        f"{server.base_url}/lb?top=Fourth&delay=0.1",
+    ]
+    start = time.perf_counter()
+    rows, companies = levels_html.fetch_leaderboards(
+        urls, 5, "job-alerter-test", parser="lxml", max_concurrency=4
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.9, f"fetches did not overlap ({elapsed:.2f}s)"
+    assert [r["company"] for r in rows[::5]] == ["First", "Second", "Third", "Fourth"]
+    assert companies[:6] == ["First", "Meta & Co", "Apple", "Block", "Indeed", "Second"]
+
+
+def test_fetch_error_is_raised(server):
+    requests = pytest.importorskip("requests")
+    urls = [f"{server.base_url}/lb", "http://127.0.0.1:1/unreachable"]
+    with pytest.raises(requests.RequestException):
+        levels_html.fetch_leaderboards(urls, 2, "job-alerter-test", parser="lxml")
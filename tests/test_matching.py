@@ -0,0 +1,138 @@
+"""
+Tests for the compiled keyword matcher.
+The compiled path must agree with the original matches_* helpers in targets.py.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Job
+from matching import KeywordFilter, compile_keywords, compile_rules
+from targets import (
+    matches_role_title,
+    matches_job_description,
+    matches_location,
+    filter_jobs,
+)
+
+RULES = {
+    "role_titles": {
+        "include_any": ["Software Engineer", "Software Developer", "Backend Engineer"],
+        "exclude_any": [
+            "Principal",
+            "Senior Software Engineer",
+            "Software Engineer III",
+        ],
+    },
+    "job_descriptions": {
+        "include_any": ["backend", "python", "aws", "c++", ".net"],
+        "exclude_any": ["frontend", "ios"],
+    },
+    "locations": {
+        "include_any": ["Austin", "Remote", "TX"],
+        "exclude_any": [],
+    },
+}
+
+
+def make_job(title, location="Austin, TX", description=None, company="Acme"):
+    return Job(
+        title=title,
+        company=company,
+        location=location,
+        url=f"https://example.com/{title}/{location}",
+        source="indeed",
+        description=description,
+    )
+
+
+def sample_jobs():
+    return [
+        make_job("Software Engineer", description="Backend services in Python."),
+        make_job("Senior Software Engineer", description="backend"),
+        make_job("software engineer iii", description="AWS platform"),
+        make_job("Backend Engineer", "Remote", "Frontend and backend work"),
+        make_job("Software Developer", "Ptx Labs, CA", "Modern C++ services"),
+        make_job("Software Developer", "London, UK", "ASP.NET services"),
+        make_job("Principal Backend Engineer", "Texas", "python"),
+        make_job("Software Engineer", "Austin, TX", None, company="Python Shop"),
+        make_job("Data Scientist", "Austin, TX", "python"),
+    ]
+
+
+def test_compiled_matches_legacy_helpers():
+    """Compiled filters return the same verdicts as the per-keyword helpers."""
+    compiled = compile_rules(RULES)
+    titles = RULES["role_titles"]
+    descs = RULES["job_descriptions"]
+    locs = RULES["locations"]
+
+    for job in sample_jobs():
+        assert compiled.title.matches(job.title) == matches_role_title(
+            job, titles["include_any"], titles["exclude_any"]
+        ), f"title mismatch for {job.title!r}"
+        assert compiled.description.matches(
+            job.description or f"{job.title} {job.company}"
+        ) == matches_job_description(
+            job, descs["include_any"], descs["exclude_any"]
+        ), f"description mismatch for {job.title!r}"
+        assert compiled.location.matches(job.location) == matches_location(
+            job, locs["include_any"], locs["exclude_any"]
+        ), f"location mismatch for {job.location!r}"
+
+
+def test_filter_jobs_accepts_compiled_rules():
+    jobs = sample_jobs()
+    assert filter_jobs(jobs, RULES) == filter_jobs(jobs, compile_rules(RULES))
+
+
+def test_shared_prefixes_and_special_characters():
+    pattern = compile_keywords(["soft", "software", "software engineer", "c++"])
+    assert pattern.search("a software developer")
+    assert pattern.search("modern c++")
+    assert pattern.search("c+") is None
+    assert compile_keywords([]) is None
+
+
+def test_word_boundary_matching():
+    """'TX' should only match as its own word when word_boundary is enabled."""
+    loose = KeywordFilter(["tx"])
+    strict = KeywordFilter(["tx"], word_boundary=True)
+
+    assert loose.matches("Ptx Labs, CA")
+    assert not strict.matches("Ptx Labs, CA")
+    assert strict.matches("Austin, TX")
+    assert strict.matches("TX-Remote")
+
+    # Non-word edges are not boundary checked
+    dotnet = KeywordFilter([".net"], word_boundary=True)
+    assert dotnet.matches("ASP.NET Core")
+    assert not dotnet.matches("ASP.NETwork")
+
+
+def test_word_boundary_from_rules_section():
+    rules = {"locations": {"include_any": ["TX"], "word_boundary": True}}
+    compiled = compile_rules(rules)
+    assert not compiled.location.matches("Ptx Labs")
+    assert compile_rules(rules, word_boundary=False).location.matches("Ptx Labs")
+
+
+def test_large_keyword_sets_match_legacy():
+    """Sets above the substring-scan threshold go through the trie regex."""
+    include = [f"skill{i}" for i in range(100)] + ["python"]
+    exclude = [f"blocker{i}" for i in range(100)]
+    compiled = KeywordFilter(include, exclude)
+    assert not hasattr(compiled.include, "terms")
+
+    jobs = sample_jobs() + [
+        make_job("x", description="skill42 and blocker7"),
+        make_job("y", description="needs SKILL99"),
+    ]
+    for job in jobs:
+        text = job.description or f"{job.title} {job.company}"
+        assert compiled.matches(text) == matches_job_description(
+            job, include, exclude
+        ), f"description mismatch for {text!r}"
@@ -0,0 +1,150 @@
+"""
+Tests for the metrics registry, Prometheus text export and pipeline instrumentation.
+"""
+
+import json
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from metrics import Metrics, Registry, serve
+from models import Job
+from pipeline import new_matching_jobs
+from store import JobStore
+
+RULES = {
+    "role_titles": {"include_any": ["Software Engineer"], "exclude_any": []},
+    "job_descriptions": {"include_any": [], "exclude_any": []},
+    "locations": {"include_any": [], "exclude_any": []},
+}
+
+
+def test_prometheus_text_format():
+    r = Registry()
+    c = r.counter("scrapes_total", "Scrapes.", ("site", "query"))
+    h = r.histogram("latency_seconds", "Latency.", ("site",), buckets=(0.1, 1))
+    c.inc(site="indeed", query='"a b" OR c\\d')
+    c.inc(2, site="indeed", query='"a b" OR c\\d')
+    h.observe(0.05, site="indeed")
+    h.observe(0.1, site="indeed")  # upper bounds are inclusive
+    h.observe(3, site="indeed")
+
+    assert r.render().splitlines() == [
+        "# HELP scrapes_total Scrapes.",
+        "# TYPE scrapes_total counter",
+        r'scrapes_total{site="indeed",query="\"a b\" OR c\\d"} 3',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{site="indeed",le="0.1"} 2',
+        'latency_seconds_bucket{site="indeed",le="1"} 2',
+        'latency_seconds_bucket{site="indeed",le="+Inf"} 3',
+        'latency_seconds_sum{site="indeed"} 3.15',
+        'latency_seconds_count{site="indeed"} 3',
+    ]
+
+
+def test_labels_must_match():
+    c = Registry().counter("x_total", "X.", ("stage",))
+    with pytest.raises(ValueError):
+        c.inc(site="indeed")
+
+
+def test_metric_kinds_must_render_and_snapshot():
+    import metrics
+
+    class Gauge(metrics._Metric):
+        kind = "gauge"
+
+        def render(self):
+            return self._header()
+
+    with pytest.raises(TypeError):
+        Gauge("g", "G.")
+
+
+def test_timer_observes_even_when_the_block_raises():
+    m = Metrics()
+    with pytest.raises(RuntimeError):
+        with m.scrape("indeed", "python"):
+            raise RuntimeError("blocked")
+    assert m.scrape_seconds.count(site="indeed", query="python") == 1
+    assert m.scrape_errors.value(site="indeed", query="python") == 1
+
+
+def test_endpoint_serves_metrics():
+    m = Metrics()
+    m.jobs.inc(5, stage="scraped")
+    server = serve(m.registry, port=0)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain")
+            body = resp.read().decode()
+        assert 'job_alerter_jobs_total{stage="scraped"} 5' in body
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://{host}:{port}/")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pipeline_records_stage_counts_and_report(tmp_path):
+    jobs = [
+        Job("Software Engineer", "Google", "Austin", "https://example.com/1", "indeed"),
+        Job("Software Engineer", "Google", "Austin", "https://example.com/1", "indeed"),
+        Job("Data Analyst", "Amazon", "Austin", "https://example.com/2", "indeed"),
+    ]
+    m = Metrics()
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        list(new_matching_jobs([("Google", jobs, [])], RULES, store, metrics=m))
+
+    counts = {s: m.jobs.value(stage=s) for s in ("scraped", "unique", "new", "matched")}
+    assert counts == {"scraped": 3, "unique": 2, "new": 2, "matched": 1}
+    for stage in ("dedupe", "record", "filter"):
+        assert m.stage_seconds.count(stage=stage) == 1
+
+    m.write_report(str(tmp_path / "report.json"))
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["seconds"] >= 0
+    samples = report["metrics"]["job_alerter_jobs_total"]["samples"]
+    assert {"labels": {"stage": "matched"}, "value": 1} in samples
+
+
+def test_scrapes_record_latency_rows_errors_and_cache(monkeypatch, tmp_path):
+    pd = pytest.importorskip("pandas")
+    from providers import jobspy_search
+    from providers.scrape_cache import ScrapeCache
+
+    def fake_scrape_jobs(**kwargs):
+        if kwargs["search_term"] == "java":
+            raise RuntimeError("blocked")
+        return pd.DataFrame(
+            {
+                "title": ["Engineer"] * 2,
+                "job_url": ["https://e.com/1", "https://e.com/2"],
+            }
+        )
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake_scrape_jobs)
+    m = Metrics()
+    cache = ScrapeCache(str(tmp_path / "cache.db"))
+    for _ in range(2):
+        list(
+            jobspy_search.search_terms(
+                "indeed", ["python", "java"], location="TX", cache=cache, metrics=m
+            )
+        )
+    cache.close()
+
+    assert m.scrape_seconds.count(site="indeed", query="python") == 1
+    assert m.scrape_rows.value(site="indeed", query="python") == 4  # scraped + cached
+    assert m.scrape_errors.value(site="indeed", query="java") == 2
+    assert m.scrape_cache.value(site="indeed", result="hit") == 1
+    assert m.scrape_cache.value(site="indeed", result="miss") == 3
+    assert m.stage_seconds.count(stage="convert") == 2
@@ -0,0 +1,117 @@
+"""
+Tests for the compact Job / SalaryRange models.
+"""
+
+import dataclasses
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import models
+from models import Job, SalaryRange
+
+LONG = "Backend services in Python on AWS. " * 100
+
+
+def make_job(**overrides):
+    fields = dict(
+        title="Software Engineer",
+        company="".join(["Goo", "gle"]),  # built at runtime, so not pre-interned
+        location="Austin, TX",
+        url="https://example.com/1",
+        source="indeed",
+        salary=SalaryRange(120000, 180000),
+        description=LONG,
+    )
+    fields.update(overrides)
+    return Job(**fields)
+
+
+def test_long_description_is_compressed_and_round_trips():
+    job = make_job()
+    assert isinstance(models._packed_description(job), bytes)
+    assert len(models._packed_description(job)) < len(LONG) // 4
+    assert job.description == LONG
+
+    short = make_job(description="python")
+    assert models._packed_description(short) == "python"
+    assert short.description == "python"
+    assert make_job(description=None).description is None
+
+
+def test_compression_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(models, "DESCRIPTION_COMPRESS_MIN", None)
+    assert models._packed_description(make_job()) == LONG
+
+
+def test_low_cardinality_fields_are_interned():
+    a = make_job(company="".join(["Goo", "gle"]), location="".join(["Rem", "ote"]))
+    b = make_job(company="".join(["Goo", "gle"]), location="".join(["Rem", "ote"]))
+    assert a.company is b.company
+    assert a.location is b.location
+    assert SalaryRange(currency="".join(["U", "SD"])).currency is sys.intern("USD")
+
+
+def test_api_compatible_with_plain_dataclass():
+    job = make_job()
+    positional = Job(
+        "Software Engineer",
+        "Google",
+        "Austin, TX",
+        "https://example.com/1",
+        "indeed",
+        None,
+        SalaryRange(120000, 180000),
+        LONG,
+    )
+    assert job == positional and hash(job) == hash(positional)
+    assert job != make_job(description=LONG + "!")
+    assert len({job, positional, make_job(url="https://example.com/2")}) == 2
+    assert Job("t", "c", "l", "u", "s").salary == SalaryRange()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        job.title = "other"
+    # slots: no per-instance __dict__ (3.11 reports this as a TypeError)
+    with pytest.raises((AttributeError, TypeError)):
+        job.extra = 1
+    assert not hasattr(job, "__dict__")
+
+
+def test_replace_asdict_and_repr_see_the_description():
+    job = make_job()
+    renamed = job.replace(title="Backend Engineer")
+    assert renamed.title == "Backend Engineer"
+    assert renamed.description == LONG and renamed.company is job.company
+    assert models._packed_description(renamed) is models._packed_description(job)
+    assert job.replace() == job
+    assert job.replace(description="python").description == "python"
+    with pytest.raises(TypeError):
+        job.replace(salary_min=1)
+
+    fields = job.asdict()
+    assert list(fields)[-2:] == ["description", "req_id"]
+    assert fields["description"] == LONG and "_description_z" not in fields
+    assert fields["salary"] == {
+        "min": 120000,
+        "max": 180000,
+        "currency": "USD",
+        "periodicity": "year",
+    }
+    assert "description='python'" in repr(make_job(description="python"))
+
+
+def test_description_is_inflated_once_while_in_use():
+    job = make_job(description=LONG + "once")
+    assert job.description is job.description
+
+
+def test_pickle_round_trip():
+    job = make_job()
+    restored = pickle.loads(pickle.dumps(job))
+    assert restored == job
+    assert restored.description == LONG
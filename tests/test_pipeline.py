@@ -0,0 +1,204 @@
+"""
+Tests for the streaming scrape -> dedupe -> record -> filter pipeline.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dedupe import DedupeIndex
+from models import Job
+from pipeline import dedupe, merge_sites, new_matching_jobs
+from store import JobStore
+from targets import deduplicate_jobs, filter_job_companies, filter_jobs
+
+RULES = {
+    "role_titles": {"include_any": ["Software Engineer"], "exclude_any": ["Senior"]},
+    "job_descriptions": {"include_any": [], "exclude_any": []},
+    "locations": {"include_any": ["Austin", "Remote"], "exclude_any": []},
+}
+
+
+def job(n, title="Software Engineer", company="Google", location="Austin, TX"):
+    return Job(
+        title=title,
+        company=company,
+        location=f"{location} {n}",  # distinct, so only the URL can collide
+        url=f"https://example.com/{n}" if n is not None else "",
+        source="indeed",
+    )
+
+
+def batches():
+    return [
+        ("Google", [job(1), job(2, "Senior Software Engineer"), job(1)], []),
+        ("Amazon", [job(3, company="Amazon"), job(2), job(None)], []),
+        ("Meta", [], [RuntimeError("boom")]),
+        ("Block", [job(4, company="Block", location="Remote"), job(5)], []),
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with JobStore(str(tmp_path / "jobs.db")) as s:
+        yield s
+
+
+def test_matches_list_based_pipeline(store):
+    """Same jobs as collect -> deduplicate_jobs -> blacklist -> filter_jobs."""
+    everything = [j for _, jobs, _ in batches() for j in jobs]
+    expected = filter_jobs(
+        filter_job_companies(deduplicate_jobs(everything), {"block"}), RULES
+    )
+
+    out = list(new_matching_jobs(batches(), RULES, store, blacklist={"block"}))
+
+    assert [j for _, jobs, _ in out for j in jobs] == expected
+    assert [label for label, _, _ in out] == ["Google", "Amazon", "Meta", "Block"]
+    assert [str(e) for e in out[2][2]] == ["boom"]
+    # Non-matching jobs are recorded too
+    assert len(store) == 5
+
+
+def test_second_run_reports_nothing_new(store):
+    list(new_matching_jobs(batches(), RULES, store))
+    again = list(new_matching_jobs(batches(), RULES, store))
+    assert [jobs for _, jobs, _ in again] == [[], [], [], []]
+
+
+def test_batches_flow_through_before_the_next_is_scraped(store):
+    pulled = []
+
+    def scrape():
+        for batch in batches():
+            pulled.append(batch[0])
+            yield batch
+
+    stream = new_matching_jobs(scrape(), RULES, store)
+    label, jobs, _ = next(stream)
+    assert (label, pulled) == ("Google", ["Google"])
+    assert [j.url for j in jobs] == ["https://example.com/1"]
+    assert len(store) == 2, "the first batch is recorded before the second is pulled"
+
+
+def test_shared_index_dedupes_across_pipelines():
+    index = DedupeIndex()
+    list(dedupe(batches()[:1], index))
+    repost = Job(
+        title="Software engineer",
+        company="GOOGLE",
+        location="Austin, TX 1",
+        url="https://example.com/other-site",
+        source="linkedin",
+    )
+    out = list(dedupe([("broad", [job(1), job(2), job(9), repost], [])], index))
+    assert [j.url for j in out[0][1]] == ["https://example.com/9"]
+    assert len(index) == 3
+
+
+def test_history_duplicates_mark_the_stored_job_seen_again(store):
+    text = " ".join(f"word{i}" for i in range(40))
+    listed = Job(
+        title="Software Engineer",
+        company="Google",
+        location="Austin, TX",
+        url="https://example.com/1",
+        source="indeed",
+        description=text,
+    )
+    store.add([listed, job(2)], now=100.0)
+    index = DedupeIndex()
+    index.add_all(store.fingerprints())
+
+    # The same description under a new URL, and job 2 with a tracking parameter
+    repost = Job(
+        title="Backend Engineer",
+        company="Google",
+        location="Remote",
+        url="https://example.com/9",
+        source="linkedin",
+        description=text,
+    )
+    tracked = Job(
+        title="Software Engineer",
+        company="Google",
+        location="Austin, TX 2",
+        url="https://www.example.com/2?utm_source=feed",
+        source="indeed",
+    )
+    out = list(
+        new_matching_jobs(
+            [("Google", [repost, tracked], [])], RULES, store, index=index
+        )
+    )
+
+    assert out[0][1] == []
+    # Both stored postings count as seen again; the repost is not stored
+    assert [row[0] for row in store.fingerprints(since=1000.0)] == [
+        "https://example.com/1",
+        "https://example.com/2",
+    ]
+    assert len(store) == 2
+
+
+def test_search_terms_reports_errors_per_term(monkeypatch):
+    pd = pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    def fake_scrape_jobs(**kwargs):
+        if kwargs["search_term"] == "java":
+            raise RuntimeError("blocked")
+        return pd.DataFrame(
+            {"title": [kwargs["search_term"]], "job_url": ["https://example.com/1"]}
+        )
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake_scrape_jobs)
+    out = list(
+        jobspy_search.search_terms("indeed", ["python", "java", "go"], location="TX")
+    )
+
+    assert [(term, len(jobs)) for term, jobs, _ in out] == [
+        ("python", 1),
+        ("java", 0),
+        ("go", 1),
+    ]
+    assert [str(e) for e in out[1][2]] == ["blocked"]
+    with pytest.raises(RuntimeError):
+        jobspy_search.search_by_query("indeed", ["python", "java"], "TX")
+
+
+def test_merge_sites_dedupes_across_sites_and_keeps_source(store):
+    def site(name, urls, fail=False):
+        jobs = [
+            Job("Software Engineer", "Google", f"Austin {u}", url, name)
+            for u, url in enumerate(urls)
+        ]
+        yield "Google", jobs, []
+        if fail:
+            raise RuntimeError(f"{name} down")
+
+    lanes = {
+        "indeed": site("indeed", ["https://indeed.com/1", "https://indeed.com/2"]),
+        "linkedin": site("linkedin", ["https://linkedin.com/1"], fail=True),
+    }
+    out = list(new_matching_jobs(merge_sites(lanes), RULES, store))
+
+    jobs = {j.url: j.source for _, batch, _ in out for j in batch}
+    # linkedin's posting repeats indeed's Austin 0 listing under another URL
+    assert len(jobs) == 2
+    assert jobs["https://indeed.com/2"] == "indeed"
+    assert sorted(label for label, _, _ in out) == [
+        "Google @ indeed",
+        "Google @ linkedin",
+        "linkedin",
+    ]
+    assert [str(e) for label, _, errors in out for e in errors] == ["linkedin down"]
+
+
+def test_merge_sites_passes_a_single_site_through():
+    batches = [("Google", [], [])]
+    assert list(merge_sites({"indeed": batches})) == batches
@@ -0,0 +1,182 @@
+"""
+Tests for many-profile matching: ProfileIndex must agree with running
+filter_job_companies + filter_jobs once per profile.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import profiles as profiles_module
+from models import Job
+from profiles import Profile, ProfileIndex, load_profiles, union_rules
+from targets import filter_job_companies, filter_jobs
+
+TITLE_TERMS = ["Software Engineer", "Backend", "Developer", "Engineer", "Data", "SDE"]
+TITLE_EXCLUDES = ["Senior", "Staff", "Intern", "Manager", "III", "Lead"]
+TECH = ["python", "java", "javascript", "aws", "go", "golang", "react", "c++", ".net"]
+LOCATIONS = ["Austin", "Remote", "TX", "Texas", "Seattle", "New York"]
+COMPANIES = ["Google", "Amazon", "Block", "Blockchain Co", "Meta", "Stripe"]
+
+
+def random_profile(rng, i):
+    def pick(terms, k):
+        return rng.sample(terms, rng.randint(0, k))
+
+    return Profile(
+        f"p{i}",
+        {
+            "role_titles": {
+                "include_any": pick(TITLE_TERMS, 3),
+                "exclude_any": pick(TITLE_EXCLUDES, 3),
+            },
+            "job_descriptions": {
+                "include_any": pick(TECH, 4),
+                "exclude_any": pick(TECH, 2),
+            },
+            "locations": {
+                "include_any": pick(LOCATIONS, 3),
+                "exclude_any": pick(LOCATIONS, 1),
+                "word_boundary": rng.random() < 0.5,
+            },
+        },
+        frozenset(c.lower() for c in pick(COMPANIES, 2)),
+    )
+
+
+def random_job(rng, i):
+    title = " ".join(rng.sample(TITLE_TERMS + TITLE_EXCLUDES, rng.randint(1, 3)))
+    return Job(
+        title=title,
+        company=rng.choice(COMPANIES),
+        location=rng.choice(LOCATIONS + ["Ptx Labs, CA", "Austin, TX"]),
+        url=f"https://example.com/{i}",
+        source="indeed",
+        description=" ".join(rng.choices(TECH + ["team", "scale"], k=8)),
+    )
+
+
+def naive(profiles, jobs):
+    return {
+        p.name: filter_jobs(filter_job_companies(jobs, p.blacklist), p.rules)
+        for p in profiles
+    }
+
+
+@pytest.mark.parametrize("scan_max", [0, 32])
+def test_index_agrees_with_per_profile_filtering(monkeypatch, scan_max):
+    # scan_max=0 forces the trie-regex scan for every term set
+    monkeypatch.setattr(profiles_module, "SUBSTRING_SCAN_MAX_TERMS", scan_max)
+    rng = random.Random(20)
+    profiles = [random_profile(rng, i) for i in range(60)]
+    jobs = [random_job(rng, i) for i in range(400)]
+
+    assert ProfileIndex(profiles).match_all(jobs) == naive(profiles, jobs)
+
+
+def test_large_term_sets_use_the_scanning_index():
+    """Past SUBSTRING_SCAN_MAX_TERMS terms, overlapping terms must still all be found."""
+    rng = random.Random(21)
+    extra = [f"stack{i}" for i in range(40)] + ["java", "javascript", "script"]
+    profiles = [
+        Profile(
+            f"p{i}",
+            {"job_descriptions": {"include_any": rng.sample(extra, 3)}},
+        )
+        for i in range(30)
+    ]
+    jobs = [
+        Job("Engineer", "Acme", "Austin", f"u{i}", "indeed", description=text)
+        for i, text in enumerate(
+            ["we use javascript", "stack12 and stack1", "java only", "nothing here"]
+        )
+    ]
+    assert ProfileIndex(profiles).match_all(jobs) == naive(profiles, jobs)
+
+
+def test_word_boundary_is_per_profile():
+    loose = Profile("loose", {"locations": {"include_any": ["TX"]}})
+    strict = Profile(
+        "strict", {"locations": {"include_any": ["TX"], "word_boundary": True}}
+    )
+    index = ProfileIndex([loose, strict])
+    ptx = Job("Engineer", "Acme", "Ptx Labs", "u1", "indeed")
+    austin = Job("Engineer", "Acme", "Austin, TX", "u2", "indeed")
+    assert index.match(ptx) == ["loose"]
+    assert index.match(austin) == ["loose", "strict"]
+
+
+def test_union_rules_pass_everything_any_profile_passes():
+    rng = random.Random(22)
+    profiles = [random_profile(rng, i) for i in range(20)]
+    jobs = [random_job(rng, i) for i in range(300)]
+    kept = set(filter_jobs(jobs, union_rules(profiles)))
+    for matched in naive(profiles, jobs).values():
+        assert set(matched) <= kept
+
+
+def test_load_profiles(tmp_path):
+    (tmp_path / "alice").mkdir()
+    (tmp_path / "alice" / "rules.yaml").write_text(
+        "role_titles:\n  include_any: [Engineer]\n"
+    )
+    (tmp_path / "alice" / "blacklist.txt").write_text("# comment\nBlock\n")
+    (tmp_path / "bob").mkdir()
+    (tmp_path / "bob" / "rules.yaml").write_text("locations:\n  include_any: [TX]\n")
+    (tmp_path / "empty").mkdir()
+
+    profiles = load_profiles(str(tmp_path))
+    assert [p.name for p in profiles] == ["alice", "bob"]
+    assert profiles[0].blacklist == {"block"}
+    assert profiles[1].blacklist == frozenset()
+    assert load_profiles(str(tmp_path / "missing")) == []
+
+
+def test_run_profiles_scrapes_once_for_every_profile(capsys):
+    import main
+
+    jobs = [
+        Job("Backend Engineer", "Google", "Austin, TX", "u1", "indeed"),
+        Job("Data Analyst", "Block", "Remote", "u2", "indeed"),
+    ]
+
+    class FakeAlerter:
+        searches = 0
+
+        def leaderboard(self):
+            return [], ["Google", "Block"]
+
+        def search_companies(self, companies):
+            self.searches += 1
+            return iter([("Google", jobs[:1], []), ("Block", jobs[1:], [])])
+
+        def search_broad(self):
+            self.searches += 1
+            return iter([("broad", [], [RuntimeError("blocked")])])
+
+        def advance_watermarks(self):
+            pass
+
+        def finish_run(self):
+            pass
+
+        def levels_rank(self, company):
+            return None
+
+    index = ProfileIndex(
+        [
+            Profile("backend", {"role_titles": {"include_any": ["Backend"]}}),
+            Profile("anything", {}, frozenset({"block"})),
+        ]
+    )
+    alerter = FakeAlerter()
+    results = main.run_profiles(alerter, index)
+
+    assert alerter.searches == 2
+    assert results == {"backend": jobs[:1], "anything": jobs[:1]}
+    assert "=== anything: 1 new matching roles ===" in capsys.readouterr().out
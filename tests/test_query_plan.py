@@ -0,0 +1,132 @@
+"""
+Tests for OR-grouped query planning and the split-on-cap fallback.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from providers.query_plan import QueryPlanner, build_query
+
+TERMS = ["Software Engineer", "Backend Engineer", "Developer", "Python"]
+
+
+def test_build_query():
+    assert build_query(("Software Engineer",), "Google") == "Software Engineer Google"
+    assert (
+        build_query(("Software Engineer", "Developer"), "Google")
+        == '("Software Engineer" OR Developer) Google'
+    )
+    assert build_query(("python", "java")) == "(python OR java)"
+
+
+def test_groups_dedupe_and_respect_site_syntax():
+    planner = QueryPlanner("indeed", max_terms=3)
+    assert planner.groups(TERMS + [" python "]) == [
+        ("Software Engineer", "Backend Engineer", "Developer"),
+        ("Python",),
+    ]
+    # No OR syntax: one query per term
+    assert QueryPlanner("glassdoor", max_terms=16).groups(TERMS) == [
+        (t,) for t in TERMS
+    ]
+
+
+class FakeIndeed:
+    """Postings per term; an OR query returns the union, capped at results_wanted."""
+
+    def __init__(self, postings):
+        self.postings = postings
+        self.queries = []
+
+    def __call__(self, search_term, results_wanted, **kwargs):
+        import pandas as pd
+
+        self.queries.append(search_term)
+        urls = []
+        for term, postings in self.postings.items():
+            if term in search_term:
+                urls.extend(u for u in postings if u not in urls)
+        urls = urls[:results_wanted]
+        return pd.DataFrame(
+            {"title": ["Software Engineer"] * len(urls), "job_url": urls}
+        )
+
+
+def _postings(counts):
+    return {
+        term: [f"https://example.com/{term}/{i}" for i in range(n)]
+        for term, n in counts.items()
+    }
+
+
+def test_companies_share_one_query_each(monkeypatch):
+    pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    fake = FakeIndeed(_postings({t: 2 for t in TERMS}))
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake)
+    planner = QueryPlanner("indeed", max_terms=16)
+
+    out = list(
+        jobspy_search.search_companies(
+            "indeed",
+            ["Google", "Meta", "Apple"],
+            TERMS,
+            location="Austin, TX",
+            results_wanted=50,
+            planner=planner,
+        )
+    )
+
+    assert [len(jobs) for _, jobs, _ in out] == [8, 8, 8]
+    assert len(fake.queries) == 3
+    assert (planner.baseline, planner.issued, planner.saved) == (12, 3, 9)
+
+
+def test_capped_query_is_split_without_losing_recall(monkeypatch):
+    pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    postings = _postings(
+        {"Software Engineer": 6, "Backend Engineer": 1, "Developer": 1, "Python": 1}
+    )
+    fake = FakeIndeed(postings)
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake)
+    planner = QueryPlanner("indeed", max_terms=16)
+
+    jobs = jobspy_search.search_company_roles(
+        "indeed",
+        "Google",
+        TERMS,
+        location="Austin, TX",
+        results_wanted=5,
+        planner=planner,
+    )
+
+    expected = {url for urls in postings.values() for url in urls}
+    # One term alone still exceeds the cap; recall is what per-term queries get
+    per_term = {u for t in TERMS for u in postings[t][:5]}
+    assert {j.url for j in jobs} == per_term and len(per_term) == len(expected) - 1
+    assert fake.queries == [
+        '("Software Engineer" OR "Backend Engineer" OR Developer OR Python) Google',
+        '("Software Engineer" OR "Backend Engineer") Google',
+        "Software Engineer Google",
+        "Backend Engineer Google",
+        "(Developer OR Python) Google",
+    ]
+    assert (planner.issued, planner.splits, planner.saved) == (5, 2, -1)
+
+
+def test_default_is_one_query_per_term(monkeypatch):
+    pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    fake = FakeIndeed(_postings({t: 1 for t in TERMS}))
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake)
+    jobspy_search.search_company_roles("indeed", "Google", TERMS, location="TX")
+    assert fake.queries == [f"{t} Google" for t in TERMS]
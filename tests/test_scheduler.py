@@ -0,0 +1,229 @@
+"""
+Tests for the adaptive polling scheduler, driven by a simulated clock.
+"""
+
+import random
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Job
+from pipeline import new_matching_jobs
+from scheduler import PollScheduler
+
+MINUTE = 60.0
+HOUR = 3600.0
+
+
+class FakeClock:
+    """Simulated time: sleep() advances the clock instantly."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.slept = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.now += seconds
+            self.slept += seconds
+
+
+class SimulatedBoard:
+    """
+    Companies post at fixed average rates (postings/hour); a poll returns how
+    many were posted since that company's previous poll.
+    """
+
+    def __init__(self, clock, rates, seed=5):
+        self.clock = clock
+        self.rates = rates
+        self.rng = random.Random(seed)
+        self.last = {key: clock.time() for key in rates}
+        self.polls = []  # (time, key)
+
+    def poll(self, key):
+        now = self.clock.time()
+        hours = (now - self.last[key]) / HOUR
+        self.last[key] = now
+        self.polls.append((now, key))
+        expected = self.rates[key] * hours
+        # Poisson-ish draw: integer part plus a Bernoulli for the remainder
+        return int(expected) + (self.rng.random() < expected - int(expected))
+
+
+def test_initial_polls_are_staggered():
+    clock = FakeClock()
+    sched = PollScheduler(["a", "b", "c", "d"], initial_interval=HOUR, clock=clock)
+    starts = []
+    for _ in range(4):
+        key = sched.pop()
+        starts.append((clock.time(), key))
+        sched.report(key, 0)
+    assert starts == [(0, "a"), (900, "b"), (1800, "c"), (2700, "d")]
+
+
+def test_intervals_adapt_to_posting_rate():
+    clock = FakeClock()
+    rates = {"hot": 3.0, "warm": 0.2, "dormant": 0.0}
+    board = SimulatedBoard(clock, rates)
+    sched = PollScheduler(
+        rates,
+        initial_interval=HOUR,
+        min_interval=15 * MINUTE,
+        max_interval=24 * HOUR,
+        clock=clock,
+    )
+
+    sched.run(board.poll, until=7 * 24 * HOUR)
+
+    polls = {key: sched.targets[key].polls for key in rates}
+    assert polls["hot"] > 5 * polls["warm"] > 5 * polls["dormant"] > 0, polls
+    assert sched.targets["hot"].interval == pytest.approx(20 * MINUTE, rel=0.5)
+    assert sched.targets["dormant"].interval == 24 * HOUR
+    # Polling tracks supply: ~1 new posting per poll of an active company
+    hot = sched.targets["hot"]
+    assert 0.5 < hot.found / hot.polls < 2
+
+
+def test_spacing_spreads_simultaneous_work():
+    clock = FakeClock()
+    keys = [f"c{i}" for i in range(10)]
+    sched = PollScheduler(keys, initial_interval=0, spacing=MINUTE, clock=clock)
+    starts = []
+    sched.run(lambda key: starts.append(clock.time()) or 0, until=10 * MINUTE)
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 10 and min(gaps) >= MINUTE
+
+
+def test_sync_adds_and_drops_targets():
+    clock = FakeClock()
+    sched = PollScheduler(["a", "b"], initial_interval=HOUR, clock=clock)
+    sched.sync(["b", "c"])
+    sched.sync(["a", "b", "c"])  # re-adding "a" must not schedule it twice
+
+    polled = []
+    sched.run(lambda key: polled.append(key) or 0, until=HOUR)
+    assert sorted(polled) == ["a", "b", "c"]
+    assert len(sched) == 3
+
+
+def test_failed_poll_counts_as_empty():
+    clock = FakeClock()
+    errors = []
+
+    def poll(key):
+        raise RuntimeError("blocked")
+
+    sched = PollScheduler(["a"], initial_interval=HOUR, clock=clock)
+    sched.run(poll, until=2 * HOUR, on_error=lambda key, e: errors.append(str(e)))
+    assert errors == ["blocked", "blocked"]
+    assert sched.targets["a"].interval > HOUR
+    with pytest.raises(RuntimeError):
+        sched.run(poll, until=10 * HOUR)
+
+
+class StopDaemon(Exception):
+    pass
+
+
+def test_daemon_polls_companies_and_broad_search(capsys):
+    pytest.importorskip("pandas")
+    import main
+
+    class LimitedClock(FakeClock):
+        def sleep(self, seconds):
+            super().sleep(seconds)
+            if self.now > 26 * HOUR:
+                raise StopDaemon
+
+    clock = LimitedClock()
+
+    class FakeAlerter:
+        app = {"daemon": {"top_companies": 2, "leaderboard_refresh_hours": 24}}
+
+        def __init__(self):
+            self.polled = []
+            self.advanced = 0
+            self.leaderboards = 0
+            self.trims = []
+
+        def leaderboard(self):
+            self.leaderboards += 1
+            return [], ["Google", "Meta", "Apple"]
+
+        def search_companies(self, companies, new_counts):
+            self.polled.append(companies[0])
+            new_counts[companies[0]] = 1 if companies[0] == "Google" else 0
+            return iter([(companies[0], [], [])])
+
+        def search_broad(self, new_counts):
+            self.polled.append("broad")
+            return iter([])
+
+        def advance_watermarks(self):
+            self.advanced += 1
+
+        def finish_run(self):
+            pass
+
+        def trim_dedupe_index(self, max_age_days):
+            self.trims.append(max_age_days)
+
+    alerter = FakeAlerter()
+    sched = PollScheduler(initial_interval=HOUR, clock=clock)
+    with pytest.raises(StopDaemon):
+        main.run_daemon(alerter, sched)
+
+    assert set(alerter.polled) == {"Google", "Meta", "broad"}
+    assert alerter.polled.count("Google") > 2 * alerter.polled.count("Meta")
+    assert alerter.advanced == len(alerter.polled)
+    assert alerter.trims == [30.0] * len(alerter.polled)
+    assert alerter.leaderboards == 2
+
+
+def test_daemon_trim_keeps_postings_that_are_still_listed(tmp_path, monkeypatch):
+    import main
+
+    shutil.copytree(Path(__file__).parent.parent / "config", tmp_path / "config")
+    monkeypatch.chdir(tmp_path)
+    app = main.load_yaml("config/app.yaml")
+    app["archive"]["enabled"] = False
+    rules = main.load_yaml("config/rules.yaml")
+    day = 24 * HOUR
+    now = 100 * day
+
+    def posting(n):
+        return Job("Software Engineer", "Google", "Austin, TX",
+                   f"https://example.com/{n}", "indeed")  # fmt: skip
+
+    alerter = main.Alerter(app, rules)
+    try:
+        alerter.store.add([posting(1), posting(2)], now=now - 40 * day)
+        alerter.trim_dedupe_index(None, now)  # no cutoff: everything
+        # Posting 1 is scraped again; posting 2 is gone from the board
+        out = list(
+            new_matching_jobs(
+                [("Google", [posting(1)], [])],
+                alerter.compiled_rules,
+                alerter.store,
+                index=alerter.dedupe_index,
+            )
+        )
+        assert out[0][1] == []
+
+        assert alerter.trim_dedupe_index(30, now)
+        assert alerter.dedupe_index.check(posting(1)) == "url"
+        assert alerter.dedupe_index.check(posting(2)) is None
+        # The cutoff only moves once a day
+        assert not alerter.trim_dedupe_index(30, now + HOUR)
+        assert alerter.trim_dedupe_index(30, now + day)
+    finally:
+        alerter.close()
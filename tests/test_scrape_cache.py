@@ -0,0 +1,97 @@
+"""
+Tests for the on-disk scrape result cache.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from providers.scrape_cache import ScrapeCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_key_covers_every_query_parameter():
+    base = ("indeed", "python Google", "Austin, TX", 50, 168, 100)
+    keys = {cache_key(*base)}
+    for i, changed in enumerate(["linkedin", "java Google", "Remote", 25, 24, 50]):
+        params = list(base)
+        params[i] = changed
+        keys.add(cache_key(*params))
+    assert len(keys) == 7
+    assert cache_key(*base) == cache_key(*base)
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    clock = FakeClock()
+    cache = ScrapeCache(str(tmp_path / "c.db"), ttl_seconds=60, clock=clock)
+    cache.put("k", {"rows": [1, 2]})
+
+    clock.now += 59
+    assert cache.get("k") == {"rows": [1, 2]}
+    clock.now += 2
+    assert cache.get("k") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    clock = FakeClock()
+    payload = "x" * 1000
+    cache = ScrapeCache(
+        str(tmp_path / "c.db"), ttl_seconds=3600, max_bytes=3500, clock=clock
+    )
+    for key in ("a", "b", "c"):
+        clock.now += 1
+        cache.put(key, payload)
+
+    clock.now += 1
+    assert cache.get("a") == payload  # "b" is now least recently used
+    clock.now += 1
+    cache.put("d", payload)
+
+    assert cache.get("b") is None
+    assert all(cache.get(k) == payload for k in ("a", "c", "d"))
+
+
+def test_refresh_skips_lookups_but_repopulates(tmp_path):
+    path = str(tmp_path / "c.db")
+    ScrapeCache(path).put("k", "old")
+
+    forced = ScrapeCache(path, refresh=True)
+    assert forced.get("k") is None
+    forced.put("k", "new")
+    assert ScrapeCache(path).get("k") == "new"
+
+
+def test_scrape_query_uses_cache(tmp_path, monkeypatch):
+    pd = pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    calls = []
+
+    def fake_scrape_jobs(**kwargs):
+        calls.append(kwargs["search_term"])
+        return pd.DataFrame(
+            {"title": ["Software Engineer"], "job_url": ["https://example.com/1"]}
+        )
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake_scrape_jobs)
+    cache = ScrapeCache(str(tmp_path / "c.db"))
+
+    kwargs = dict(location="Austin, TX", hours_old=24, cache=cache)
+    first = jobspy_search.scrape_query("indeed", "python", **kwargs)
+    second = jobspy_search.scrape_query("indeed", "python", **kwargs)
+    jobspy_search.scrape_query("indeed", "java", **kwargs)
+
+    assert first == second
+    assert calls == ["python", "java"]
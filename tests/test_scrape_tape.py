@@ -0,0 +1,131 @@
+"""
+Tests for recording scrape results to Arrow files and replaying them offline.
+"""
+
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from providers import jobspy_search  # noqa: E402
+from providers.jobspy_search import _df_to_jobs  # noqa: E402
+from providers.scrape_tape import ScrapeTape  # noqa: E402
+
+CONFIG = Path(__file__).parent.parent / "config"
+
+
+def frame(n=4, start=0):
+    return pd.DataFrame(
+        {
+            "title": ["Backend Engineer"] * n,
+            "company": ["Google"] * n,
+            "location": ["Austin, TX"] * n,
+            "job_url": [f"https://e.com/{start + i}" for i in range(n)],
+            "date_posted": [datetime.date(2025, 10, 1)] * (n - 1) + [None],
+            "salary_min": [120000.0] + [float("nan")] * (n - 1),
+            "is_remote": [True, None] * (n // 2),
+            "description": ["python and aws on the platform team"] * n,
+        }
+    )
+
+
+def test_frames_round_trip(tmp_path):
+    df = frame()
+    df["mixed"] = [1, "a", None, 2.5]  # no Arrow type; stored as text
+    tape = ScrapeTape(str(tmp_path), mode="record")
+    tape.save("indeed", "python Google", "Austin, TX", 50, 100, df)
+    tape.save("indeed", "nothing", "Austin, TX", 50, 100, None)
+
+    replay = ScrapeTape(str(tmp_path), mode="replay")
+    assert len(replay) == 2
+    out = replay.load("indeed", "python Google", "Austin, TX", 50, 100)
+    assert _df_to_jobs(out, "indeed") == _df_to_jobs(df, "indeed")
+    assert out["mixed"].tolist()[:2] == ["1", "a"]
+    assert replay.load("indeed", "nothing", "Austin, TX", 50, 100).empty
+    with pytest.raises(LookupError):
+        replay.load("indeed", "python Google", "Remote", 50, 100)
+
+
+def test_replay_needs_a_recording(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ScrapeTape(str(tmp_path / "missing"), mode="replay")
+
+
+def test_search_replays_without_scraping(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        jobspy_search, "scrape_jobs", lambda **kw: frame(start=len(kw["search_term"]))
+    )
+    tape = ScrapeTape(str(tmp_path), mode="record")
+    recorded = list(
+        jobspy_search.search_terms(
+            "indeed", ["python", "golang"], location="TX", hours_old=168, tape=tape
+        )
+    )
+
+    def offline(**kwargs):
+        raise AssertionError("replay must not scrape")
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", offline)
+    tape = ScrapeTape(str(tmp_path), mode="replay")
+    # A narrower hours_old (as an incremental window would give) still replays
+    replayed = list(
+        jobspy_search.search_terms(
+            "indeed", ["python", "golang"], location="TX", hours_old=24, tape=tape
+        )
+    )
+    assert replayed == recorded
+    assert tape.replayed == 2
+
+
+def test_run_once_replays_a_recorded_run(monkeypatch, tmp_path, capsys):
+    import main
+    from providers import levels_html
+
+    (tmp_path / "config").mkdir()
+    app = yaml.safe_load((CONFIG / "app.yaml").read_text())
+    app["runtime"]["per_domain_sleep"] = 0
+    app["metrics"]["report_path"] = ""
+    (tmp_path / "config" / "app.yaml").write_text(yaml.safe_dump(app))
+    for name in ("rules.yaml", "blacklist.txt"):
+        (tmp_path / "config" / name).write_text((CONFIG / name).read_text())
+    monkeypatch.chdir(tmp_path)
+
+    rows = [
+        {"rank": 1, "company": "Google", "title": "SWE", "comp_total": "$200K"},
+        {"rank": 2, "company": "Amazon", "title": "SDE", "comp_total": "$180K"},
+    ]
+    monkeypatch.setattr(
+        levels_html, "fetch_leaderboards", lambda *a, **kw: (rows, ["Google", "Amazon"])
+    )
+    scraped = []
+
+    def fake_scrape_jobs(**kwargs):
+        scraped.append(kwargs["search_term"])
+        return frame(start=10 * len(scraped))
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake_scrape_jobs)
+
+    def new_job_lines():
+        out = capsys.readouterr().out
+        return [line for line in out.splitlines() if "new matching" in line]
+
+    main.main(["--record", "tape"])
+    recorded = new_job_lines()
+    assert scraped and recorded
+
+    def offline(*args, **kwargs):
+        raise AssertionError("replay must not touch the network")
+
+    monkeypatch.setattr(levels_html, "fetch_leaderboards", offline)
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", offline)
+    for _ in range(2):  # every replay sees the same run
+        main.main(["--replay", "tape"])
+        assert new_job_lines() == recorded
@@ -0,0 +1,87 @@
+"""
+Tests for per-query watermarks and the incremental hours_old window.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from providers.scrape_window import ScrapeWindow, window_key
+from store import JobStore
+
+HOUR = 3600.0
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_window_narrows_from_watermark():
+    clock = FakeClock()
+    marks = {"recent": clock.now - HOUR, "day": clock.now - 20 * HOUR, "old": 0.0}
+    window = ScrapeWindow(marks, max_hours=168, overlap_hours=2, clock=clock)
+
+    assert window.hours_old("recent") == 4  # 1h + 2h overlap, rounded up the ladder
+    assert window.hours_old("day") == 24
+    assert window.hours_old("old") == 168
+    assert window.hours_old("new query") == 168  # no watermark: full backfill
+    assert (window.narrowed, window.full) == (2, 2)
+
+
+def test_backfill_ignores_watermarks():
+    clock = FakeClock()
+    window = ScrapeWindow({"q": clock.now - HOUR}, backfill=True, clock=clock)
+    assert window.hours_old("q") == 168
+
+
+def test_only_succeeded_queries_advance():
+    clock = FakeClock()
+    window = ScrapeWindow({}, clock=clock)
+    window.hours_old("a")
+    clock.now += 10
+    window.hours_old("b")
+    window.succeeded("b")
+    assert window.completed() == {"b": clock.now}
+
+
+def test_scrape_query_uses_and_records_watermarks(tmp_path, monkeypatch):
+    pd = pytest.importorskip("pandas")
+    from providers import jobspy_search
+
+    requested = []
+
+    def fake_scrape_jobs(**kwargs):
+        requested.append((kwargs["search_term"], kwargs["hours_old"]))
+        if kwargs["search_term"] == "java":
+            raise RuntimeError("blocked")
+        return pd.DataFrame({"title": ["Engineer"], "job_url": ["https://x/1"]})
+
+    monkeypatch.setattr(jobspy_search, "scrape_jobs", fake_scrape_jobs)
+    clock = FakeClock()
+    store = JobStore(str(tmp_path / "jobs.db"))
+
+    def run(term):
+        window = ScrapeWindow(store.watermarks(), max_hours=168, clock=clock)
+        try:
+            jobspy_search.scrape_query("indeed", term, location="TX", window=window)
+        except RuntimeError:
+            pass
+        store.set_watermarks(window.completed())
+
+    run("python")
+    run("java")
+    clock.now += HOUR / 2
+    run("python")
+    run("java")
+
+    assert requested == [("python", 168), ("java", 168), ("python", 4), ("java", 168)]
+    assert set(store.watermarks()) == {window_key("indeed", "python", "TX", 50)}
+    store.close()
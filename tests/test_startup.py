@@ -0,0 +1,119 @@
+"""
+Tests for the fast-start commands: importing main and running the commands
+that never scrape must not load pandas, jobspy or numpy.
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Job
+from store import JobStore
+
+SRC = Path(__file__).parent.parent / "src"
+CONFIG = Path(__file__).parent.parent / "config"
+
+HEAVY = ("pandas", "numpy", "jobspy")
+
+# Run main with argv, then print which heavy modules ended up imported
+SCRIPT = """
+import sys
+import main
+main.main(sys.argv[1:])
+print("loaded:", sorted(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def run_main(cwd: Path, *argv: str) -> str:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    out = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(heavy=HEAVY), *argv],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return out.stdout
+
+
+def make_config(tmp_path: Path) -> Path:
+    """A copy of config/ whose store lives in tmp_path."""
+    (tmp_path / "config").mkdir()
+    app = yaml.safe_load((CONFIG / "app.yaml").read_text())
+    app["runtime"]["db_path"] = str(tmp_path / "jobs.db")
+    (tmp_path / "config" / "app.yaml").write_text(yaml.safe_dump(app))
+    for name in ("rules.yaml", "blacklist.txt"):
+        (tmp_path / "config" / name).write_text((CONFIG / name).read_text())
+    return tmp_path / "jobs.db"
+
+
+def test_import_main_skips_heavy_modules():
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, main; print([m for m in {HEAVY!r} if m in sys.modules])",
+        ],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_dry_run_plans_queries_without_scraping(tmp_path):
+    make_config(tmp_path)
+    out = run_main(tmp_path, "dry-run")
+    assert "[dry-run] indeed:" in out
+    assert "hours_old=" in out
+    assert "loaded: []" in out
+    assert not (tmp_path / "jobs.db").exists()  # the store is only ever read
+
+
+def test_dry_run_opens_an_existing_store_read_only(tmp_path):
+    db_path = make_config(tmp_path)
+    # A store from before fingerprints: opening it for writing adds the column
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY, url TEXT)")
+    conn.commit()
+    conn.close()
+
+    out = run_main(tmp_path, "dry-run")
+    assert "[dry-run] indeed:" in out
+    conn = sqlite3.connect(db_path)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+    conn.close()
+    assert tables == {"jobs"} and columns == {"id", "url"}
+
+
+def test_filter_reapplies_rules_to_stored_jobs(tmp_path):
+    db_path = make_config(tmp_path)
+    rules = yaml.safe_load((CONFIG / "rules.yaml").read_text())
+    title = rules["role_titles"]["include_any"][0]
+    text = " ".join(rules["job_descriptions"]["include_any"])
+    old = Job(
+        title, "Acme", "Austin, TX", "https://e.com/old", "indeed", description=text
+    )
+    new = Job(
+        title, "Acme", "Austin, TX", "https://e.com/new", "indeed", description=text
+    )
+    with JobStore(str(db_path)) as store:
+        store.add([old], now=time.time() - 10 * 86400)
+        store.add([new])
+
+    out = run_main(tmp_path, "filter", "--days", "1")
+    assert "[filter] 1 of 1 stored jobs" in out
+    assert "https://e.com/new" in out
+    assert "https://e.com/old" not in out
+    assert "loaded: []" in out
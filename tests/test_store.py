@@ -0,0 +1,76 @@
+"""
+Tests for the SQLite job store and "new since last run" detection.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Job, SalaryRange
+from store import JobStore
+
+
+def make_job(i, **kw):
+    fields = dict(
+        title=f"Software Engineer {i}",
+        company="Google",
+        location="Austin, TX",
+        url=f"https://example.com/job/{i}",
+        source="indeed",
+    )
+    fields.update(kw)
+    return Job(**fields)
+
+
+def test_unseen_returns_only_new_urls_in_order(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.add([make_job(i) for i in range(5)])
+
+    batch = [make_job(i) for i in (7, 2, 6, 4, 7)]
+    new = store.unseen(batch)
+    assert [j.url for j in new] == [
+        "https://example.com/job/7",
+        "https://example.com/job/6",
+        "https://example.com/job/7",
+    ]
+    store.close()
+
+
+def test_add_upserts_and_persists(tmp_path):
+    path = str(tmp_path / "data" / "jobs.db")
+    with JobStore(path) as store:
+        store.add([make_job(1), make_job(1), make_job(2)], now=100.0)
+        store.add([make_job(2), make_job(3)], now=200.0)
+        assert len(store) == 3
+
+    with JobStore(path) as store:
+        assert store.unseen([make_job(1), make_job(4)]) == [make_job(4)]
+        first_seen, last_seen = store._conn.execute(
+            "SELECT first_seen, last_seen FROM jobs WHERE url = ?",
+            ("https://example.com/job/2",),
+        ).fetchone()
+        assert (first_seen, last_seen) == (100.0, 200.0)
+
+
+def test_jobs_round_trip_and_urlless_jobs_are_ignored(tmp_path):
+    job = make_job(
+        1,
+        salary=SalaryRange(min=120000, max=180000),
+        description="Backend Python role",
+        listed_at="2025-10-01",
+        req_id="https://example.com/job/1",
+    )
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        store.add([job, make_job(2, url="")])
+        assert list(store.iter_jobs()) == [job]
+        assert store.unseen([make_job(3, url="")]) == []
+
+
+def test_large_history(tmp_path):
+    """A batch is checked against a big history with one indexed join."""
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        store.add(make_job(i) for i in range(50_000))
+        batch = [make_job(i) for i in range(49_900, 50_100)]
+        assert len(store.unseen(batch)) == 100